@@ -0,0 +1,290 @@
+"""
+Sendika Kesinti Listesi Düzenleyici - HTTP Servisi
+Arayüz açmadan dosya gönderip temiz listeyi geri almak için hafif HTTP servisi.
+İstekler asyncio ile karşılanır, yükleme gövdesi parça parça geçici dosyaya
+yazılır ve okuma/temizleme işleri süreç havuzunda (worker pool) çalıştırılır.
+
+Uç noktalar:
+    GET  /health
+        Servis durumu.
+    POST /detect?filename=liste.xlsx
+        Gövde: dosya. Başlangıç satırı, sütun sayısı, bulunan başlıklar, önerilen eşleştirme ve
+        önizleme döner.
+    POST /convert?filename=liste.xlsx&format=csv[&skip_rows=3][&mapping={"member_no":0,...}]
+        Gövde: dosya. Temiz liste (csv, ndjson, parquet) döner; istatistikler
+        X-Cevirici-Stats başlığında JSON olarak gelir. Sunucu --rules ile
+        başlatıldıysa kural bazındaki ihlal sayıları da istatistiklerde yer alır.
+
+Kullanım:
+    python api_server.py --port 8502 --workers 4
+    python api_server.py --rules kurallar.json
+    curl --data-binary @liste.xlsx "http://127.0.0.1:8502/convert?filename=liste.xlsx&format=csv" -o temiz.csv
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import urlsplit, parse_qs
+
+from utils.pipeline import (
+    OUTPUT_FORMATS, OUTPUT_MIME_TYPES, open_source, read_source, suggest_mapping, convert, encode_output
+)
+from utils.stream_export import write_chunks
+from utils.validation_rules import DEFAULT_RULES_PATH, load_rules, compile_rules
+
+
+# Ağdan okuma/yazma parça boyutu (byte)
+IO_CHUNK_BYTES = 1024 * 1024
+
+# Başlık satırlarının okunması için süre sınırı (saniye)
+HEADER_TIMEOUT = 30
+
+# Önizlemede döndürülecek satır sayısı
+PREVIEW_ROWS = 5
+
+
+class HttpError(Exception):
+    """İstemciye durum kodu ve mesajla döndürülecek hata."""
+    
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================================================
+# WORKER FONKSİYONLARI (süreç havuzunda çalışır)
+# ============================================================================
+
+def _detect_job(path, file_name, skip_rows):
+    """Dosyanın yapısını tespit eder ve eşleştirme önerir."""
+    df_raw, skip_rows, column_labels = read_source(open_source(path, file_name), skip_rows)
+    preview = df_raw.head(PREVIEW_ROWS).fillna('').astype(str).values.tolist()
+    return {
+        'file_name': file_name,
+        'skip_rows': skip_rows,
+        'rows': len(df_raw),
+        'columns': len(df_raw.columns),
+        'header_labels': column_labels,
+        'suggested_mapping': suggest_mapping(df_raw, column_labels),
+        'preview': preview,
+    }
+
+
+def _convert_job(path, file_name, mapping, skip_rows, output_format, out_path, rules=None):
+    """Dosyayı temizler, kuralları uygular ve sonucu out_path'e akışlı yazar."""
+    # Derlenmiş kurallar süreçler arasında taşınamaz: tanımlar worker'da derlenir
+    compiled_rules = compile_rules(rules) if rules else None
+    df_clean, stats, used_mapping = convert(open_source(path, file_name), mapping, skip_rows, compiled_rules)
+    stats.pop('sample_skipped', None)
+    stats.pop('rule_report', None)
+    stats['errors'] = stats.pop('error_log').counts()
+    stats['mapping'] = used_mapping
+    stats['bytes'] = write_chunks(encode_output(df_clean, output_format), out_path)
+    return stats
+
+
+# ============================================================================
+# HTTP SUNUCUSU
+# ============================================================================
+
+class ApiServer:
+    """
+    Dönüştürme isteklerini karşılayan asyncio sunucusu.
+    
+    Args:
+        workers (int): Süreç havuzundaki worker sayısı
+        max_upload_bytes (int): Kabul edilen en büyük gövde boyutu
+        tmp_dir (str): Yükleme ve çıktı dosyaları için geçici dizin (None ise sistem varsayılanı)
+        rules (list): Her dönüşümde uygulanacak doğrulama kuralı tanımları (load_rules çıktısı)
+    """
+    
+    def __init__(self, workers=None, max_upload_bytes=200 * 1024 * 1024, tmp_dir=None, rules=None):
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.max_upload_bytes = max_upload_bytes
+        self.tmp_dir = tmp_dir
+        self.rules = rules
+    
+    async def handle(self, reader, writer):
+        """Tek bir bağlantıyı karşılar (bağlantı başına bir istek)."""
+        work_dir = tempfile.mkdtemp(prefix='cevirici_api_', dir=self.tmp_dir)
+        try:
+            try:
+                method, target, headers = await asyncio.wait_for(self._read_head(reader), HEADER_TIMEOUT)
+                await self._route(method, target, headers, reader, writer, work_dir)
+            except HttpError as e:
+                await self._send_json(writer, e.status, {'error': str(e)})
+            except asyncio.TimeoutError:
+                await self._send_json(writer, HTTPStatus.REQUEST_TIMEOUT, {'error': "İstek zaman aşımına uğradı"})
+            except ValueError as e:
+                await self._send_json(writer, HTTPStatus.BAD_REQUEST, {'error': str(e)})
+            except Exception as e:
+                await self._send_json(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"İşlem hatası: {e}"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # İstemci bağlantıyı erken kapattı
+            pass
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def _read_head(self, reader):
+        """İstek satırını ve başlıkları okur."""
+        request_line = (await reader.readline()).decode('latin-1').strip()
+        parts = request_line.split()
+        if len(parts) != 3:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Geçersiz istek satırı")
+        
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        
+        return parts[0].upper(), parts[1], headers
+    
+    async def _route(self, method, target, headers, reader, writer, work_dir):
+        url = urlsplit(target)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        
+        if url.path == '/health':
+            await self._send_json(writer, HTTPStatus.OK, {'status': 'ok', 'formats': OUTPUT_FORMATS})
+            return
+        
+        if url.path not in ('/detect', '/convert'):
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Bilinmeyen adres: {url.path}")
+        if method != 'POST':
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Bu adres yalnızca POST kabul eder")
+        
+        file_name = os.path.basename(params.get('filename', ''))
+        if not file_name:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "filename parametresi gerekli (örn: liste.xlsx)")
+        skip_rows = int(params['skip_rows']) if params.get('skip_rows') else None
+        
+        upload_path = os.path.join(work_dir, 'upload')
+        await self._receive_body(reader, headers, upload_path)
+        loop = asyncio.get_running_loop()
+        
+        if url.path == '/detect':
+            result = await loop.run_in_executor(self.executor, _detect_job, upload_path, file_name, skip_rows)
+            await self._send_json(writer, HTTPStatus.OK, result)
+            return
+        
+        output_format = params.get('format', 'csv')
+        if output_format not in OUTPUT_FORMATS:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Desteklenmeyen çıktı formatı: {output_format}")
+        mapping = json.loads(params['mapping']) if params.get('mapping') else None
+        
+        out_path = os.path.join(work_dir, f'output.{output_format}')
+        stats = await loop.run_in_executor(
+            self.executor, _convert_job, upload_path, file_name, mapping, skip_rows, output_format, out_path,
+            self.rules
+        )
+        await self._send_file(writer, out_path, OUTPUT_MIME_TYPES[output_format], {
+            'X-Cevirici-Stats': json.dumps(stats, default=str),
+            'Content-Disposition': f'attachment; filename="temiz_liste.{output_format}"',
+        })
+    
+    async def _receive_body(self, reader, headers, path):
+        """Yükleme gövdesini belleğe almadan parça parça diske yazar."""
+        if 'content-length' not in headers:
+            raise HttpError(HTTPStatus.LENGTH_REQUIRED, "Content-Length başlığı gerekli")
+        remaining = int(headers['content-length'])
+        if remaining > self.max_upload_bytes:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                            f"Dosya çok büyük (en fazla {self.max_upload_bytes // (1024 * 1024)} MB)")
+        if remaining == 0:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "İstek gövdesi boş")
+        
+        with open(path, 'wb') as f:
+            while remaining > 0:
+                block = await reader.readexactly(min(remaining, IO_CHUNK_BYTES))
+                f.write(block)
+                remaining -= len(block)
+    
+    async def _send_head(self, writer, status, content_type, length, extra_headers=None):
+        lines = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {length}",
+            "Connection: close",
+        ]
+        lines += [f"{name}: {value}" for name, value in (extra_headers or {}).items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+    
+    async def _send_json(self, writer, status, payload):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        await self._send_head(writer, status, 'application/json; charset=utf-8', len(body))
+        writer.write(body)
+        await writer.drain()
+    
+    async def _send_file(self, writer, path, content_type, extra_headers):
+        await self._send_head(writer, HTTPStatus.OK, content_type, os.path.getsize(path), extra_headers)
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(IO_CHUNK_BYTES)
+                if not block:
+                    break
+                writer.write(block)
+                await writer.drain()
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Sendika kesinti listesi dönüştürme HTTP servisi.")
+    parser.add_argument('--host', default='127.0.0.1', help="Dinlenecek adres")
+    parser.add_argument('--port', type=int, default=8502, help="Dinlenecek port")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Süreç havuzundaki worker sayısı")
+    parser.add_argument('--max-upload-mb', type=int, default=200, help="Kabul edilen en büyük dosya (MB)")
+    parser.add_argument('--tmp-dir', help="Geçici dosyalar için dizin")
+    parser.add_argument('--rules', default=DEFAULT_RULES_PATH,
+                        help="Doğrulama kuralları (JSON/YAML; varsayılan CEVIRICI_RULES_PATH)")
+    return parser.parse_args(argv)
+
+
+async def serve(args, rules=None):
+    server = ApiServer(args.workers, args.max_upload_mb * 1024 * 1024, args.tmp_dir, rules)
+    listener = await asyncio.start_server(server.handle, args.host, args.port)
+    print(f"🚀 Dinleniyor: http://{args.host}:{args.port} ({args.workers} worker)", flush=True)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.shutdown()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    # Kural dosyası başlangıçta bir kez okunup doğrulanır
+    rules = None
+    if args.rules:
+        try:
+            rules = load_rules(args.rules)
+            compile_rules(rules)
+        except (ValueError, OSError) as e:
+            print(f"❌ Kural dosyası: {e}", file=sys.stderr)
+            return 2
+    
+    try:
+        asyncio.run(serve(args, rules))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,17 +4,35 @@ Modern, modüler ve kullanıcı dostu veri temizleme uygulaması
 """
 
 import streamlit as st
-import pandas as pd
 import io
 
 # Component ve utility import
 from components.column_mapper import render_column_mapper, validate_mapping
-from utils.data_processor import (
-    read_file_with_encoding,
-    apply_column_mapping,
-    detect_file_structure,
-    find_data_start_row
-)
+from components.member_store_panel import get_member_index, get_store_connection, render_member_store_panel
+from components.job_progress import get_job_manager, wait_for_job
+from components.error_report import render_error_report
+from components.rule_report import render_rule_report
+from components.table_pager import render_paged_table, session_memo
+from components.profile_panel import render_profile_panel
+from components.summary_panel import render_summary_panel
+from components.cache_panel import render_cache_panel
+from utils.multi_ingest import PREVIEW_ROWS
+from utils.job_queue import JOB_DONE, JOB_FAILED
+from utils.export_formats import to_parquet_bytes, to_arrow_ipc_bytes, read_clean_parquet
+from utils.stream_export import ExportDir, iter_csv_chunks, iter_ndjson_chunks, spool_chunks
+from utils.validation_rules import DEFAULT_RULES_PATH, load_rules, compile_rules, apply_rules
+from utils.money import format_lira, lira_to_kurus, to_export_frame
+from utils.member_store import count_members
+from utils.name_matching import MATCH_SCORE_COLUMN
+from utils.page_rows import PAGE_ROW_LABELS
+from utils.profiling import profiling_enabled
+from utils.shared_cache import cache_admin_enabled, shared_clean, shared_ingest
+from utils.summary import build_summary, summarize, write_summary_sheet
+from utils.table_view import build_search_index, filter_positions
+from utils.lazy_imports import lazy_import
+
+# pandas ilk sayfa (dosya yükleme) için gerekmez; ilk kullanımda yüklenir
+pd = lazy_import('pandas')
 
 # -----------------------------------------------------------------------------
 # SAYFA AYARLARI VE STİL
@@ -117,6 +135,43 @@ if 'clean_df' not in st.session_state:
 if 'skip_rows' not in st.session_state:
     st.session_state.skip_rows = 0
 
+if 'raw_sources' not in st.session_state:
+    st.session_state.raw_sources = None
+
+# Yüklemenin içerik özeti (sütun bazlı temizleme önbelleğinin anahtarı)
+if 'raw_key' not in st.session_state:
+    st.session_state.raw_key = None
+
+# Dosyanın başlık satırında bulunan sütun adları (eşleştirme ekranında gösterilir)
+if 'raw_labels' not in st.session_state:
+    st.session_state.raw_labels = None
+
+# Paylaşılan önbellekteki ham ve temiz tablonun kiraları (oturum silinince bırakılır)
+if 'raw_lease' not in st.session_state:
+    st.session_state.raw_lease = None
+
+if 'clean_lease' not in st.session_state:
+    st.session_state.clean_lease = None
+
+if 'imported_clean' not in st.session_state:
+    st.session_state.imported_clean = False
+
+# Arka plan iş kimlikleri (okuma ve temizleme)
+if 'ingest_job' not in st.session_state:
+    st.session_state.ingest_job = None
+
+if 'clean_job' not in st.session_state:
+    st.session_state.clean_job = None
+
+# Kademeli okuma: eşleştirme önizlemeyle başlarken dosyanın tamamını okuyan iş
+if 'remainder_job' not in st.session_state:
+    st.session_state.remainder_job = None
+
+# CSV / NDJSON dışa aktarma dosyaları için oturuma özel geçici dizin
+# (oturum sıfırlanınca veya kapanınca silinir)
+if 'export_dir' not in st.session_state:
+    st.session_state.export_dir = ExportDir()
+
 # -----------------------------------------------------------------------------
 # SIDEBAR: İLERLEME TAKİBİ
 # -----------------------------------------------------------------------------
@@ -140,14 +195,32 @@ with st.sidebar:
     
     # Reset butonu
     if st.button("🔄 Yeni İşlem Başlat", use_container_width=True):
+        # Devam eden arka plan işlerini iptal et
+        for job_key in ('ingest_job', 'remainder_job', 'clean_job'):
+            if st.session_state.get(job_key):
+                get_job_manager().cancel(st.session_state[job_key])
         for key in list(st.session_state.keys()):
             del st.session_state[key]
         st.rerun()
     
+    st.markdown("---")
+    st.markdown("**🛡️ Doğrulama Kuralları**")
+    st.file_uploader(
+        "Kural dosyası (JSON/YAML)",
+        type=["json", "yaml", "yml"],
+        key="rules_file",
+        help="İşlenen liste bu kurallara göre denetlenir; ihlaller sonuç adımında raporlanır. "
+             "Dosya yüklenmezse CEVIRICI_RULES_PATH ortam değişkenindeki dosya kullanılır."
+    )
+    
     st.markdown("---")
     st.markdown("**💡 İpucu:**")
     st.caption("Akıllı öneri sistemini kullanarak sütunları otomatik eşleştirebilirsiniz.")
 
+# Yönetim görünümü (CEVIRICI_ADMIN=1): oturumlar arası paylaşılan önbelleğin durumu
+if cache_admin_enabled():
+    render_cache_panel()
+
 # -----------------------------------------------------------------------------
 # ADIM 1: DOSYA YÜKLEME (Özellikler kutusu ile yan yana)
 # -----------------------------------------------------------------------------
@@ -156,11 +229,20 @@ col_upload, col_info = st.columns([1, 1], vertical_alignment="bottom")
 with col_upload:
     st.markdown('<span class="step-badge">Adım 1</span>', unsafe_allow_html=True)
     st.markdown("### 📁 Dosya Yükleme")
-    uploaded_file = st.file_uploader(
+    uploaded_files = st.file_uploader(
         "CSV, Excel veya TXT dosyanızı seçin",
-        type=["csv", "xlsx", "txt", "xls"],
-        help="Desteklenen formatlar: .csv, .xlsx, .xls, .txt"
+        type=["csv", "xlsx", "txt", "xls", "parquet", "zip", "gz"],
+        accept_multiple_files=True,
+        help="Desteklenen formatlar: .csv, .xlsx, .xls, .txt (parçalı listeler için birden fazla dosya seçebilirsiniz). "
+             ".zip ve .gz arşivlerindeki listeler açılıp ayrı kaynaklar olarak okunur. "
+             "Daha önce dışa aktarılmış .parquet listeler doğrudan sonuç adımına yüklenir."
+    )
+    read_all_sheets = st.checkbox(
+        "📑 Excel'deki tüm sayfaları birleştir",
+        value=False,
+        help="Bölümlere göre sayfalara ayrılmış listelerde tüm sayfalar okunur ve tek listede birleştirilir"
     )
+    uploaded_file = uploaded_files[0] if uploaded_files else None
 
 with col_info:
     st.markdown("""
@@ -168,44 +250,95 @@ with col_info:
     <strong>✨ Özellikler:</strong><br>
     • Sütun eşleştirme ile esnek veri işleme<br>
     • Otomatik Türkçe karakter düzeltme<br>
-    • Excel/CSV/TXT format desteği<br>
+    • Excel/CSV/TXT format desteği (.zip/.gz arşivleri dahil)<br>
     • Akıllı sütun algılama ve öneri sistemi
 </div>
 """, unsafe_allow_html=True)
 
 if uploaded_file is not None:
     
-    # İlk yükleme ise
-    if st.session_state.raw_df is None:
+    # Daha önce dışa aktarılmış temiz liste: okuma ve temizleme adımları atlanır
+    if uploaded_file.name.endswith('.parquet') and st.session_state.clean_df is None:
+        try:
+            imported_df = read_clean_parquet(uploaded_file)
+            st.session_state.clean_df = imported_df
+            st.session_state.imported_clean = True
+            st.session_state.processing_stats = {
+                'total_rows': len(imported_df),
+                'processed_rows': len(imported_df),
+                'skipped_rows': 0,
+                'invalid_tc': 0,
+                'invalid_amount': 0,
+                'empty_rows': 0,
+                'amount_shifted': 0,
+                'sample_skipped': []
+            }
+            summarize(imported_df, st.session_state.processing_stats)
+            st.session_state.step = 4
+            st.success(f"✅ Temiz liste yüklendi! ({len(imported_df)} kayıt)")
+        except Exception as e:
+            st.error(f"❌ Hata: {e}")
+            st.stop()
+    
+    # İlk yükleme ise: okuma arka plan işinde yapılır, betik thread'i bloklanmaz
+    if st.session_state.raw_df is None and not st.session_state.imported_clean:
         
-        with st.spinner("📂 Dosya okunuyor ve analiz ediliyor..."):
-            try:
-                # Önce veri başlangıç satırını otomatik tespit et
-                uploaded_file.seek(0)
-                auto_skip = find_data_start_row(uploaded_file)
-                st.session_state.skip_rows = auto_skip
-                
-                # Dosyayı oku
-                uploaded_file.seek(0)
-                st.session_state.raw_df = read_file_with_encoding(uploaded_file, skip_rows=auto_skip)
-                st.session_state.step = 2
-                
-                # Önceki işlemleri sıfırla
-                st.session_state.clean_df = None
-                
-                if auto_skip > 0:
-                    st.success(f"✅ Dosya yüklendi! (İlk {auto_skip} satır atlandı, {len(st.session_state.raw_df)} veri satırı, {len(st.session_state.raw_df.columns)} sütun)")
-                else:
-                    st.success(f"✅ Dosya yüklendi! ({len(st.session_state.raw_df)} satır, {len(st.session_state.raw_df.columns)} sütun)")
-                    
-            except Exception as e:
-                st.error(f"❌ Hata: {e}")
-                st.stop()
+        if st.session_state.ingest_job is None:
+            st.session_state.ingest_job = get_job_manager().submit(
+                'ingest', shared_ingest, uploaded_files, read_all_sheets=read_all_sheets,
+                preview_rows=PREVIEW_ROWS
+            )
+        
+        job = wait_for_job(st.session_state.ingest_job, "📂 Dosya okunuyor ve analiz ediliyor...")
+        
+        if job is None or job.status != JOB_DONE:
+            if job is not None and job.status == JOB_FAILED:
+                st.error(f"❌ Hata: {job.error}")
+            else:
+                st.warning("⚠️ Dosya okuma iptal edildi.")
+            if st.button("🔁 Tekrar Dene"):
+                st.session_state.ingest_job = None
+                st.rerun()
+            st.stop()
+        
+        result = get_job_manager().pop_result(job.id)
+        st.session_state.ingest_job = None
+        st.session_state.raw_df = result['raw_df']
+        st.session_state.raw_sources = result['raw_sources']
+        st.session_state.raw_key = result['raw_key']
+        st.session_state.raw_labels = result['header_labels']
+        st.session_state.raw_lease = result['lease']
+        st.session_state.skip_rows = result['skip_rows']
+        st.session_state.step = 2
+        
+        # Büyük dosyada yalnızca önizleme okundu: kalanı arka planda okunurken eşleştirme başlar
+        if not result['complete']:
+            st.session_state.remainder_job = get_job_manager().submit(
+                'ingest', shared_ingest, uploaded_files, read_all_sheets=read_all_sheets
+            )
+        
+        # Önceki işlemleri sıfırla
+        st.session_state.clean_df = None
+        st.session_state.clean_lease = None
+        
+        raw_df = st.session_state.raw_df
+        if result['raw_sources']:
+            st.success(f"✅ {len(result['raw_sources'])} kaynak birleştirildi! ({len(raw_df)} satır, {len(raw_df.columns)} sütun)")
+            for label, info in result['source_info'].items():
+                if 'error' in info:
+                    st.warning(f"⚠️ {label} okunamadı: {info['error']}")
+        elif not result['complete']:
+            st.success(f"✅ Dosya açıldı! (İlk {len(raw_df):,} veri satırı, {len(raw_df.columns)} sütun; "
+                       f"dosyanın kalanı arka planda okunuyor)")
+        elif result['skip_rows'] > 0:
+            st.success(f"✅ Dosya yüklendi! (İlk {result['skip_rows']} satır atlandı, {len(raw_df)} veri satırı, {len(raw_df.columns)} sütun)")
+        else:
+            st.success(f"✅ Dosya yüklendi! ({len(raw_df)} satır, {len(raw_df.columns)} sütun)")
     
     # -----------------------------------------------------------------------------
     # ADIM 2: SÜTUN EŞLEŞTİRME
     # -----------------------------------------------------------------------------
-    if st.session_state.step >= 2:
+    if st.session_state.step >= 2 and not st.session_state.imported_clean:
         st.markdown("---")
         st.markdown('<span class="step-badge">Adım 2</span>', unsafe_allow_html=True)
         
@@ -218,10 +351,44 @@ if uploaded_file is not None:
             "Aidat Tutarı": "amount"
         }
         
+        # Dosyanın tamamı okunduysa önizlemenin yerine tam veri geçer
+        if st.session_state.remainder_job is not None:
+            remainder = get_job_manager().get(st.session_state.remainder_job)
+            if remainder is not None and remainder.status == JOB_DONE:
+                result = get_job_manager().pop_result(remainder.id)
+                preview_columns = len(st.session_state.raw_df.columns)
+                st.session_state.remainder_job = None
+                st.session_state.raw_df = result['raw_df']
+                st.session_state.raw_key = result['raw_key']
+                st.session_state.raw_labels = result['header_labels']
+                st.session_state.raw_lease = result['lease']
+                st.session_state.skip_rows = result['skip_rows']
+                
+                # Önizlemede boş görünen bir sütun dosyanın devamında doluysa sütun numaraları kayar
+                if len(result['raw_df'].columns) != preview_columns:
+                    st.session_state.column_mapping = None
+                    st.session_state.step = 2
+                    st.warning(f"⚠️ Dosyanın tamamında {len(result['raw_df'].columns)} sütun bulundu "
+                               f"(önizlemede {preview_columns}). Lütfen eşleştirmeyi kontrol edin.")
+            elif remainder is None or not remainder.is_active:
+                st.error(f"❌ Dosyanın tamamı okunamadı: {remainder.error if remainder is not None and remainder.error else 'iş iptal edildi'}")
+                if st.button("🔁 Tekrar Dene", key="retry_remainder"):
+                    st.session_state.remainder_job = None
+                    st.session_state.raw_df = None
+                    st.session_state.raw_lease = None
+                    st.session_state.step = 1
+                    st.rerun()
+                st.stop()
+            else:
+                st.info(f"⏳ Dosyanın tamamı arka planda okunuyor ({remainder.progress:.0%}). "
+                        f"Eşleştirmeye ilk {len(st.session_state.raw_df):,} satırla başlayabilirsiniz; "
+                        f"işleme kalan kısım okunduktan sonra başlar.")
+        
         # Sütun eşleştirme componentini render et
         mapping = render_column_mapper(
             st.session_state.raw_df,
-            required_columns
+            required_columns,
+            column_labels=st.session_state.raw_labels
         )
         
         # Eşleştirme geçerli mi kontrol et
@@ -248,54 +415,149 @@ if uploaded_file is not None:
                 else:
                     st.warning(f"⚠️ Lütfen tüm alanları eşleştirin. Eksik: {', '.join([k for k, v in required_columns.items() if v in missing_fields])}")
             else:
+                # Üye deposu doluysa TC'si eksik/geçersiz satırlar isimle kurtarılabilir
+                if count_members(get_store_connection()) > 0:
+                    st.checkbox(
+                        "🔎 TC'si eksik/geçersiz satırları üye deposundaki isimlerle eşleştir",
+                        key="match_names",
+                        help="Ad, soyad ve üye no ile depodaki üyeler aranır; yeterince benzer ve tek "
+                             "bir kişiye uyan satırlar depodaki TC ile listeye alınır (Eşleşme Skoru sütunu)"
+                    )
                 if st.button("✨ Veriyi İşle ve Temizle", use_container_width=True, type="primary"):
                     st.session_state.column_mapping = mapping
+                    st.session_state.clean_job = None
                     st.session_state.step = 3
                     st.rerun()
     
     # -----------------------------------------------------------------------------
     # ADIM 3: VERİ İŞLEME
     # -----------------------------------------------------------------------------
-    if st.session_state.step >= 3 and st.session_state.column_mapping:
+    if st.session_state.step >= 3 and (st.session_state.column_mapping or st.session_state.imported_clean):
         st.markdown("---")
         st.markdown('<span class="step-badge">Adım 3</span>', unsafe_allow_html=True)
         st.markdown("### ⚙️ Veri İşleme")
         
         if st.session_state.clean_df is None:
-            with st.spinner("🔄 Veriler işleniyor ve temizleniyor..."):
+            # İşleme yalnızca dosyanın henüz okunmamış kısmını bekler (tam veri Adım 2'de devralınır)
+            if st.session_state.remainder_job is not None:
+                wait_for_job(st.session_state.remainder_job, "📂 Dosyanın kalanı okunuyor...")
+                st.rerun()
+            
+            # Temizleme arka plan işinde çalışır; sayfa iş durumunu sorgular
+            if st.session_state.clean_job is None:
+                reference = None
+                if st.session_state.get('match_names'):
+                    with st.spinner("🔎 Üye deposu eşleştirme için hazırlanıyor..."):
+                        reference = get_member_index()
+                st.session_state.clean_job = get_job_manager().submit(
+                    'clean',
+                    shared_clean,
+                    st.session_state.raw_df,
+                    st.session_state.column_mapping,
+                    sources=st.session_state.raw_sources,
+                    cache_key=st.session_state.raw_key,
+                    reference=reference
+                )
+            
+            job = wait_for_job(st.session_state.clean_job, "🔄 Veriler işleniyor ve temizleniyor...")
+            
+            if job is None or job.status != JOB_DONE:
+                if job is not None and job.status == JOB_FAILED:
+                    st.error(f"❌ İşleme hatası: {job.error}")
+                    st.code(job.traceback)
+                else:
+                    st.warning("⚠️ İşleme iptal edildi.")
+                if st.button("⬅️ Sütun Eşleştirmesine Dön", key="back_after_clean_job"):
+                    st.session_state.clean_job = None
+                    st.session_state.step = 2
+                    st.rerun()
+                st.stop()
+            
+            st.session_state.clean_df, processing_stats, st.session_state.clean_lease = (
+                get_job_manager().pop_result(job.id)
+            )
+            st.session_state.clean_job = None
+            
+            # Doğrulama kuralları: temizlenmiş listeye tek geçişte uygulanır
+            rules_source = st.session_state.get('rules_file') or DEFAULT_RULES_PATH
+            if rules_source:
                 try:
-                    st.session_state.clean_df, processing_stats = apply_column_mapping(
-                        st.session_state.raw_df,
-                        st.session_state.column_mapping
-                    )
-                    st.session_state.processing_stats = processing_stats
-                    st.session_state.step = 4
-                except Exception as e:
-                    st.error(f"❌ İşleme hatası: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
-                    st.stop()
+                    apply_rules(st.session_state.clean_df, processing_stats, compile_rules(load_rules(rules_source)))
+                except (ValueError, OSError) as e:
+                    processing_stats['rule_error'] = str(e)
+            
+            # Özet analizler temiz listeyle birlikte bir kez hesaplanır; panel ve dışa aktarma bunu okur
+            summarize(st.session_state.clean_df, processing_stats)
+            
+            st.session_state.processing_stats = processing_stats
+            st.session_state.step = 4
         
         # Sonuç gösterimi
         if st.session_state.clean_df is not None and not st.session_state.clean_df.empty:
             
-            # İstatistikler
+            # İstatistikler: temiz listeyle saklanan özetten okunur (yeniden yüklemelerde sütun taranmaz)
+            summary = st.session_state.processing_stats.get('summary')
+            if summary is None:
+                summary = summarize(st.session_state.clean_df, st.session_state.processing_stats)
+            
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric("📊 Toplam Kayıt", len(st.session_state.clean_df))
+                st.metric("📊 Toplam Kayıt", summary['records'])
             
             with col2:
-                total_amount = st.session_state.clean_df['Aidat Tutarı'].sum()
-                st.metric("💰 Toplam Tutar", f"{total_amount:,.2f} ₺")
+                # Tutarlar kuruş cinsinden tam sayı; toplam ve ortalama yuvarlama hatasız
+                st.metric("💰 Toplam Tutar", format_lira(summary['amount_total']))
             
             with col3:
-                avg_amount = st.session_state.clean_df['Aidat Tutarı'].mean()
-                st.metric("📈 Ortalama Tutar", f"{avg_amount:,.2f} ₺")
+                st.metric("📈 Ortalama Tutar", format_lira(summary['amount_mean']))
             
             with col4:
-                unique_members = st.session_state.clean_df['TC Kimlik No'].nunique()
-                st.metric("👥 Benzersiz Üye", unique_members)
+                st.metric("👥 Benzersiz Üye", summary['unique_members'])
+            
+            # Tutar bantları, üye no aralıkları, kaynaklar ve aykırı tutarlar
+            render_summary_panel(summary)
+            
+            # Kaynak bazında istatistikler (çoklu dosya/sayfa)
+            per_source = st.session_state.processing_stats.get('per_source')
+            if per_source:
+                with st.expander(f"📑 Kaynak Bazında Sonuçlar ({len(per_source)} kaynak)"):
+                    source_stats_df = pd.DataFrame.from_dict(per_source, orient='index')
+                    if 'amount_total' in source_stats_df.columns:
+                        source_stats_df['amount_total'] = source_stats_df['amount_total'].map(format_lira)
+                    source_stats_df = source_stats_df.rename(columns={
+                        'total_rows': 'Toplam Satır',
+                        'processed_rows': 'İşlenen',
+                        'invalid_tc': 'Geçersiz TC',
+                        'invalid_amount': 'Geçersiz Tutar',
+                        'empty_rows': 'Boş Satır',
+                        'skipped_rows': 'Hatalı',
+                        'amount_shifted': 'Tutar Kaydırılan',
+                        'page_rows': 'Sayfa Başlık/Altlık',
+                        'recovered_rows': 'İsimle Eşleşen',
+                        'amount_total': 'Toplam Tutar'
+                    })
+                    st.dataframe(source_stats_df, use_container_width=True)
+            
+            # Basılı rapor sayfalarından ayıklanan başlık/altlık/toplam satırları
+            page_rows_by_type = st.session_state.processing_stats.get('page_rows_by_type')
+            if page_rows_by_type:
+                st.caption("🧾 Ayıklanan sayfa satırları: " + ", ".join(
+                    f"{PAGE_ROW_LABELS.get(kind, kind)}: {count:,}" for kind, count in page_rows_by_type.items()
+                ))
+            
+            # İsimle eşleştirilip üye deposundaki TC ile listeye alınan satırlar
+            recovered_rows = st.session_state.processing_stats.get('recovered_rows')
+            if recovered_rows:
+                st.caption(f"🔎 TC'si eksik/geçersiz {recovered_rows:,} satır üye deposundaki isimlerle eşleştirildi "
+                           f"(skorlar '{MATCH_SCORE_COLUMN}' sütununda)")
+            
+            # Elenen satırlar: konum, neden ve ham değerler
+            error_log = st.session_state.processing_stats.get('error_log')
+            render_error_report(error_log)
+            
+            # Doğrulama kuralı ihlalleri (kural dosyası verildiyse)
+            render_rule_report(st.session_state.processing_stats)
             
             st.markdown("---")
             
@@ -311,24 +573,26 @@ if uploaded_file is not None:
             with col2:
                 min_amount = st.number_input("💵 Minimum tutar filtresi", min_value=0.0, value=0.0)
             
-            # Filtreleme uygula
-            filtered_df = st.session_state.clean_df.copy()
-            
-            if search_term:
-                mask = (
-                    filtered_df['Adı'].str.contains(search_term, case=False, na=False) |
-                    filtered_df['Soyadı'].str.contains(search_term, case=False, na=False)
+            # Filtreleme sunucu tarafında satır konumları üzerinden yapılır (tablo kopyalanmaz);
+            # arama dizini temiz liste değişmedikçe yeniden hesaplanmaz
+            clean_df = st.session_state.clean_df
+            positions = None
+            if search_term or min_amount > 0:
+                search_index = session_memo('clean_search_index', clean_df, lambda: build_search_index(clean_df))
+                positions = filter_positions(
+                    clean_df,
+                    search_term=search_term,
+                    min_amount=lira_to_kurus(min_amount) if min_amount > 0 else None,
+                    search_index=search_index
                 )
-                filtered_df = filtered_df[mask]
+            filtered_df = clean_df if positions is None else clean_df.iloc[positions]
             
-            if min_amount > 0:
-                filtered_df = filtered_df[filtered_df['Aidat Tutarı'] >= min_amount]
+            # Tarayıcıya yalnızca görünen sayfa gönderilir (TL cinsinden gösterim)
+            render_paged_table(clean_df, key='clean_table', positions=positions, format_page=to_export_frame)
             
-            st.dataframe(
-                filtered_df,
-                use_container_width=True,
-                height=400
-            )
+            # Dışa aktarma dosyaları temiz liste ve filtre değişmedikçe yeniden üretilmez
+            # (sayfa, sıralama ve arama etkileşimlerindeki her yeniden çalıştırmada)
+            export_params = (search_term, min_amount)
             
             # -----------------------------------------------------------------------------
             # ADIM 4: İNDİRME
@@ -337,72 +601,157 @@ if uploaded_file is not None:
             st.markdown('<span class="step-badge">Adım 4</span>', unsafe_allow_html=True)
             st.markdown("### 📥 İndirme")
             
+            include_summary = st.checkbox(
+                "📊 Excel'e özet sayfası ekle",
+                key="excel_summary",
+                help="Temel metrikler, tutar bantları, üye no aralıkları, kaynaklar ve aykırı tutarlar 'Özet' sayfasına yazılır"
+            )
+            
             col1, col2, col3 = st.columns([1, 1, 1])
             
-            # Excel indirme
+            # Excel indirme (TL cinsinden; hata ve kural sayfaları işleme istatistiklerine bağlıdır)
             with col1:
-                buffer = io.BytesIO()
-                with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-                    filtered_df.to_excel(writer, index=False, sheet_name='Temiz Liste')
-                    
-                    workbook = writer.book
-                    worksheet = writer.sheets['Temiz Liste']
+                def build_excel():
+                    export_df = to_export_frame(filtered_df)
+                    buffer = io.BytesIO()
+                    with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
+                        export_df.to_excel(writer, index=False, sheet_name='Temiz Liste')
+                        
+                        workbook = writer.book
+                        worksheet = writer.sheets['Temiz Liste']
+                        
+                        # Başlık formatı
+                        header_format = workbook.add_format({
+                            'bold': True,
+                            'text_wrap': True,
+                            'valign': 'top',
+                            'fg_color': '#4F46E5',
+                            'font_color': '#FFFFFF',
+                            'border': 1
+                        })
+                        
+                        # Başlıkları formatla
+                        for col_num, value in enumerate(export_df.columns.values):
+                            worksheet.write(0, col_num, value, header_format)
+                        
+                        # Sütun genişlikleri
+                        worksheet.set_column('A:A', 15)  # Üye No
+                        worksheet.set_column('B:B', 20)  # Adı
+                        worksheet.set_column('C:C', 20)  # Soyadı
+                        worksheet.set_column('D:D', 15)  # TC
+                        worksheet.set_column('E:E', 15)  # Tutar
+                        worksheet.set_column('F:F', 30)  # Kaynak (çoklu dosya/sayfa)
+                        
+                        # Elenen satırlar ayrı sayfada
+                        if error_log is not None and len(error_log) > 0:
+                            error_log.to_frame().to_excel(writer, index=False, sheet_name='Hatalar')
+                        
+                        # Kural ihlalleri ayrı sayfada
+                        rule_report = st.session_state.processing_stats.get('rule_report')
+                        if rule_report is not None and not rule_report.empty:
+                            rule_report.to_excel(writer, index=False, sheet_name='Kural İhlalleri')
+                        
+                        # Özet sayfası: filtre yoksa saklanan özet, varsa filtrelenmiş listenin özeti
+                        if include_summary:
+                            sheet_summary = summary if positions is None else build_summary(filtered_df)
+                            write_summary_sheet(writer, sheet_summary)
                     
-                    # Başlık formatı
-                    header_format = workbook.add_format({
-                        'bold': True,
-                        'text_wrap': True,
-                        'valign': 'top',
-                        'fg_color': '#4F46E5',
-                        'font_color': '#FFFFFF',
-                        'border': 1
-                    })
-                    
-                    # Başlıkları formatla
-                    for col_num, value in enumerate(filtered_df.columns.values):
-                        worksheet.write(0, col_num, value, header_format)
-                    
-                    # Sütun genişlikleri
-                    worksheet.set_column('A:A', 15)  # Üye No
-                    worksheet.set_column('B:B', 20)  # Adı
-                    worksheet.set_column('C:C', 20)  # Soyadı
-                    worksheet.set_column('D:D', 15)  # TC
-                    worksheet.set_column('E:E', 15)  # Tutar
+                    return buffer.getvalue()
                 
                 st.download_button(
                     label="📊 Excel İndir",
-                    data=buffer.getvalue(),
+                    data=session_memo('export_excel', st.session_state.processing_stats, build_excel,
+                                      params=(export_params, include_summary)),
                     file_name=f"SendikaListesi_Temiz_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
                     mime="application/vnd.ms-excel",
                     use_container_width=True,
                     type="primary"
                 )
             
-            # CSV indirme
+            # CSV indirme (liste ve filtre değişince parça parça geçici dosyaya bir kez yazılır;
+            # indirme butonu dosyayı belleğe okur)
             with col2:
-                csv_data = filtered_df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="📄 CSV İndir",
-                    data=csv_data,
-                    file_name=f"SendikaListesi_Temiz_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
-                    use_container_width=True
+                csv_path = session_memo(
+                    'export_csv', clean_df,
+                    lambda: spool_chunks(iter_csv_chunks(filtered_df), st.session_state.export_dir.path, 'liste.csv'),
+                    params=export_params
                 )
+                with open(csv_path, 'rb') as csv_file:
+                    st.download_button(
+                        label="📄 CSV İndir",
+                        data=csv_file,
+                        file_name=f"SendikaListesi_Temiz_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                        mime="text/csv",
+                        use_container_width=True
+                    )
             
             # JSON indirme
             with col3:
-                json_data = filtered_df.to_json(orient='records', force_ascii=False, indent=2)
                 st.download_button(
                     label="📋 JSON İndir",
-                    data=json_data,
+                    data=session_memo(
+                        'export_json', clean_df,
+                        lambda: to_export_frame(filtered_df).to_json(orient='records', force_ascii=False, indent=2),
+                        params=export_params
+                    ),
                     file_name=f"SendikaListesi_Temiz_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json",
                     mime="application/json",
                     use_container_width=True
                 )
             
+            col4, col5, col6 = st.columns(3)
+            
+            # Parquet indirme (tipli sütunlar, zstd sıkıştırma)
+            with col4:
+                st.download_button(
+                    label="🧱 Parquet İndir",
+                    data=session_memo('export_parquet', clean_df, lambda: to_parquet_bytes(filtered_df),
+                                      params=export_params),
+                    file_name=f"SendikaListesi_Temiz_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.parquet",
+                    mime="application/vnd.apache.parquet",
+                    use_container_width=True,
+                    help="Hızlı ve sıkıştırılmış format; tekrar yüklenerek doğrudan bu adıma dönülebilir"
+                )
+            
+            # Arrow IPC indirme
+            with col5:
+                st.download_button(
+                    label="🏹 Arrow IPC İndir",
+                    data=session_memo('export_arrow', clean_df, lambda: to_arrow_ipc_bytes(filtered_df),
+                                      params=export_params),
+                    file_name=f"SendikaListesi_Temiz_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.arrow",
+                    mime="application/vnd.apache.arrow.file",
+                    use_container_width=True
+                )
+            
+            # NDJSON indirme (satır başına bir kayıt; CSV gibi bir kez diske yazılır)
+            with col6:
+                ndjson_path = session_memo(
+                    'export_ndjson', clean_df,
+                    lambda: spool_chunks(iter_ndjson_chunks(filtered_df), st.session_state.export_dir.path,
+                                         'liste.ndjson'),
+                    params=export_params
+                )
+                with open(ndjson_path, 'rb') as ndjson_file:
+                    st.download_button(
+                        label="🧾 NDJSON İndir",
+                        data=ndjson_file,
+                        file_name=f"SendikaListesi_Temiz_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.ndjson",
+                        mime="application/x-ndjson",
+                        use_container_width=True
+                    )
+            
+            # Üye deposuna kaydet / sorgula
+            render_member_store_panel(
+                st.session_state.clean_df,
+                source_name=", ".join(f.name for f in uploaded_files)
+            )
+            
         else:
             st.error("❌ İşlenebilir veri bulunamadı!")
             
+            render_error_report(st.session_state.processing_stats.get('error_log'), key='error_report_empty')
+            
             st.markdown("### 🔍 Olası Nedenler ve Çözümler:")
             
             st.markdown("""
@@ -425,18 +774,34 @@ if uploaded_file is not None:
                 if st.button("⬅️ Sütun Eşleştirmesine Dön", use_container_width=True, type="primary"):
                     st.session_state.step = 2
                     st.session_state.clean_df = None
+                    st.session_state.clean_lease = None
                     st.rerun()
             
             with col2:
                 if st.button("📁 Dosya Yüklemeye Dön", use_container_width=True):
                     st.session_state.step = 1
                     st.session_state.raw_df = None
+                    st.session_state.remainder_job = None
+                    st.session_state.raw_sources = None
+                    st.session_state.raw_key = None
+                    st.session_state.raw_labels = None
+                    st.session_state.raw_lease = None
+                    st.session_state.imported_clean = False
                     st.session_state.clean_df = None
+                    st.session_state.clean_lease = None
                     st.session_state.column_mapping = None
                     st.rerun()
+    
+    # Profil modu (CEVIRICI_PROFILE=1): eşleştirme onaylandıktan sonra kenar çubuğunda görünür
+    if profiling_enabled() and st.session_state.column_mapping:
+        with st.sidebar:
+            render_profile_panel(uploaded_files, st.session_state.column_mapping, read_all_sheets)
 
 else:
     st.info("👆 Başlamak için bir dosya yükleyin")
+    
+    # Depodaki kayıtlar dosya yüklemeden de sorgulanabilir
+    render_member_store_panel(None)
 
 # -----------------------------------------------------------------------------
 # FOOTER
@@ -0,0 +1,88 @@
+"""
+İsimle Üye Eşleştirme Ölçümü
+Sentetik bir referans üye listesi üzerinde dizin kurma ve TC'si bozulmuş
+satırların isimle eşleştirilme süresini, doğruluk ve bulma oranıyla ölçer.
+Soyadları az sayıda heceden üretilir; bloklar gerçek listelerden kalabalık
+olduğu için süreler kötü durumu gösterir.
+
+Kullanım:
+    python benchmarks/bench_name_matching.py
+    python benchmarks/bench_name_matching.py --reference-rows 500000 --queries 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.name_matching import MemberIndex  # noqa: E402
+
+
+FIRST_NAMES = ("Ahmet Mehmet Ayşe Fatma Mustafa Ali Hüseyin Hasan İbrahim Zeynep Emine Hatice Murat Ömer "
+               "Yusuf Elif Esra Büşra Kübra Şükrü Gülsüm Özlem İsmail Osman Halil Kemal Recep Ramazan Eda Deniz")
+SYLLABLES = ("yıl maz kay a dem ir çe lik şa hin öz türk ar slan do ğan kı lıç er ay dın yıldız koç kurt "
+             "öz de mir bay ram ak gül")
+
+
+def make_reference(rows, seed=0):
+    """Sentetik üye listesi: üç heceli soyadları, sıralı TC ve üye no."""
+    rng = np.random.default_rng(seed)
+    first = np.array(FIRST_NAMES.split(), dtype=object)
+    syllables = np.array(SYLLABLES.split(), dtype=object)
+    last = syllables[rng.integers(0, len(syllables), rows)]
+    for _ in range(2):
+        last = last + syllables[rng.integers(0, len(syllables), rows)]
+    return pd.DataFrame({
+        'tc_no': (10000000000 + np.arange(rows)).astype(str),
+        'member_no': np.arange(rows).astype(str),
+        'first_name': first[rng.integers(0, len(first), rows)],
+        'last_name': pd.Series(last, dtype=object).str.capitalize(),
+    })
+
+
+def make_queries(reference, count, seed=1):
+    """
+    Referanstan örneklenen bozuk satırlar: soyadı büyük harf ve aksansız yazılır;
+    ilk dörtte birinde soyadının son harfi eksik, ikinci dörtte birinde üye no boştur.
+    """
+    queries = reference.sample(count, random_state=seed).reset_index(drop=True)
+    queries['last_name'] = queries['last_name'].str.replace('ı', 'i').str.upper()
+    quarter = count // 4
+    queries.loc[:quarter - 1, 'last_name'] = queries['last_name'].iloc[:quarter].str[:-1]
+    queries.loc[quarter:2 * quarter - 1, 'member_no'] = ''
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="İsimle üye eşleştirme ölçümü")
+    parser.add_argument('--reference-rows', type=int, nargs='+', default=[100_000, 500_000])
+    parser.add_argument('--queries', type=int, default=2000)
+    args = parser.parse_args()
+    
+    print(f"{'referans':>10} {'dizin':>7} {'sorgu':>7} {'eşleşme':>8} {'sorgu/sn':>9} {'bulunan':>8} {'doğru':>7}")
+    for rows in args.reference_rows:
+        reference = make_reference(rows)
+        queries = make_queries(reference, min(args.queries, rows))
+        
+        start = time.perf_counter()
+        index = MemberIndex(reference)
+        build_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        matched_tc, _ = index.match(queries['first_name'], queries['last_name'], queries['member_no'])
+        match_time = time.perf_counter() - start
+        
+        # Üye no'suz ve aynı isimli birden çok üyesi olan satırlar belirsiz kalır (eşleştirilmez)
+        found = matched_tc != ''
+        correct = (matched_tc[found] == queries['tc_no'].to_numpy()[found]).mean() if found.any() else 0.0
+        print(f"{rows:>10,} {build_time:>6.2f}s {len(queries):>7,} {match_time:>7.2f}s "
+              f"{len(queries) / match_time:>9,.0f} {found.mean():>8.1%} {correct:>7.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Yeniden Eşleştirme Ölçümü
+Aynı ham veride eşleştirme değiştiğinde (örn: tutar sütunu başka sütunla
+değiştirildiğinde) apply_column_mapping'in süresini önbelleksiz ve sütun bazlı
+önbellekli çalışmada karşılaştırır ve sonuçların aynı olduğunu doğrular.
+
+Kullanım:
+    python benchmarks/bench_remap.py                  # 1M satırlık sentetik veri
+    python benchmarks/bench_remap.py --rows 200000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.column_cache import COLUMN_CACHE  # noqa: E402
+from utils.data_processor import apply_column_mapping  # noqa: E402
+
+
+def make_frame(rows, seed=0):
+    """İki farklı tutar sütunu olan sentetik ham veri üretir (4: aidat, 5: ek kesinti)."""
+    rng = np.random.default_rng(seed)
+    first = np.array(["Ahmet", "AYÞE", "Mehmet", "Fatma", "Ýbrahim", "Zeynep"], dtype=object)
+    last = np.array(["Yýlmaz", "Kaya", "Demir", "Çelik", "Þahin", "Öztürk"], dtype=object)
+    return pd.DataFrame({
+        0: np.arange(rows).astype(str).astype(object),
+        1: first[rng.integers(0, len(first), rows)],
+        2: last[rng.integers(0, len(last), rows)],
+        3: (10000000000 + rng.integers(0, 89999999999, rows)).astype(str).astype(object),
+        4: np.char.add(rng.integers(0, 5000, rows).astype(str), ",50").astype(object),
+        5: np.char.add(rng.integers(0, 900, rows).astype(str), ",25").astype(object),
+    })
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yeniden eşleştirme ölçümü")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+    
+    raw = make_frame(args.rows)
+    mapping = {'member_no': 0, 'first_name': 1, 'last_name': 2, 'tc_no': 3, 'amount': 4}
+    remapped = dict(mapping, amount=5)
+    print(f"Sentetik veri: {raw.shape[0]:,} satır x {raw.shape[1]} sütun")
+    
+    (expected, _), plain = timed(apply_column_mapping, raw, remapped)
+    print(f"{'önbelleksiz eşleştirme':<34} {plain:>7.2f} sn")
+    
+    COLUMN_CACHE.clear()
+    _, first = timed(apply_column_mapping, raw, mapping, cache_key='bench')
+    print(f"{'ilk eşleştirme (önbellek boş)':<34} {first:>7.2f} sn")
+    
+    (result, _), swap = timed(apply_column_mapping, raw, remapped, cache_key='bench')
+    print(f"{'tutar sütunu değişti':<34} {swap:>7.2f} sn")
+    
+    _, again = timed(apply_column_mapping, raw, mapping, cache_key='bench')
+    print(f"{'önceki eşleştirmeye dönüş':<34} {again:>7.2f} sn")
+    
+    print(f"Önbellek: {len(COLUMN_CACHE)} kayıt, ~{COLUMN_CACHE.size_bytes / 1024 / 1024:.0f} MB")
+    print("Sonuç aynı mı:", result.equals(expected))
+
+
+if __name__ == '__main__':
+    main()
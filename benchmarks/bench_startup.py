@@ -0,0 +1,142 @@
+"""
+Soğuk Başlatma (Import) Ölçümü
+Uygulama, komut satırı ve HTTP servisinin içe aktarma sürelerini temiz bir
+yorumlayıcıda `python -X importtime` ile ölçer; en ağır paketleri ve ilk
+açılışta yüklenen ağır kütüphaneleri raporlar. Sonuçlar zaman içinde
+izlenebilmesi için benchmarks/startup_history.jsonl dosyasına eklenir.
+
+Kullanım:
+    python benchmarks/bench_startup.py                 # ölç ve geçmişe ekle
+    python benchmarks/bench_startup.py --runs 10 --top 15
+    python benchmarks/bench_startup.py --no-record     # sadece ölç
+    python benchmarks/bench_startup.py --note "openpyxl gecikmeli yükleme"
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'startup_history.jsonl')
+
+# İlk açılışta yüklenmemesi beklenen ağır kütüphaneler
+HEAVY_MODULES = ['pandas', 'numpy', 'openpyxl', 'xlrd', 'xlsxwriter', 'pyarrow', 'streamlit']
+
+
+def app_import_code():
+    """app.py'nin üst seviye import satırlarını (arayüzü çalıştırmadan) çıkarır."""
+    with open(os.path.join(ROOT, 'app.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return '\n'.join(ast.unparse(node) for node in imports)
+
+
+TARGETS = {
+    'app': app_import_code,
+    'cli': lambda: 'import cli',
+    'api': lambda: 'import api_server',
+}
+
+
+def run_target(code):
+    """
+    Kodu yeni bir yorumlayıcıda importtime ile çalıştırır.
+    
+    Returns:
+        tuple: (float: süre ms, list: yüklenen ağır modüller, list: (paket, ms) üst seviye importlar)
+    """
+    probe = (
+        "import json, sys, time\n"
+        "_t = time.perf_counter()\n"
+        f"{code}\n"
+        "_elapsed = (time.perf_counter() - _t) * 1000\n"
+        f"print(json.dumps([_elapsed, [m for m in {HEAVY_MODULES!r} if m in sys.modules]]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', probe],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    elapsed, heavy = json.loads(result.stdout.strip().splitlines()[-1])
+    
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not name.startswith('  '):
+            top_level.append((name.strip(), int(cumulative) / 1000))
+    return elapsed, heavy, top_level
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def last_entry():
+    if not os.path.exists(HISTORY_PATH):
+        return None
+    with open(HISTORY_PATH, encoding='utf-8') as f:
+        lines = [line for line in f if line.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soğuk başlatma import ölçümü")
+    parser.add_argument('--runs', type=int, default=5, help="Hedef başına tekrar sayısı (medyan alınır)")
+    parser.add_argument('--top', type=int, default=10, help="Listelenecek en ağır paket sayısı")
+    parser.add_argument('--no-record', action='store_true', help="Sonucu geçmiş dosyasına ekleme")
+    parser.add_argument('--note', help="Geçmiş kaydına eklenecek kısa açıklama")
+    args = parser.parse_args()
+    
+    previous = last_entry()
+    entry = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'note': args.note,
+        'targets': {},
+    }
+    
+    for name, code_factory in TARGETS.items():
+        code = code_factory()
+        runs = [run_target(code) for _ in range(args.runs)]
+        times = [elapsed for elapsed, _, _ in runs]
+        _, heavy, top_level = runs[-1]
+        heaviest = sorted(top_level, key=lambda item: item[1], reverse=True)[:args.top]
+        
+        median_ms = statistics.median(times)
+        entry['targets'][name] = {
+            'median_ms': round(median_ms, 1),
+            'min_ms': round(min(times), 1),
+            'heavy_loaded': heavy,
+            'top': [[pkg, round(ms, 1)] for pkg, ms in heaviest],
+        }
+        
+        change = ''
+        if previous and name in previous.get('targets', {}):
+            before = previous['targets'][name]['median_ms']
+            change = f"  (önceki {before:.1f} ms, {median_ms - before:+.1f} ms)"
+        print(f"\n[{name}] medyan {median_ms:.1f} ms, en iyi {min(times):.1f} ms{change}")
+        print(f"  Yüklenen ağır kütüphaneler: {', '.join(heavy) or '-'}")
+        for pkg, ms in heaviest:
+            print(f"  {ms:9.1f} ms  {pkg}")
+    
+    if not args.no_record:
+        with open(HISTORY_PATH, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        print(f"\nGeçmişe eklendi: {os.path.relpath(HISTORY_PATH, ROOT)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Tablo Gösterim Yükü Ölçümü
+Temiz listenin tamamı st.dataframe'e verildiğinde ve sayfalı görünümde
+(yalnızca görünen sayfa) tarayıcıya gönderilen Arrow yükünü ve
+serileştirme süresini satır sayısına göre karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_table_payload.py
+    python benchmarks/bench_table_payload.py --rows 10000 100000 1000000 --page-size 100
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from streamlit.dataframe_util import convert_pandas_df_to_arrow_bytes
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.money import to_export_frame  # noqa: E402
+from utils.table_view import (  # noqa: E402
+    build_search_index, filter_positions, page_bounds, restrict_positions, sort_positions
+)
+
+
+def make_clean_frame(rows, seed=0):
+    """Temiz liste biçiminde sentetik veri üretir (tutar kuruş, int64)."""
+    rng = np.random.default_rng(seed)
+    first = np.array(["Ahmet", "Ayşe", "Mehmet", "Fatma", "İbrahim", "Zeynep"], dtype=object)
+    last = np.array(["Yılmaz", "Kaya", "Demir", "Çelik", "Şahin", "Öztürk"], dtype=object)
+    return pd.DataFrame({
+        "Üye No": np.arange(rows).astype(str).astype(object),
+        "Adı": first[rng.integers(0, len(first), rows)],
+        "Soyadı": last[rng.integers(0, len(last), rows)],
+        "TC Kimlik No": (10000000000 + rng.integers(0, 89999999999, rows)).astype(str).astype(object),
+        "Aidat Tutarı": rng.integers(100, 500000, rows).astype(np.int64),
+    })
+
+
+def payload(df):
+    """st.dataframe'in tarayıcıya gönderdiği Arrow yükü (byte) ve süresi (sn)."""
+    start = time.perf_counter()
+    size = len(convert_pandas_df_to_arrow_bytes(to_export_frame(df)))
+    return size, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tablo gösterim yükü ölçümü")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+    
+    print(f"{'satır':>10} {'tamamı (MB)':>12} {'süre':>7} {'sayfa (KB)':>11} {'süre':>7} {'filtre+sıra':>12}")
+    for rows in args.rows:
+        df = make_clean_frame(rows)
+        full_size, full_time = payload(df)
+        
+        # Sayfalı görünüm: filtre ve sıralama konumlar üzerinde, yalnızca son sayfa serileştirilir
+        start = time.perf_counter()
+        positions = filter_positions(df, search_term="kaya", search_index=build_search_index(df))
+        order = sort_positions(df, "Aidat Tutarı", ascending=False)
+        order = restrict_positions(order, positions, len(df))
+        first, stop, _, _ = page_bounds(len(order), 10 ** 9, args.page_size)
+        prepare_time = time.perf_counter() - start
+        page_size, page_time = payload(df.iloc[order[first:stop]])
+        
+        print(f"{rows:>10,} {full_size / 1024 / 1024:>12.1f} {full_time:>6.2f}s "
+              f"{page_size / 1024:>11.1f} {page_time:>6.3f}s {prepare_time:>11.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+Yükleme Okuma Bellek Ölçümü
+Bir dosyanın okunması sırasında sürecin tepe bellek (peak RSS) artışını ölçer ve
+oluşan ham tablonun bellekteki boyutuyla karşılaştırır. Her ölçüm ayrı bir süreçte
+yapılır; temel çizgi, modüller yüklendikten ve (bellekteki yükleme modunda) dosya
+baytları belleğe alındıktan sonraki RSS'tir.
+
+Modlar:
+    legacy  Önceki metin okuma yolu (tam bayt kopyası + tam metin + Python motoru)
+    upload  Bellekteki yükleme (Streamlit UploadedFile gibi) → read_file_with_encoding
+    disk    Diskteki dosya (komut satırı / HTTP servisi) → read_file_with_encoding
+
+Kullanım:
+    python benchmarks/bench_upload_memory.py                # ~100 MB sentetik CSV
+    python benchmarks/bench_upload_memory.py --mb 20
+    python benchmarks/bench_upload_memory.py --file liste.csv --skip-rows 2
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def make_csv(path, target_mb):
+    """Türkçe karakterli, cp1254 kodlu, noktalı virgül ayırıcılı sentetik liste yazar."""
+    target = target_mb * 1024 * 1024
+    written = 0
+    with open(path, 'w', encoding='cp1254', newline='\r\n') as f:
+        f.write("ÜYE LİSTESİ\n\n")
+        i = 0
+        while written < target:
+            lines = [
+                f"{n};Şükrü Çağlar;Öztürk Güneş;{10000000000 + n};{n % 5000},{n % 100:02d}\n"
+                for n in range(i, i + 10000)
+            ]
+            block = ''.join(lines)
+            f.write(block)
+            written += len(block)
+            i += 10000
+    return path
+
+
+def legacy_read_text(raw_bytes, skip_rows):
+    """Önceki metin okuma yolu (karşılaştırma için)."""
+    import pandas as pd
+    from io import StringIO
+    
+    for enc in ['cp1254', 'utf-8', 'iso-8859-9', 'latin-1']:
+        try:
+            string_data = raw_bytes.decode(enc)
+            if skip_rows > 0:
+                lines = string_data.split('\n')
+                string_data = '\n'.join(lines[skip_rows:])
+            first_line = string_data.split('\n')[0]
+            separator = ';' if ';' in first_line else ',' if ',' in first_line else '\t' if '\t' in first_line else ','
+            df = pd.read_csv(StringIO(string_data), sep=separator, header=None, dtype=str, engine='python')
+            df = df.dropna(how='all').reset_index(drop=True)
+            df = df.dropna(axis=1, how='all')
+            df.columns = range(len(df.columns))
+            return df
+        except Exception:
+            continue
+    raise ValueError("Dosya okunamadı")
+
+
+def peak_rss_mb():
+    # Linux'ta ru_maxrss KB cinsindendir
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(mode, path, skip_rows):
+    """Tek ölçüm (alt süreçte çalışır), sonucu JSON olarak yazdırır."""
+    import pandas as pd  # noqa: F401
+    from utils.data_processor import read_file_with_encoding
+    from utils.multi_ingest import NamedBytesIO
+    from utils.spooled_upload import SpooledUpload
+    
+    name = os.path.basename(path)
+    source = None
+    if mode in ('legacy', 'upload'):
+        with open(path, 'rb') as f:
+            source = NamedBytesIO(f.read(), name)
+    elif mode == 'disk':
+        source = SpooledUpload(path, name)
+    
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    if mode == 'legacy':
+        df = legacy_read_text(source.getvalue(), skip_rows)
+    else:
+        df = read_file_with_encoding(source, skip_rows=skip_rows)
+    elapsed = time.perf_counter() - start
+    
+    print(json.dumps({
+        'mode': mode,
+        'seconds': round(elapsed, 2),
+        'peak_increase_mb': round(peak_rss_mb() - baseline, 1),
+        'frame_mb': round(df.memory_usage(deep=True).sum() / 1024 / 1024, 1),
+        'rows': len(df),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yükleme okuma bellek ölçümü")
+    parser.add_argument('--file', help="Ölçülecek dosya (verilmezse sentetik CSV üretilir)")
+    parser.add_argument('--mb', type=int, default=100, help="Sentetik CSV boyutu (MB)")
+    parser.add_argument('--skip-rows', type=int, default=None, help="Atlanacak satır (sentetikte 2)")
+    parser.add_argument('--modes', default='legacy,upload,disk', help="Virgülle ayrılmış modlar")
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.measure:
+        measure(args.measure, args.file, args.skip_rows or 0)
+        return
+    
+    tmp_dir = None
+    path = args.file
+    skip_rows = args.skip_rows
+    if path is None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        path = make_csv(os.path.join(tmp_dir.name, 'sentetik.csv'), args.mb)
+        skip_rows = 2 if skip_rows is None else skip_rows
+    
+    size_mb = os.path.getsize(path) / 1024 / 1024
+    print(f"Dosya: {path} ({size_mb:.1f} MB)")
+    print(f"{'mod':<8} {'süre (s)':>9} {'tepe artış (MB)':>16} {'tablo (MB)':>11} {'satır':>10}")
+    
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    if not path.lower().endswith(('.csv', '.txt')):
+        modes = [m for m in modes if m != 'legacy']
+    
+    for mode in modes:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--measure', mode, '--file', path,
+             '--skip-rows', str(skip_rows or 0)],
+            capture_output=True, text=True, cwd=ROOT
+        )
+        if output.returncode != 0:
+            print(f"{mode:<8} HATA: {output.stderr.strip().splitlines()[-1] if output.stderr.strip() else output.returncode}")
+            continue
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        print(f"{mode:<8} {result['seconds']:>9} {result['peak_increase_mb']:>16} {result['frame_mb']:>11} {result['rows']:>10,}")
+    
+    if tmp_dir is not None:
+        tmp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+HTTP Servisi Yük Testi
+api_server.py'ye eşzamanlı istemcilerle aynı dosyayı gönderir ve gecikme
+dağılımını (p50/p90/p99) ile saniyedeki istek sayısını raporlar.
+
+Kullanım:
+    python benchmarks/load_test_api.py --spawn                      # sunucuyu kendisi başlatır, sentetik veri
+    python benchmarks/load_test_api.py --spawn --workers 4 --concurrency 16 --requests 200
+    python benchmarks/load_test_api.py --url http://127.0.0.1:8502 --file liste.xlsx --mapping eslestirme.json
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlencode
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sentetik veri için sabit eşleştirme (otomatik öneriden bağımsız ölçüm)
+SYNTHETIC_MAPPING = {"member_no": 0, "first_name": 1, "last_name": 2, "tc_no": 3, "amount": 4}
+
+
+def make_synthetic_csv(rows):
+    """Noktalı virgülle ayrılmış sentetik kesinti listesi üretir."""
+    lines = ["Üye No;Adı;Soyadı;TC Kimlik No;Aidat Tutarı"]
+    for i in range(rows):
+        lines.append(f"{i + 1};Ahmet;Yılmaz;{10000000000 + i};{150 + i % 50},50")
+    return ("\n".join(lines) + "\n").encode('utf-8')
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_until_ready(host, port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=2)
+            conn.request('GET', '/health')
+            if conn.getresponse().status == 200:
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def send_request(host, port, path, body):
+    """Tek bir isteği gönderir; (süre, durum kodu, yanıt boyutu) döndürür."""
+    start = time.perf_counter()
+    conn = http.client.HTTPConnection(host, port, timeout=600)
+    try:
+        conn.request('POST', path, body=body, headers={'Content-Type': 'application/octet-stream'})
+        response = conn.getresponse()
+        size = len(response.read())
+        return time.perf_counter() - start, response.status, size
+    finally:
+        conn.close()
+
+
+def percentile(sorted_values, p):
+    """En yakın sıra (nearest-rank) yöntemiyle yüzdelik."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(p / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP servisi yük testi")
+    parser.add_argument('--url', default='http://127.0.0.1:8502', help="Sunucu adresi")
+    parser.add_argument('--spawn', action='store_true', help="Sunucuyu boş bir portta kendisi başlatır")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="--spawn ile başlatılan sunucunun worker sayısı")
+    parser.add_argument('--file', help="Gönderilecek dosya (belirtilmezse sentetik CSV)")
+    parser.add_argument('--rows', type=int, default=5000, help="Sentetik CSV satır sayısı")
+    parser.add_argument('--mapping', help="Sütun eşleştirme JSON dosyası")
+    parser.add_argument('--format', default='csv', choices=['csv', 'ndjson', 'parquet'])
+    parser.add_argument('--endpoint', default='convert', choices=['convert', 'detect'])
+    parser.add_argument('--concurrency', type=int, default=8, help="Eşzamanlı istemci sayısı")
+    parser.add_argument('--requests', type=int, default=64, help="Toplam istek sayısı")
+    args = parser.parse_args()
+    
+    if args.file:
+        with open(args.file, 'rb') as f:
+            body = f.read()
+        file_name = os.path.basename(args.file)
+        mapping = None
+    else:
+        body = make_synthetic_csv(args.rows)
+        file_name = 'sentetik.csv'
+        mapping = SYNTHETIC_MAPPING
+    if args.mapping:
+        with open(args.mapping, encoding='utf-8') as f:
+            mapping = json.load(f)
+    
+    params = {'filename': file_name, 'format': args.format}
+    if mapping:
+        params['mapping'] = json.dumps(mapping)
+    path = f"/{args.endpoint}?{urlencode(params)}"
+    
+    server = None
+    if args.spawn:
+        host, port = '127.0.0.1', free_port()
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'api_server.py'), '--port', str(port), '--workers', str(args.workers)],
+            cwd=ROOT, stdout=subprocess.DEVNULL
+        )
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    
+    try:
+        if not wait_until_ready(host, port):
+            print("❌ Sunucuya ulaşılamadı", file=sys.stderr)
+            sys.exit(1)
+        
+        # Isınma: worker süreçlerinin ilk isteği ölçüme dahil edilmez
+        send_request(host, port, path, body)
+        
+        print(f"Dosya: {file_name} ({len(body) / 1024:,.0f} KB), /{args.endpoint}, "
+              f"{args.requests} istek, {args.concurrency} eşzamanlı istemci")
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            results = list(pool.map(lambda _: send_request(host, port, path, body), range(args.requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    
+    latencies = sorted(r[0] for r in results if r[1] == 200)
+    errors = [r for r in results if r[1] != 200]
+    
+    print(f"Başarılı          : {len(latencies)} / {len(results)}")
+    print(f"Toplam süre       : {elapsed:.2f} sn")
+    print(f"İstek/sn          : {len(results) / elapsed:.2f}")
+    for p in (50, 90, 99):
+        print(f"p{p:<16}: {percentile(latencies, p) * 1000:8.1f} ms")
+    print(f"En uzun           : {(latencies[-1] if latencies else 0) * 1000:8.1f} ms")
+    if errors:
+        print(f"Hatalı yanıtlar   : {sorted(set(r[1] for r in errors))}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
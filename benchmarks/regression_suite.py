@@ -0,0 +1,462 @@
+"""
+Altın Çıktı ve Performans Bütçesi Denetimi
+Temizleme fonksiyonlarında veya dönüştürme hattında yapılan değişikliklerin
+çıktıyı sessizce değiştirmediğini ve adım sürelerini/belleğini bütçenin
+üzerine çıkarmadığını denetler; bir denetim başarısızsa çıkış kodu 1 olur.
+
+Altın çıktı: data/golden/cases altındaki zorlu girdiler (bozuk karakterli
+adlar, 1.234,56 / 1,234.56 tutarlar, float biçimli TC'ler, kaymış tutarlar,
+birleşik hücreli XLSX/XLS, düzensiz satır uzunluklu XLSX, sayfa başlıkları)
+komut satırıyla aynı hattan geçirilir; temiz liste, hata raporu ve istatistikler
+data/golden/expected altındaki dosyalarla bayt bayt karşılaştırılır.
+data/golden/values.json tek tek fonksiyonların (clean_amount_value,
+clean_tc_number, split_full_name ...) girdi/çıktı çiftlerini tutar. Aynı
+girdiler bir satır eksik önizlemeyle de okunur; önizleme dosyanın tamamı
+sanılmamalıdır (aksi halde kalan satırlar hiç okunmaz).
+
+Bütçe: benchmarks/budgets.json'daki satır sayısında sentetik veriyle okuma,
+sola kaydırma, temizleme ve dışa aktarma adımları ayrı süreçlerde ölçülür
+(süre: en iyi tekrar, bellek: ilk çalışmadaki tepe RSS artışı).
+
+Kullanım:
+    python benchmarks/regression_suite.py                    # iki denetim
+    python benchmarks/regression_suite.py --skip-budgets     # yalnızca altın çıktı
+    python benchmarks/regression_suite.py --update           # beklenen çıktıları yeniden yaz
+    python benchmarks/regression_suite.py --update-budgets   # bütçeleri ölçümden yeniden yaz
+    python benchmarks/regression_suite.py --backend arrow    # aynı denetimler başka temizleme motoruyla
+
+Çıktı bilerek değiştirildiyse --update ile yeniden yazılan dosyaların farkı
+değişiklikle birlikte gözden geçirilir.
+"""
+
+import argparse
+import difflib
+import gc
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+GOLDEN_DIR = os.path.join(ROOT, 'data', 'golden')
+CASES_DIR = os.path.join(GOLDEN_DIR, 'cases')
+EXPECTED_DIR = os.path.join(GOLDEN_DIR, 'expected')
+VALUES_PATH = os.path.join(GOLDEN_DIR, 'values.json')
+BUDGETS_PATH = os.path.join(ROOT, 'benchmarks', 'budgets.json')
+
+# Ölçülen adımlar (sırasıyla)
+STAGES = ('read_csv', 'read_xlsx_merged', 'compact', 'clean', 'export_csv')
+
+# --update-budgets: bütçe = ölçüm x pay + sabit pay (makineler arası ve örnekleme oynamasına yer bırakır)
+BUDGET_HEADROOM = 1.5
+BUDGET_SLACK_SECONDS = 0.05
+BUDGET_SLACK_MB = 16
+
+# Sentetik veride kullanılan eşleştirme (Üye No; Adı; Soyadı; TC; Tutar)
+SYNTHETIC_MAPPING = {'member_no': 0, 'first_name': 1, 'last_name': 2, 'tc_no': 3, 'amount': 4,
+                     'use_combined_name': False}
+
+# Farkı gösterilen en fazla satır
+DIFF_LINES = 20
+
+
+# -----------------------------------------------------------------------------
+# Altın çıktı
+# -----------------------------------------------------------------------------
+def value_functions():
+    from utils.data_processor import (
+        clean_amount_kurus, clean_amount_value, clean_tc_number, fix_turkish_chars, split_full_name
+    )
+    return {
+        'clean_amount_value': clean_amount_value,
+        'clean_amount_kurus': clean_amount_kurus,
+        'clean_tc_number': clean_tc_number,
+        'split_full_name': lambda value: list(split_full_name(value)),
+        'fix_turkish_chars': fix_turkish_chars,
+    }
+
+
+def write_values(values):
+    """values.json'u her girdi/çıktı çifti tek satırda olacak şekilde yazar."""
+    lines = ['{']
+    for i, (name, entries) in enumerate(values.items()):
+        lines.append(f'  {json.dumps(name)}: [')
+        lines.extend(f'    {json.dumps(entry, ensure_ascii=False)}' + (',' if j < len(entries) - 1 else '')
+                     for j, entry in enumerate(entries))
+        lines.append('  ]' + (',' if i < len(values) - 1 else ''))
+    lines.append('}')
+    with open(VALUES_PATH, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def check_values(update=False):
+    """Fonksiyon bazındaki girdi/çıktı çiftlerini denetler; hatalı çiftlerin listesini döndürür."""
+    with open(VALUES_PATH, encoding='utf-8') as f:
+        values = json.load(f)
+    
+    functions = value_functions()
+    failures = []
+    for name, entries in values.items():
+        for entry in entries:
+            result = functions[name](entry['input'])
+            if update:
+                entry['expected'] = result
+            elif result != entry['expected']:
+                failures.append(f"{name}({entry['input']!r}) = {result!r}, beklenen {entry['expected']!r}")
+    
+    if update:
+        write_values(values)
+    return failures
+
+
+def case_inputs():
+    """Altın çıktı girdileri (eşleştirme dosyaları hariç), ada göre sıralı."""
+    return sorted(
+        os.path.join(CASES_DIR, name) for name in os.listdir(CASES_DIR)
+        if not name.endswith('.mapping.json')
+    )
+
+
+def run_case(path, backend=None):
+    """
+    Girdiyi komut satırıyla aynı hattan geçirir.
+    
+    Args:
+        path (str): Girdi dosyası
+        backend (str): Temizleme motoru (None ise varsayılan)
+    
+    Returns:
+        dict: {dosya soneki: bytes} (temiz liste, hata raporu, istatistikler)
+    """
+    from utils.pipeline import convert, encode_output, open_source
+    
+    mapping = None
+    mapping_path = os.path.splitext(path)[0] + '.mapping.json'
+    if os.path.exists(mapping_path):
+        with open(mapping_path, encoding='utf-8') as f:
+            mapping = json.load(f)
+    
+    df_clean, stats, used_mapping = convert(open_source(path), mapping, backend=backend)
+    error_log = stats.pop('error_log')
+    stats.pop('sample_skipped', None)
+    stats['mapping'] = used_mapping
+    return {
+        'csv': b''.join(encode_output(df_clean, 'csv')),
+        'errors.csv': error_log.to_csv_bytes(),
+        'stats.json': (json.dumps(stats, ensure_ascii=False, indent=2, sort_keys=True) + '\n').encode('utf-8'),
+    }
+
+
+# Satırları paylaşmayan ve toplamı total_rows olması gereken sayaçlar
+ROW_COUNTERS = ('processed_rows', 'invalid_tc', 'invalid_amount', 'empty_rows', 'page_rows', 'skipped_rows')
+
+
+def counter_gaps(stats, label):
+    """Satır sayaçlarının toplamı total_rows'u tutmuyorsa farkları (kaynak bazında da) döndürür."""
+    parts = [(label, stats)] + [(f"{label} / {source}", part) for source, part in stats.get('per_source', {}).items()]
+    gaps = []
+    for name, part in parts:
+        counted = sum(part.get(key, 0) for key in ROW_COUNTERS)
+        if counted != part['total_rows']:
+            gaps.append(f"{name}: satır sayaçları toplamı {counted}, total_rows {part['total_rows']}")
+    return gaps
+
+
+def _diff(expected, actual, label):
+    lines = list(difflib.unified_diff(
+        expected.decode('utf-8-sig').splitlines(), actual.decode('utf-8-sig').splitlines(),
+        fromfile=f'beklenen/{label}', tofile=f'şimdiki/{label}', lineterm=''
+    ))
+    return '\n'.join(lines[:DIFF_LINES] + (['...'] if len(lines) > DIFF_LINES else []))
+
+
+def check_cases(update=False, backend=None):
+    """Girdilerin çıktılarını beklenen dosyalarla karşılaştırır; farkların listesini döndürür."""
+    os.makedirs(EXPECTED_DIR, exist_ok=True)
+    failures = []
+    for path in case_inputs():
+        case = os.path.splitext(os.path.basename(path))[0]
+        try:
+            outputs = run_case(path, backend)
+        except Exception as e:
+            failures.append(f"{case}: {type(e).__name__}: {e}")
+            continue
+        
+        failures += counter_gaps(json.loads(outputs['stats.json']), case)
+        for suffix, actual in outputs.items():
+            expected_path = os.path.join(EXPECTED_DIR, f'{case}.{suffix}')
+            if update:
+                with open(expected_path, 'wb') as f:
+                    f.write(actual)
+                continue
+            if not os.path.exists(expected_path):
+                failures.append(f"{case}.{suffix}: beklenen dosya yok (--update ile oluşturun)")
+                continue
+            with open(expected_path, 'rb') as f:
+                expected = f.read()
+            if actual != expected:
+                failures.append(f"{case}.{suffix} farklı:\n{_diff(expected, actual, f'{case}.{suffix}')}")
+    return failures
+
+
+def check_previews():
+    """Girdiler bir satır eksik önizlemeyle okunur; yanlışlıkla tam sayılan önizlemelerin listesini döndürür."""
+    from utils.data_processor import find_data_start_row, read_file_with_encoding
+    from utils.multi_ingest import preview_complete
+    from utils.pipeline import open_source
+    
+    failures = []
+    for path in case_inputs():
+        case = os.path.splitext(os.path.basename(path))[0]
+        source = open_source(path)
+        skip_rows = find_data_start_row(source)
+        source.seek(0)
+        rows = read_file_with_encoding(source, skip_rows=skip_rows).attrs['rows_read']
+        if rows < 2:
+            continue
+        source.seek(0)
+        preview = read_file_with_encoding(source, skip_rows=skip_rows, max_rows=rows - 1)
+        if preview_complete(preview, rows - 1):
+            failures.append(f"{case}: {rows - 1} satırlık önizleme ({len(preview)} satır kaldı) "
+                            f"dosyanın tamamı sanılıyor ({rows} satır)")
+    return failures
+
+
+# -----------------------------------------------------------------------------
+# Performans bütçesi
+# -----------------------------------------------------------------------------
+def make_csv(path, rows, seed=0):
+    """
+    Zorlu değerlerle sentetik liste yazar (UTF-8, noktalı virgül, başlık satırı):
+    bozuk karakterli adlar, iki tutar biçimi, boş (kaymış) tutarlar, float biçimli TC'ler.
+    """
+    import numpy as np
+    
+    rng = np.random.default_rng(seed)
+    first = ["Ahmet", "AYÞE", "Mehmet", "Fatma", "Ýbrahim", "Zeynep", "Þükrü", "Gülsüm"]
+    last = ["Yýlmaz", "Kaya", "Demir", "Çelik", "Þahin", "Öztürk", "Doðan", "Aydın"]
+    first_idx = rng.integers(0, len(first), rows)
+    last_idx = rng.integers(0, len(last), rows)
+    cents = rng.integers(100, 500000, rows)
+    kind = rng.integers(0, 10, rows)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write("Üye No;Adı;Soyadı;TC Kimlik No;Tutar\r\n")
+        for i in range(rows):
+            tc = 10000000000 + i
+            lira, kurus = divmod(int(cents[i]), 100)
+            if kind[i] == 0:
+                amount = ''
+            elif kind[i] < 5:
+                amount = f"{lira:,}.{kurus:02d}".replace(',', 'X').replace('.', ',').replace('X', '.')
+            else:
+                amount = f"{lira:,}.{kurus:02d}"
+                amount = f'"{amount}"' if ',' in amount else amount
+            tc_text = f"{tc}.0" if kind[i] == 9 else str(tc)
+            f.write(f"{i};{first[first_idx[i]]};{last[last_idx[i]]};{tc_text};{amount}\r\n")
+    return path
+
+
+def make_merged_xlsx(path, rows, page_rows=45):
+    """Her sayfada birleşik başlık satırı olan, kayıtları farklı sütunlara dağılmış XLSX yazar."""
+    from openpyxl import Workbook
+    
+    wb = Workbook()
+    ws = wb.active
+    r = 1
+    for i in range(rows):
+        if i % page_rows == 0:
+            ws.cell(r, 1, 'SENDİKA AİDAT LİSTESİ')
+            ws.merge_cells(start_row=r, start_column=1, end_row=r, end_column=8)
+            r += 1
+        columns = (1, 3, 4, 6, 8) if i % 2 else (2, 3, 5, 6, 7)
+        for column, value in zip(columns, (i, "Ahmet", "Yılmaz", float(10000000000 + i), 150.5 + i % 100)):
+            ws.cell(r, column, value)
+        r += 1
+    wb.save(path)
+    return path
+
+
+def make_shifted_frame(rows, fields=5, width=14, seed=0):
+    """Dolu hücreleri satır içinde dağınık (birleşik hücre kaymalı) ham tablo üretir."""
+    import numpy as np
+    import pandas as pd
+    
+    rng = np.random.default_rng(seed)
+    positions = np.sort(np.argsort(rng.random((rows, width)), axis=1)[:, :fields], axis=1)
+    values = np.full((rows, width), np.nan, dtype=object)
+    record = np.array(["1", "Ahmet", "Yılmaz", "10000000000", "150,50"], dtype=object)
+    values[np.arange(rows)[:, None], positions] = record
+    return pd.DataFrame(values)
+
+
+def _rss_mb():
+    """Sürecin şu anki RSS'i (MB); /proc olmayan sistemlerde tepe RSS."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except OSError:
+        # ru_maxrss Linux'ta KB, macOS'ta bayt cinsindendir
+        scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def peak_memory_mb(func):
+    """Fonksiyonu çalıştırırken RSS'i örnekleyip başlangıca göre tepe artışı (MB) ölçer."""
+    gc.collect()
+    baseline = _rss_mb()
+    peak = [baseline]
+    done = threading.Event()
+    
+    def sample():
+        while not done.wait(0.005):
+            peak[0] = max(peak[0], _rss_mb())
+    
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = func()
+    finally:
+        done.set()
+        sampler.join()
+    peak[0] = max(peak[0], _rss_mb())
+    del result
+    return peak[0] - baseline
+
+
+def stage_function(stage, workdir, backend=None):
+    """Adımın girdisini hazırlar ve ölçülecek fonksiyonu döndürür (hazırlık ölçülmez)."""
+    from utils.data_processor import apply_column_mapping, compact_rows_left, read_file_with_encoding
+    from utils.spooled_upload import SpooledUpload
+    from utils.stream_export import iter_csv_chunks
+    
+    csv_path = os.path.join(workdir, 'liste.csv')
+    if stage == 'read_csv':
+        return lambda: read_file_with_encoding(SpooledUpload(csv_path), skip_rows=1)
+    if stage == 'read_xlsx_merged':
+        return lambda: read_file_with_encoding(SpooledUpload(os.path.join(workdir, 'liste.xlsx')))
+    if stage == 'compact':
+        with open(os.path.join(workdir, 'rows.txt')) as f:
+            raw = make_shifted_frame(int(f.read()))
+        return lambda: compact_rows_left(raw)
+    
+    df_raw = read_file_with_encoding(SpooledUpload(csv_path), skip_rows=1)
+    if stage == 'clean':
+        return lambda: apply_column_mapping(df_raw, SYNTHETIC_MAPPING, backend=backend)
+    if stage == 'export_csv':
+        df_clean, _ = apply_column_mapping(df_raw, SYNTHETIC_MAPPING, backend=backend)
+        return lambda: sum(len(chunk) for chunk in iter_csv_chunks(df_clean))
+    raise ValueError(f"Bilinmeyen adım: {stage}")
+
+
+def measure_stage(stage, workdir, repeat, backend=None):
+    """Tek adım ölçümü (alt süreçte çalışır), sonucu JSON olarak yazdırır."""
+    # Kütüphaneler gecikmeli yüklendiğinden ilk çağrıda yüklenmeleri belleğe sayılmasın
+    import numpy  # noqa: F401
+    import openpyxl  # noqa: F401
+    import pandas  # noqa: F401
+    import pyarrow  # noqa: F401
+    
+    func = stage_function(stage, workdir, backend)
+    memory = peak_memory_mb(func)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    print(json.dumps({'seconds': round(min(times), 3), 'memory_mb': round(memory, 1)}))
+
+
+def check_budgets(update=False, backend=None):
+    """Adımları ölçüp bütçeyle karşılaştırır; aşılan bütçelerin listesini döndürür."""
+    with open(BUDGETS_PATH, encoding='utf-8') as f:
+        budgets = json.load(f)
+    
+    failures = []
+    with tempfile.TemporaryDirectory(prefix='cevirici_budget_') as workdir:
+        print(f"Sentetik veri hazırlanıyor ({budgets['rows']:,} satır CSV, "
+              f"{budgets['xlsx_rows']:,} satır birleşik hücreli XLSX)...")
+        make_csv(os.path.join(workdir, 'liste.csv'), budgets['rows'])
+        make_merged_xlsx(os.path.join(workdir, 'liste.xlsx'), budgets['xlsx_rows'])
+        with open(os.path.join(workdir, 'rows.txt'), 'w') as f:
+            f.write(str(budgets['rows']))
+        
+        print(f"{'adım':<18} {'süre':>8} {'bütçe':>8} {'bellek':>9} {'bütçe':>9}")
+        for stage in STAGES:
+            command = [sys.executable, os.path.abspath(__file__), '--measure-stage', stage,
+                       '--workdir', workdir, '--repeat', str(budgets['repeat'])]
+            if backend:
+                command += ['--backend', backend]
+            output = subprocess.run(command, capture_output=True, text=True, cwd=ROOT)
+            if output.returncode != 0:
+                error = output.stderr.strip().splitlines()[-1] if output.stderr.strip() else output.returncode
+                failures.append(f"{stage}: ölçüm başarısız ({error})")
+                continue
+            result = json.loads(output.stdout.strip().splitlines()[-1])
+            
+            if update:
+                budgets['stages'][stage] = {
+                    'seconds': math.ceil((result['seconds'] * BUDGET_HEADROOM + BUDGET_SLACK_SECONDS) * 100) / 100,
+                    'memory_mb': math.ceil(result['memory_mb'] * BUDGET_HEADROOM) + BUDGET_SLACK_MB,
+                }
+            budget = budgets['stages'].get(stage)
+            if budget is None:
+                failures.append(f"{stage}: bütçe tanımlı değil (--update-budgets ile oluşturun)")
+                continue
+            
+            over = [f"{label} {result[key]} > {budget[key]}"
+                    for key, label in (('seconds', 'süre'), ('memory_mb', 'bellek'))
+                    if result[key] > budget[key]]
+            print(f"{stage:<18} {result['seconds']:>7.2f}s {budget['seconds']:>7.2f}s "
+                  f"{result['memory_mb']:>7.1f}MB {budget['memory_mb']:>7}MB {'AŞILDI' if over else 'ok'}")
+            if over:
+                failures.append(f"{stage}: bütçe aşıldı ({', '.join(over)})")
+    
+    if update:
+        with open(BUDGETS_PATH, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(budgets, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Altın çıktı ve performans bütçesi denetimi")
+    parser.add_argument('--skip-golden', action='store_true', help="Altın çıktı denetimini atla")
+    parser.add_argument('--skip-budgets', action='store_true', help="Performans bütçesi denetimini atla")
+    parser.add_argument('--update', action='store_true', help="Beklenen çıktıları şimdiki çıktıyla yeniden yaz")
+    parser.add_argument('--update-budgets', action='store_true',
+                        help=f"Bütçeleri ölçümün {BUDGET_HEADROOM} katı olarak yeniden yaz")
+    parser.add_argument('--backend', help="Temizleme motoru (varsayılan CEVIRICI_BACKEND veya pandas)")
+    parser.add_argument('--measure-stage', choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument('--workdir', help=argparse.SUPPRESS)
+    parser.add_argument('--repeat', type=int, default=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.measure_stage:
+        measure_stage(args.measure_stage, args.workdir, args.repeat, args.backend)
+        return 0
+    
+    failures = []
+    if not args.skip_golden:
+        golden = check_values(args.update) + check_cases(args.update, args.backend)
+        if not args.update:
+            golden += check_previews()
+        status = 'güncellendi' if args.update else ('ok' if not golden else f"{len(golden)} fark")
+        print(f"Altın çıktı ({len(case_inputs())} girdi + fonksiyon değerleri): {status}")
+        failures += golden
+    if not args.skip_budgets:
+        failures += check_budgets(args.update_budgets, args.backend)
+    
+    for failure in failures:
+        print(f"❌ {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
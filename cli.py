@@ -0,0 +1,140 @@
+"""
+Sendika Kesinti Listesi Düzenleyici - Komut Satırı
+Arayüz açmadan bir dosyayı okuyup temizler ve sonucu doğrudan diske yazar.
+
+Kullanım:
+    python cli.py liste.xlsx -o temiz.csv
+    python cli.py liste.csv -o temiz.ndjson --mapping eslestirme.json
+    python cli.py liste.xlsx -o temiz.csv --errors hatalar.csv
+    python cli.py liste.xlsx -o temiz.csv --rules kurallar.json --rule-report ihlaller.csv
+    python cli.py liste.xlsx -o temiz.csv --reference data/uye_deposu.sqlite3
+    python cli.py liste.xlsx -o temiz.csv --profile
+    python cli.py liste.xlsx -o temiz.csv --backend arrow
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from contextlib import nullcontext
+
+from utils.cleaning_backends import BACKENDS, DEFAULT_BACKEND
+from utils.member_store import load_member_roll, open_store
+from utils.name_matching import MemberIndex
+from utils.pipeline import OUTPUT_FORMATS, MappingError, open_source, convert, encode_output
+from utils.profiling import PROFILE_DIR, profile_run
+from utils.stream_export import write_chunks, DEFAULT_CHUNK_ROWS
+from utils.validation_rules import DEFAULT_RULES_PATH, load_rules, compile_rules
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Sendika kesinti listesini temizler ve dışa aktarır.")
+    parser.add_argument('input', help="Girdi dosyası (.csv, .txt, .xlsx, .xls)")
+    parser.add_argument('-o', '--output', required=True, help="Çıktı dosyası")
+    parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS,
+                        help="Çıktı formatı (belirtilmezse dosya uzantısından anlaşılır)")
+    parser.add_argument('-m', '--mapping', help="Sütun eşleştirme JSON dosyası (belirtilmezse otomatik öneri)")
+    parser.add_argument('--skip-rows', type=int, help="Atlanacak satır sayısı (belirtilmezse otomatik)")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS, help="Akışlı yazmada parça boyutu")
+    parser.add_argument('--errors', help="Elenen satırların yazılacağı CSV hata raporu")
+    parser.add_argument('--rules', default=DEFAULT_RULES_PATH,
+                        help="Doğrulama kuralları (JSON/YAML; varsayılan CEVIRICI_RULES_PATH)")
+    parser.add_argument('--rule-report', help="Kural ihlali eden satırların yazılacağı CSV raporu")
+    parser.add_argument('--reference',
+                        help="TC'si eksik/geçersiz satırların isimle eşleştirileceği üye deposu (SQLite)")
+    parser.add_argument('--backend', choices=list(BACKENDS), default=DEFAULT_BACKEND,
+                        help="Temizleme motoru (varsayılan CEVIRICI_BACKEND veya pandas)")
+    parser.add_argument('--profile', nargs='?', const=PROFILE_DIR, metavar='DIZIN',
+                        help=f"Okuma + temizleme + yazmayı profiller; .prof ve alev grafiği yığınlarını "
+                             f"dizine yazar (varsayılan {PROFILE_DIR})")
+    return parser.parse_args(argv)
+
+
+def load_mapping(path):
+    """Eşleştirmeyi dosyadan okur (dosya verilmezse None; otomatik öneri kullanılır)."""
+    if not path:
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_reference(path):
+    """Üye deposundan isimle eşleştirme dizinini kurar (dosya verilmezse None)."""
+    if not path:
+        return None
+    if not os.path.exists(path):
+        raise OSError(f"Üye deposu bulunamadı: {path}")
+    conn = open_store(path)
+    try:
+        return MemberIndex(load_member_roll(conn))
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    output_format = args.format or os.path.splitext(args.output)[1].lstrip('.').lower()
+    if output_format not in OUTPUT_FORMATS:
+        print(f"❌ Desteklenmeyen çıktı formatı: {output_format}", file=sys.stderr)
+        return 2
+    
+    # Varsayılan ortam değişkeninden geldiğinde argparse seçenekleri denetlemez
+    if args.backend not in BACKENDS:
+        print(f"❌ Bilinmeyen temizleme motoru: {args.backend} (seçenekler: {', '.join(BACKENDS)})", file=sys.stderr)
+        return 2
+    
+    try:
+        rules = compile_rules(load_rules(args.rules)) if args.rules else None
+    except (ValueError, OSError) as e:
+        print(f"❌ Kural dosyası: {e}", file=sys.stderr)
+        return 2
+    
+    try:
+        reference = load_reference(args.reference)
+    except (OSError, sqlite3.Error) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    
+    # Profil yalnızca --profile verilirse açılır; verilmezse hiçbir şey sarmalanmaz
+    with profile_run('cli', args.profile) if args.profile else nullcontext() as profile_report:
+        source = open_source(args.input)
+        
+        try:
+            df_clean, stats, _ = convert(source, load_mapping(args.mapping), skip_rows=args.skip_rows, rules=rules,
+                                         reference=reference, backend=args.backend)
+        except MappingError as e:
+            print(f"❌ {e} (--mapping ile belirtin)", file=sys.stderr)
+            return 1
+        except ValueError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        
+        written = write_chunks(encode_output(df_clean, output_format, args.chunk_rows), args.output)
+    
+    if profile_report:
+        print(f"🔬 Profil: {profile_report['profile_path']} ({profile_report['elapsed']:.2f} sn)", file=sys.stderr)
+        for row in profile_report['top']:
+            print(f"  {row['Öz Süre (sn)']:>9.4f} {row['Toplam Süre (sn)']:>9.4f} {row['Çağrı']:>9,}  {row['Fonksiyon']}",
+                  file=sys.stderr)
+    
+    stats.pop('sample_skipped', None)
+    error_log = stats.pop('error_log')
+    if args.errors:
+        write_chunks([error_log.to_csv_bytes()], args.errors)
+    
+    rule_report = stats.pop('rule_report', None)
+    if args.rule_report and rule_report is not None:
+        write_chunks([rule_report.to_csv(index=False).encode('utf-8-sig')], args.rule_report)
+    
+    result = {'output': args.output, 'bytes': written, 'skip_rows': stats.pop('skip_rows'),
+              'errors': error_log.counts(), 'stats': stats}
+    if profile_report:
+        result['profile'] = {key: profile_report[key] for key in ('profile_path', 'collapsed_path')}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
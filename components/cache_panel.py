@@ -0,0 +1,40 @@
+"""
+Önbellek Yönetim Paneli Component
+Bu modül, oturumlar arası paylaşılan önbelleğin durumunu (isabet oranı,
+girdiler, kullanılan bellek) kenar çubuğunda gösterir. Yalnızca yönetim
+görünümü açıkken (CEVIRICI_ADMIN=1) çizilir; dosya adları gösterilmez.
+"""
+
+import streamlit as st
+
+from utils.column_cache import COLUMN_CACHE
+from utils.shared_cache import SHARED_CACHE
+
+
+def _mb(size):
+    return f"{size / 1024 / 1024:,.1f} MB"
+
+
+def render_cache_panel():
+    """Paylaşılan önbellek ve sütun önbelleği özetini kenar çubuğunda gösterir."""
+    stats = SHARED_CACHE.stats()
+    
+    with st.sidebar.expander("🧠 Paylaşılan Önbellek"):
+        col1, col2 = st.columns(2)
+        col1.metric("İsabet Oranı", f"{stats['hit_rate']:.0%}",
+                    help=f"{stats['hits']:,} isabet, {stats['misses']:,} ıska")
+        col2.metric("Girdi", f"{stats['entries']:,}")
+        col1.metric("Kullanılan", _mb(stats['bytes']), help=f"Bütçe: {_mb(stats['max_bytes'])}")
+        col2.metric("Oturumlarda", _mb(stats['pinned_bytes']),
+                    help="Açık oturumların kullandığı, atılamayan girdiler")
+        st.caption(f"Bütçe {_mb(stats['max_bytes'])} · Atılan girdi: {stats['evictions']:,} · "
+                   f"Sütun önbelleği: {_mb(COLUMN_CACHE.size_bytes)} / {_mb(COLUMN_CACHE.max_bytes)}")
+        
+        entries = SHARED_CACHE.entries()
+        if entries:
+            st.dataframe(entries, use_container_width=True, hide_index=True,
+                         height=min(300, 38 + 35 * len(entries)))
+        
+        if st.button("🧹 Kullanılmayanları Boşalt", use_container_width=True):
+            removed = SHARED_CACHE.clear_unused()
+            st.toast(f"{removed} girdi boşaltıldı")
@@ -4,16 +4,22 @@ Bu modül, yüklenen dosyalardaki sütunların hedef alanlara eşleştirilmesi i
 """
 
 import streamlit as st
-import pandas as pd
 
+from components.table_pager import render_paged_table
 
-def render_column_mapper(df_sample, required_columns):
+# Eşleştirme önerisi ve doğrulaması arayüzden bağımsızdır (komut satırı ve HTTP
+# servisi Streamlit yüklemeden kullanır); geriye dönük uyumluluk için buradan da sunulur
+from utils.data_processor import auto_suggest_columns, validate_mapping
+
+
+def render_column_mapper(df_sample, required_columns, column_labels=None):
     """
     Sütun eşleştirme arayüzünü render eder.
     
     Args:
         df_sample (pd.DataFrame): Ham veri örneği (ilk birkaç satır)
         required_columns (dict): {'display_name': 'internal_key', ...} formatında gerekli sütunlar
+        column_labels (list): Dosyada bulunan sütun başlıkları (None ise sadece sütun numarası gösterilir)
     
     Returns:
         dict: Eşleştirilmiş sütun haritası {'internal_key': column_index/name, ...}
@@ -30,21 +36,24 @@ def render_column_mapper(df_sample, required_columns):
     
     st.info("👇 Dosyanızdaki sütunları uygun alanlara eşleştirin")
     
-    # Ham verinin önizlemesi
-    with st.expander("📋 Ham Veri Önizleme (İlk 10 Satır)", expanded=True):
-        # Sütun numaralarını göster
-        preview_df = df_sample.head(10).copy()
-        
-        # NaN/None değerlerini boş string ile değiştir (daha temiz görünüm)
-        preview_df = preview_df.fillna("")
-        
-        preview_df.columns = [f"Sütun {i}" for i in range(len(preview_df.columns))]
-        
-        st.dataframe(
-            preview_df,
-            use_container_width=True,
-            height=400
-        )
+    # Dosyadaki başlıklar (sütun sayısı uyuşmuyorsa kullanılmaz)
+    if column_labels is None or len(column_labels) != len(df_sample.columns):
+        column_labels = [''] * len(df_sample.columns)
+    
+    def column_title(col_index):
+        label = column_labels[col_index]
+        return f"Sütun {col_index} ({label})" if label else f"Sütun {col_index}"
+    
+    def format_preview(page_df):
+        # NaN/None değerlerini boş string ile değiştir (daha temiz görünüm), sütun numaralarını göster
+        page_df = page_df.astype(object).fillna("")
+        page_df.columns = [column_title(i) for i in range(len(page_df.columns))]
+        return page_df
+    
+    # Ham verinin önizlemesi (tarayıcıya yalnızca görünen sayfa gönderilir)
+    with st.expander("📋 Ham Veri Önizleme", expanded=True):
+        render_paged_table(df_sample, key='raw_preview', sortable=False, format_page=format_preview,
+                           default_page_size=25)
         
         st.caption(f"📊 Toplam {len(df_sample)} satır, {len(df_sample.columns)} sütun")
         
@@ -67,9 +76,9 @@ def render_column_mapper(df_sample, required_columns):
         
         if len(unique_vals) > 0:
             preview = ", ".join([str(v)[:20] for v in unique_vals])
-            return f"Sütun {col_index}: {preview}"
+            return f"{column_title(col_index)}: {preview}"
         else:
-            return f"Sütun {col_index}: (boş)"
+            return f"{column_title(col_index)}: (boş)"
     
     # Çoğunluğu boş olan sütunları filtrele (toplam satırın %10'undan az doluysa gizle)
     min_fill_count = max(1, len(df_sample) * 0.10)
@@ -85,7 +94,8 @@ def render_column_mapper(df_sample, required_columns):
     available_columns = ["-- Seçilmedi --"] + [get_column_label(i, df_sample) for i in valid_col_indices]
     
     # Otomatik öneri hesapla
-    suggestions = auto_suggest_columns(df_sample, required_columns, use_combined_name)
+    suggestions = auto_suggest_columns(df_sample, required_columns, use_combined_name,
+                                       column_labels=column_labels)
     
     # Eşleştirme formu
     st.markdown("#### Sütunları Eşleştir")
@@ -104,7 +114,7 @@ def render_column_mapper(df_sample, required_columns):
     
     # Sütun index'ini label'dan çıkaran yardımcı fonksiyon
     def extract_col_index(label):
-        """'Sütun X: ...' formatından X'i çıkar"""
+        """'Sütun X: ...' veya 'Sütun X (Başlık): ...' formatından X'i çıkar"""
         try:
             return int(label.split(":")[0].split(" ")[1])
         except:
@@ -115,9 +125,8 @@ def render_column_mapper(df_sample, required_columns):
         """Otomatik öneri sonucuna göre selectbox'ın varsayılan index'ini bul"""
         if internal_key in suggestions:
             suggested_col = suggestions[internal_key]
-            target_prefix = f"Sütun {suggested_col}:"
-            for idx, label in enumerate(available_cols):
-                if label.startswith(target_prefix):
+            for idx, label in enumerate(available_cols[1:], start=1):
+                if extract_col_index(label) == suggested_col:
                     return idx
         return 0  # "-- Seçilmedi --"
     
@@ -155,97 +164,3 @@ def render_column_mapper(df_sample, required_columns):
                     mapping[internal_key] = col_index
     
     return mapping
-
-
-def auto_suggest_columns(df, required_columns, use_combined_name=False):
-    """
-    Sütun içeriğine göre otomatik eşleştirme önerisi yapar.
-    
-    Args:
-        df (pd.DataFrame): Ham veri
-        required_columns (dict): Gerekli sütunlar
-        use_combined_name (bool): Ad-Soyad birleşik mi?
-    
-    Returns:
-        dict: Önerilen eşleşmeler {internal_key: column_index}
-    """
-    suggestions = {}
-    
-    # Her sütunu analiz et
-    for col_idx in range(len(df.columns)):
-        # İlk 20 satırı sample olarak al
-        sample_values = df[col_idx].astype(str).head(20)
-        
-        # TC Kimlik tespiti (11 haneli sayılar)
-        if 'tc_no' not in suggestions:
-            tc_pattern_count = sample_values.str.match(r'^\d{11}$').sum()
-            if tc_pattern_count >= 5:  # En az 5 satır TC formatında
-                suggestions['tc_no'] = col_idx
-                continue
-        
-        # Tutar tespiti (sayısal değerler, virgül/nokta içeren)
-        if 'amount' not in suggestions:
-            amount_pattern_count = sample_values.str.match(r'^[\d\.,]+$').sum()
-            if amount_pattern_count >= 5:
-                suggestions['amount'] = col_idx
-                continue
-        
-        # Üye No / Sıra No tespiti (1-6 haneli sayılar)
-        if 'member_no' not in suggestions:
-            member_pattern_count = sample_values.str.match(r'^\d{1,7}$').sum()
-            if member_pattern_count >= 5:
-                suggestions['member_no'] = col_idx
-                continue
-        
-        # İsim tespiti (2 veya daha fazla kelime, boşluk içeren)
-        if use_combined_name:
-            if 'full_name' not in suggestions:
-                # Birleşik isim tespiti (boşluk içeren isimler)
-                combined_name_count = sample_values.str.match(r'^[A-Za-zÇçĞğİıÖöŞşÜü]+\s+[A-Za-zÇçĞğİıÖöŞşÜü]+').sum()
-                if combined_name_count >= 5:
-                    suggestions['full_name'] = col_idx
-                    continue
-        else:
-            # Ayrı isim tespiti
-            if 'first_name' not in suggestions or 'last_name' not in suggestions:
-                name_pattern_count = sample_values.str.match(r'^[A-Za-zÇçĞğİıÖöŞşÜü\s]{2,30}$').sum()
-                if name_pattern_count >= 5:
-                    # Boşluk içermeyen veya tek kelime ise muhtemelen tek isim
-                    single_word_count = sample_values.str.match(r'^[A-Za-zÇçĞğİıÖöŞşÜü]+$').sum()
-                    if single_word_count >= 5:
-                        if 'first_name' not in suggestions:
-                            suggestions['first_name'] = col_idx
-                        elif 'last_name' not in suggestions:
-                            suggestions['last_name'] = col_idx
-    
-    return suggestions
-
-
-def validate_mapping(mapping, required_columns):
-    """
-    Eşleştirmenin geçerli olup olmadığını kontrol eder.
-    
-    Args:
-        mapping (dict): Kullanıcının yaptığı eşleştirme
-        required_columns (dict): Gerekli sütunlar
-    
-    Returns:
-        tuple: (is_valid: bool, missing_fields: list)
-    """
-    # Birleşik isim modu kontrolü
-    use_combined_name = mapping.get('use_combined_name', False)
-    
-    if use_combined_name:
-        # Birleşik isim modunda first_name ve last_name yerine full_name gerekli
-        required_keys = set(required_columns.values()) - {'first_name', 'last_name'}
-        required_keys.add('full_name')
-    else:
-        required_keys = set(required_columns.values())
-    
-    # use_combined_name'i mapped_keys'den çıkar (çünkü bu bir bool değer, sütun değil)
-    mapped_keys = set(k for k in mapping.keys() if k != 'use_combined_name')
-    
-    missing = required_keys - mapped_keys
-    
-    return len(missing) == 0, list(missing)
-
@@ -0,0 +1,43 @@
+"""
+Hata Raporu Component
+Bu modül, temizleme sırasında elenen satırların neden bazında özetini,
+ilk satırlarını ve indirilebilir CSV raporunu gösterir.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+
+
+# Önizlemede gösterilecek en fazla hatalı satır
+PREVIEW_ROWS = 200
+
+
+def render_error_report(error_log, key='error_report'):
+    """
+    Elenen satırları gösterir (kayıt boşsa hiçbir şey çizilmez).
+    
+    Args:
+        error_log (ErrorLog): apply_column_mapping'in döndürdüğü hata kaydı
+        key (str): Widget anahtarı öneki
+    """
+    if error_log is None or len(error_log) == 0:
+        return
+    
+    with st.expander(f"⚠️ Elenen Satırlar ({len(error_log):,})"):
+        counts = error_log.counts()
+        for column, (reason, count) in zip(st.columns(len(counts)), counts.items()):
+            with column:
+                st.metric(reason, f"{count:,}")
+        
+        st.dataframe(error_log.to_frame(limit=PREVIEW_ROWS), use_container_width=True, height=250)
+        if len(error_log) > PREVIEW_ROWS:
+            st.caption(f"İlk {PREVIEW_ROWS} satır gösteriliyor; tamamı indirilen raporda.")
+        
+        st.download_button(
+            label="⚠️ Hata Raporu İndir (CSV)",
+            data=error_log.to_csv_bytes(),
+            file_name=f"SendikaListesi_Hatalar_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            key=f"{key}_download"
+        )
@@ -0,0 +1,51 @@
+"""
+İş İlerleme Component
+Bu modül, arka plan işlerinin durumunu betik thread'ini bloklamadan izleyen
+ilerleme çubuğu ve iptal butonunu sağlar.
+"""
+
+import os
+import time
+
+import streamlit as st
+
+from utils.job_queue import JobManager
+
+
+# İlerleme sorgulama aralığı (saniye)
+POLL_INTERVAL = 0.5
+
+
+@st.cache_resource
+def get_job_manager():
+    """Tüm oturumlar için tek bir iş kuyruğu oluşturur."""
+    return JobManager(max_workers=int(os.environ.get('CEVIRICI_JOB_WORKERS', 2)))
+
+
+def wait_for_job(job_id, label):
+    """
+    İş devam ediyorsa ilerleme çubuğunu gösterir ve sayfayı yeniden çalıştırır;
+    iş bittiğinde Job nesnesini döndürür.
+    
+    Args:
+        job_id (str): İş kimliği
+        label (str): İlerleme çubuğu başlığı
+    
+    Returns:
+        Job: Bitmiş iş (bulunamazsa None)
+    """
+    manager = get_job_manager()
+    job = manager.get(job_id)
+    
+    if job is None or not job.is_active:
+        return job
+    
+    text = f"{label} {job.message}".strip()
+    st.progress(job.progress, text=text)
+    
+    if st.button("⏹️ İptal Et", key=f"cancel_{job_id}"):
+        manager.cancel(job_id)
+    
+    # Sonuç hazır olana kadar betiği kısa aralıklarla yeniden çalıştır
+    time.sleep(POLL_INTERVAL)
+    st.rerun()
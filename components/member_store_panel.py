@@ -0,0 +1,116 @@
+"""
+Üye Deposu Component
+Bu modül, temizlenmiş listenin yerel depoya kaydedilmesi ve depodaki
+kayıtların indeksli olarak sorgulanması için UI sağlar.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+
+from utils.member_store import (
+    ThreadConnections,
+    upsert_members,
+    lookup_members,
+    member_history,
+    list_periods,
+    count_members,
+    load_member_roll,
+    store_version
+)
+from utils.name_matching import MemberIndex
+
+
+@st.cache_resource
+def _store_connections():
+    """Tüm oturumların paylaştığı, thread başına bağlantı açan depo erişimi."""
+    return ThreadConnections()
+
+
+def get_store_connection():
+    """Geçerli thread'in depo bağlantısını döndürür (oturumlar bağlantı paylaşmaz)."""
+    return _store_connections().get()
+
+
+@st.cache_resource(max_entries=1)
+def _member_index(version):
+    """Depo sürümü değişmedikçe aynı isim eşleştirme dizini kullanılır."""
+    return MemberIndex(load_member_roll(get_store_connection()))
+
+
+def get_member_index():
+    """
+    Depodaki üye listesinden isimle eşleştirme dizinini döndürür
+    (depoya kayıt eklendiğinde yeniden kurulur).
+    
+    Returns:
+        MemberIndex: Her TC için son dönemdeki üye no, ad ve soyad üzerinde dizin
+    """
+    return _member_index(store_version(get_store_connection()))
+
+
+def render_member_store_panel(clean_df, source_name=None):
+    """
+    Üye deposu kaydetme ve sorgulama arayüzünü render eder.
+    
+    Args:
+        clean_df (pd.DataFrame): Temizlenmiş veri (None ise sadece sorgu gösterilir)
+        source_name (str): Kaynak dosya adı
+    """
+    conn = get_store_connection()
+    
+    with st.expander("🗄️ Üye Deposu (Kaydet / Sorgula)", expanded=False):
+        
+        # Kaydetme
+        if clean_df is not None and not clean_df.empty:
+            col1, col2 = st.columns([2, 1], vertical_alignment="bottom")
+            
+            with col1:
+                period = st.text_input(
+                    "📅 Dönem",
+                    value=datetime.now().strftime('%Y-%m'),
+                    help="Aynı TC ve dönem için tekrar kaydedilen kayıtlar güncellenir"
+                )
+            
+            with col2:
+                if st.button("💾 Depoya Kaydet", use_container_width=True):
+                    if not period.strip():
+                        st.warning("⚠️ Lütfen dönem girin.")
+                    else:
+                        written = upsert_members(conn, clean_df, period.strip(), source=source_name)
+                        st.success(f"✅ {written} kayıt '{period.strip()}' dönemine kaydedildi.")
+            
+            st.markdown("---")
+        
+        # Sorgulama
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            tc_query = st.text_input("🆔 TC Kimlik No", key="store_tc")
+        
+        with col2:
+            surname_query = st.text_input("👤 Soyadı (baştan eşleşme)", key="store_surname")
+        
+        with col3:
+            member_query = st.text_input("🔢 Üye No", key="store_member_no")
+        
+        if tc_query or surname_query or member_query:
+            results = lookup_members(
+                conn,
+                tc_no=tc_query,
+                last_name=surname_query,
+                member_no=member_query
+            )
+            st.caption(f"🔍 {len(results)} kayıt bulundu")
+            st.dataframe(results, use_container_width=True, height=250)
+            
+            # Tek üye bulunduysa dönem geçmişini göster
+            if tc_query and not results.empty:
+                st.markdown("**📜 Dönem Geçmişi**")
+                st.dataframe(member_history(conn, tc_query), use_container_width=True)
+        else:
+            if count_members(conn) == 0:
+                st.caption("Depoda henüz kayıt yok.")
+            else:
+                st.caption("📚 Kayıtlı dönemler")
+                st.dataframe(list_periods(conn), use_container_width=True)
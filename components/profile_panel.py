@@ -0,0 +1,55 @@
+"""
+Profil Paneli Component
+Bu modül, profil modu açıkken (CEVIRICI_PROFILE=1) kenar çubuğunda yüklenen
+dosyanın tek geçişlik profilini çıkaran butonu, adım sürelerini, en çok
+zaman harcayan fonksiyonları ve profil dosyalarının indirme butonlarını gösterir.
+"""
+
+import os
+
+import streamlit as st
+
+from utils.profiling import PROFILE_DIR, profile_pipeline
+
+
+def render_profile_panel(uploaded_files, column_mapping, read_all_sheets=False, key='profile_panel'):
+    """
+    Profil butonu ve son profilin özetini gösterir.
+    
+    Args:
+        uploaded_files (list): Dosya nesneleri
+        column_mapping (dict): Onaylanmış sütun eşleştirme haritası
+        read_all_sheets (bool): Excel dosyalarında tüm sayfalar okunsun mu?
+        key (str): Widget anahtarı öneki
+    """
+    st.markdown("---")
+    st.markdown("**🔬 Profil**")
+    st.caption(f"Okuma + temizleme + dışa aktarma bir kez profillenir; dosyalar {PROFILE_DIR} dizinine yazılır.")
+    
+    if st.button("🔬 Profil Çıkar", use_container_width=True, key=f"{key}_run"):
+        with st.spinner("Profil çıkarılıyor (profil açıkken işlem birkaç kat yavaşlar)..."):
+            try:
+                st.session_state[f"{key}_report"] = profile_pipeline(uploaded_files, column_mapping, read_all_sheets)
+            except Exception as e:
+                st.error(f"❌ Profil çıkarılamadı: {e}")
+                return
+    
+    report = st.session_state.get(f"{key}_report")
+    if not report:
+        return
+    
+    stages = " · ".join(f"{stage}: {seconds:.2f} sn" for stage, seconds in report['stages'].items())
+    st.caption(f"{report['rows']:,} satır, {report['elapsed']:.2f} sn ({report['samples']:,} örnek) — {stages}")
+    st.dataframe(report['top'], use_container_width=True, hide_index=True, height=300)
+    
+    for path, label in ((report['profile_path'], "📈 .prof İndir"), (report['collapsed_path'], "🔥 Alev Grafiği Yığınları İndir")):
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                st.download_button(
+                    label=label,
+                    data=f.read(),
+                    file_name=os.path.basename(path),
+                    mime="application/octet-stream",
+                    use_container_width=True,
+                    key=f"{key}_{os.path.splitext(path)[1][1:]}"
+                )
@@ -0,0 +1,53 @@
+"""
+Kural İhlalleri Component
+Bu modül, doğrulama kurallarının kural bazındaki ihlal sayılarını, ihlal eden
+satırların önizlemesini ve indirilebilir CSV raporunu gösterir.
+"""
+
+from datetime import datetime
+
+import streamlit as st
+
+from components.error_report import PREVIEW_ROWS
+
+
+def render_rule_report(stats, key='rule_report'):
+    """
+    Kural ihlallerini gösterir (kural uygulanmadıysa hiçbir şey çizilmez).
+    
+    Args:
+        stats (dict): apply_rules'un güncellediği işlem istatistikleri
+        key (str): Widget anahtarı öneki
+    """
+    if stats.get('rule_error'):
+        st.error(f"❌ Kural dosyası uygulanamadı: {stats['rule_error']}")
+        return
+    
+    violations = stats.get('rule_violations')
+    if not violations:
+        return
+    
+    failed_rows = stats.get('rule_failed_rows', 0)
+    with st.expander(f"🛡️ Kural İhlalleri ({failed_rows:,} satır)", expanded=failed_rows > 0):
+        st.dataframe(
+            [{"Kural": name, "İhlal": count} for name, count in violations.items()],
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        report = stats.get('rule_report')
+        if report is None or report.empty:
+            st.caption("Tüm satırlar kurallara uyuyor.")
+            return
+        
+        st.dataframe(report.head(PREVIEW_ROWS), use_container_width=True, height=250)
+        if len(report) > PREVIEW_ROWS:
+            st.caption(f"İlk {PREVIEW_ROWS} satır gösteriliyor; tamamı indirilen raporda.")
+        
+        st.download_button(
+            label="🛡️ Kural İhlali Raporu İndir (CSV)",
+            data=report.to_csv(index=False).encode('utf-8-sig'),
+            file_name=f"SendikaListesi_KuralIhlalleri_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv",
+            key=f"{key}_download"
+        )
@@ -0,0 +1,41 @@
+"""
+Özet Analiz Paneli Component
+Bu modül, temiz listeyle birlikte saklanan özet analizlerini (tutar bantları,
+üye no aralıkları, kaynaklar ve aykırı tutarlar) gösterir. Sütunlar yeniden
+taranmaz; yalnızca utils/summary.py'nin hesapladığı sonuç okunur.
+"""
+
+import streamlit as st
+
+from utils.money import format_lira
+from utils.summary import summary_tables
+
+
+def render_summary_panel(summary):
+    """
+    Özet analizlerini sekmeler halinde gösterir (özet yoksa hiçbir şey çizilmez).
+    
+    Args:
+        summary (dict): build_summary sonucu (processing_stats['summary'])
+    """
+    if not summary or not summary['records']:
+        return
+    
+    with st.expander("📊 Özet Analiz"):
+        st.caption(
+            f"Medyan: {format_lira(summary['amount_median'])} · "
+            f"En düşük: {format_lira(summary['amount_min'])} · "
+            f"En yüksek: {format_lira(summary['amount_max'])} · "
+            f"Aykırı tutarlı kayıt: {summary['outlier_count']:,}"
+        )
+        
+        tables = {title: table for title, table in summary_tables(summary).items() if title != "Özet"}
+        for tab, (title, table) in zip(st.tabs(list(tables)), tables.items()):
+            with tab:
+                if title == "Tutar Bantları":
+                    st.bar_chart(table.set_index("Tutar Bandı")["Kayıt"], height=220)
+                if title.startswith("Aykırı Tutarlar") and summary['outlier_count'] > len(table):
+                    st.caption(f"Medyandan en uzak {len(table)} kayıt gösteriliyor "
+                               f"(toplam {summary['outlier_count']:,}).")
+                st.dataframe(table, use_container_width=True, hide_index=True,
+                             height=min(300, 38 + 35 * len(table)))
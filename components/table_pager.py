@@ -0,0 +1,98 @@
+"""
+Sayfalı Tablo Component
+Bu modül, büyük tabloları sayfa sayfa gösterir. Filtreleme ve sıralama
+sunucu tarafında satır konumları üzerinden yapılır; tarayıcıya her
+yeniden çalıştırmada yalnızca görünen sayfa gönderilir.
+"""
+
+import streamlit as st
+
+from utils.table_view import page_bounds, restrict_positions, sort_positions
+
+
+# Seçilebilir sayfa boyutları
+PAGE_SIZES = (25, 50, 100, 250, 500)
+DEFAULT_PAGE_SIZE = 100
+
+_NO_SORT = "-- Sıralama yok --"
+
+
+def session_memo(key, source, compute, params=None):
+    """
+    Kaynak nesne (ve parametreler) değişmedikçe hesaplanan değeri oturumda saklar
+    (örn: temiz liste için arama dizini, sıralama veya dışa aktarma dosyası).
+    
+    Args:
+        key (str): Oturum anahtarı
+        source: Değerin bağlı olduğu nesne (aynı nesne ise değer yeniden kullanılır)
+        compute (callable): Değeri üreten parametresiz fonksiyon
+        params: Değeri etkileyen diğer seçenekler (örn: filtre; eşitlikle karşılaştırılır)
+    
+    Returns:
+        Saklanan veya yeni hesaplanan değer
+    """
+    memo = st.session_state.get(key)
+    if memo is None or memo[0] is not source or memo[1] != params:
+        memo = (source, params, compute())
+        st.session_state[key] = memo
+    return memo[2]
+
+
+def render_paged_table(df, key, positions=None, sortable=True, format_page=None,
+                       page_sizes=PAGE_SIZES, default_page_size=DEFAULT_PAGE_SIZE, height=400):
+    """
+    Tabloyu sayfalı olarak gösterir.
+    
+    Args:
+        df (pd.DataFrame): Tablonun tamamı
+        key (str): Widget anahtarı öneki
+        positions (np.ndarray): Gösterilecek satır konumları (filtre sonucu; None ise tümü)
+        sortable (bool): Sıralama seçimi gösterilsin mi
+        format_page (callable): Görünen sayfaya uygulanacak dönüşüm (örn: kuruş -> TL)
+        page_sizes (tuple): Seçilebilir sayfa boyutları
+        default_page_size (int): Varsayılan sayfa boyutu
+        height (int): Tablo yüksekliği (piksel)
+    
+    Returns:
+        pd.DataFrame: Görünen sayfa
+    """
+    total_rows = len(df) if positions is None else len(positions)
+    
+    col_sort, col_order, col_size, col_page = st.columns([3, 2, 2, 2])
+    
+    order = None
+    if sortable:
+        with col_sort:
+            sort_column = st.selectbox("↕️ Sırala", [_NO_SORT] + list(df.columns), key=f"{key}_sort")
+        with col_order:
+            descending = st.selectbox("Yön", ["Artan", "Azalan"], key=f"{key}_order") == "Azalan"
+        if sort_column != _NO_SORT:
+            # Tüm tablonun sıralaması bir kez hesaplanır, filtre yalnızca süzer
+            order = session_memo(f"{key}_sorted_{sort_column}_{descending}", df,
+                                 lambda: sort_positions(df, sort_column, ascending=not descending))
+            if positions is not None:
+                order = restrict_positions(order, positions, len(df))
+    if order is None:
+        order = positions
+    
+    with col_size:
+        page_size = st.selectbox("Satır / sayfa", list(page_sizes),
+                                 index=list(page_sizes).index(default_page_size), key=f"{key}_page_size")
+    
+    # Filtre veya sayfa boyutu değiştiğinde sayfa numarası geçerli aralığa çekilir
+    page_key = f"{key}_page"
+    start, stop, page, page_count = page_bounds(total_rows, st.session_state.get(page_key, 1), page_size)
+    st.session_state[page_key] = page
+    with col_page:
+        st.number_input("Sayfa", min_value=1, max_value=page_count, step=1, key=page_key)
+    
+    page_df = df.iloc[start:stop] if order is None else df.iloc[order[start:stop]]
+    if format_page is not None:
+        page_df = format_page(page_df)
+    
+    st.dataframe(page_df, use_container_width=True, height=height)
+    if total_rows:
+        st.caption(f"Sayfa {page:,} / {page_count:,} · Satır {start + 1:,}–{stop:,} / {total_rows:,}")
+    else:
+        st.caption("Gösterilecek satır yok")
+    return page_df
@@ -0,0 +1,210 @@
+"""
+Sıkıştırılmış Arşiv Okuma
+Bu modül, .zip ve .gz yüklemelerindeki listelerin açılmasını sağlar. Arşiv
+üyeleri belleğe alınmadan bloklar halinde açılarak ayrı geçici dosyalara
+akıtılır (zlib açma sırasında GIL'i bıraktığından üyeler thread havuzunda
+eşzamanlı açılır); elde edilen dosyalar normal yüklemeler gibi okunur.
+"""
+
+import gzip
+import os
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from utils.spooled_upload import SPOOL_CHUNK_BYTES, SPOOL_DIR, SpooledUpload, spool_upload
+
+
+# Desteklenen arşiv uzantıları ve arşiv içinde okunan dosya uzantıları
+ARCHIVE_SUFFIXES = ('.zip', '.gz')
+MEMBER_SUFFIXES = ('.csv', '.txt', '.xlsx', '.xls')
+
+# Bir arşivden açılabilecek toplam boyut üst sınırı (sıkıştırma bombalarına karşı)
+ARCHIVE_MAX_BYTES = int(os.environ.get('CEVIRICI_ARCHIVE_MAX_MB', 2048)) * 1024 * 1024
+
+# Arşiv araçlarının eklediği ve okunmayan girdiler
+_IGNORED_PREFIXES = ('__MACOSX/', '.')
+
+
+def is_archive(file_name):
+    """
+    Dosya adı desteklenen bir arşiv mi?
+    
+    Args:
+        file_name (str): Dosya adı
+    
+    Returns:
+        bool: .zip veya .gz ise True
+    """
+    return file_name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def member_label(archive_name, member_name):
+    """
+    Arşiv üyesinin etiketi; okuma fonksiyonları formatı bu adın uzantısından anlar.
+    
+    Args:
+        archive_name (str): Arşiv dosyasının adı
+        member_name (str): Arşiv içindeki dosya yolu
+    
+    Returns:
+        str: "arsiv.zip / il1/liste.csv"
+    """
+    return f"{archive_name} / {member_name}"
+
+
+def list_members(archive):
+    """
+    Arşivde okunacak dosyaları listeler (klasörler, gizli dosyalar ve
+    desteklenmeyen uzantılar atlanır).
+    
+    Args:
+        archive (SpooledUpload): Diskteki arşiv
+    
+    Returns:
+        list: Arşiv içindeki dosya yolları (.gz için açılmış dosyanın adı)
+    """
+    if archive.name.lower().endswith('.gz'):
+        member_name = os.path.basename(archive.name)[:-3]
+        if not member_name.lower().endswith(MEMBER_SUFFIXES):
+            raise ValueError(f"{archive.name}: .gz içinde desteklenmeyen dosya ({member_name})")
+        return [member_name]
+    
+    try:
+        with zipfile.ZipFile(archive.path) as zf:
+            infos = zf.infolist()
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"{archive.name}: geçerli bir zip arşivi değil ({e})") from e
+    
+    members = [
+        info for info in infos
+        if not info.is_dir()
+        and not info.filename.startswith(_IGNORED_PREFIXES)
+        and not os.path.basename(info.filename).startswith(_IGNORED_PREFIXES)
+        and info.filename.lower().endswith(MEMBER_SUFFIXES)
+    ]
+    
+    # Bildirilen boyutlar sınırı aşıyorsa açmaya hiç başlanmaz (açarken de ayrıca sayılır)
+    if sum(info.file_size for info in members) > ARCHIVE_MAX_BYTES:
+        raise ValueError(f"{archive.name}: açılmış boyut {ARCHIVE_MAX_BYTES // 1024 // 1024} MB sınırını aşıyor")
+    return [info.filename for info in members]
+
+
+class _ByteBudget:
+    """
+    Bir arşivin üyeleri arasında paylaşılan açılmış boyut sayacı. Üyeler
+    thread'lerde eşzamanlı açıldığından sayaç kilitle güncellenir; zip
+    başlıklarında bildirilen boyutlara güvenilmez.
+    """
+    
+    def __init__(self, limit=None):
+        self.limit = ARCHIVE_MAX_BYTES if limit is None else limit
+        self.used = 0
+        self._lock = threading.Lock()
+    
+    def take(self, size):
+        """size byte'ı bütçeden düşer; toplam sınırı aşarsa ValueError fırlatır."""
+        with self._lock:
+            self.used += size
+            if self.used > self.limit:
+                raise ValueError(f"açılmış boyut {self.limit // 1024 // 1024} MB sınırını aşıyor")
+
+
+@contextmanager
+def _open_member(archive, member_name):
+    """Üyenin açılmış içeriğini akış olarak verir (her çağrı arşivi ayrı açar; thread'ler paylaşmaz)."""
+    if archive.name.lower().endswith('.gz'):
+        with gzip.open(archive.path, 'rb') as stream:
+            yield stream
+        return
+    with zipfile.ZipFile(archive.path) as zf, zf.open(member_name) as stream:
+        yield stream
+
+
+def extract_member(archive, member_name, directory=None, budget=None):
+    """
+    Arşiv üyesini bloklar halinde açarak geçici dosyaya yazar (üyenin tamamı
+    hiçbir zaman bellekte tutulmaz). Yazılan her blok arşivin ortak boyut
+    bütçesinden düşülür; böylece üyeler birlikte ARCHIVE_MAX_BYTES'ı aşamaz.
+    
+    Args:
+        archive (SpooledUpload): Diskteki arşiv
+        member_name (str): Arşiv içindeki dosya yolu
+        directory (str): Geçici dizin (None ise SPOOL_DIR / sistem varsayılanı)
+        budget (_ByteBudget): Arşivin üyeleri arasında paylaşılan bütçe (None ise yalnızca bu üye sayılır)
+    
+    Returns:
+        SpooledUpload: Kapatıldığında silinen açılmış dosya
+    """
+    label = member_label(archive.name, member_name)
+    suffix = os.path.splitext(member_name)[1]
+    budget = budget or _ByteBudget()
+    fd, path = tempfile.mkstemp(prefix='cevirici_member_', suffix=suffix, dir=directory or SPOOL_DIR)
+    try:
+        with os.fdopen(fd, 'wb') as out, _open_member(archive, member_name) as stream:
+            for block in iter(lambda: stream.read(SPOOL_CHUNK_BYTES), b''):
+                budget.take(len(block))
+                out.write(block)
+    except (ValueError, OSError, EOFError, RuntimeError, zipfile.BadZipFile) as e:
+        os.remove(path)
+        raise ValueError(f"{label}: {e}") from e
+    
+    return SpooledUpload(path, label, delete=True)
+
+
+def expand_archives(uploaded_files, max_workers=None):
+    """
+    Yüklemelerdeki arşivleri üyelerine açar; arşiv olmayan dosyalar olduğu gibi kalır.
+    
+    Args:
+        uploaded_files (list): Dosya nesneleri
+        max_workers (int): Eşzamanlı açılan üye sayısı (None ise CPU sayısı)
+    
+    Returns:
+        tuple: (list: Okunacak dosyalar (yükleme sırasıyla, arşivler yerine üyeleri),
+                list: Açılan geçici dosyalar (işlem bitince kapatılmalı))
+    """
+    if not any(is_archive(f.name) for f in uploaded_files):
+        return list(uploaded_files), []
+    
+    archives = {}
+    budgets = {}
+    tasks = []
+    try:
+        for position, uploaded_file in enumerate(uploaded_files):
+            if is_archive(uploaded_file.name):
+                archive = spool_upload(uploaded_file)
+                archives[position] = archive
+                budgets[position] = _ByteBudget()
+                tasks.extend((position, archive, name) for name in list_members(archive))
+        if not tasks:
+            raise ValueError("Arşivlerde okunacak dosya (.csv, .txt, .xlsx, .xls) bulunamadı.")
+        
+        workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(extract_member, archive, name, budget=budgets[position])
+                       for position, archive, name in tasks]
+    finally:
+        # Diske akıtılan arşivler silinir (zaten diskte olanlara dokunulmaz)
+        for position, archive in archives.items():
+            if archive is not uploaded_files[position]:
+                archive.close()
+    
+    extracted = [future.result() for future in futures if future.exception() is None]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    if errors:
+        # Bir üye açılamazsa açılmış olanlar da silinir
+        for member in extracted:
+            member.close()
+        raise errors[0]
+    
+    members = {}
+    for (position, _, _), member in zip(tasks, extracted):
+        members.setdefault(position, []).append(member)
+    
+    files = []
+    for position, uploaded_file in enumerate(uploaded_files):
+        files.extend(members.get(position, []) if position in archives else [uploaded_file])
+    return files, extracted
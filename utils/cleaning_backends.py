@@ -0,0 +1,240 @@
+"""
+Temizleme Motorları
+Bu modül, apply_column_mapping'in sütun temizleme çekirdeklerini (TC doğrulama,
+tutar ayrıştırma, isim düzeltme ve birleşik ad ayırma) değiştirilebilir bir
+motor arayüzü arkasında toplar. Satır eleme, tutar kaydırma, sayfa satırları,
+hata kaydı ve istatistikler motordan bağımsızdır; her motor aynı girdiye aynı
+çıktıyı verir (df_clean / stats sözleşmesi değişmez).
+
+Motorlar:
+    pandas  Benzersiz değerler üzerinde Python fonksiyonları (varsayılan)
+    arrow   pyarrow.compute çekirdekleri; GIL'i bırakır, büyük sütunlar
+            parçalar halinde thread havuzunda işlenir
+
+Motor CEVIRICI_BACKEND ortam değişkeniyle (komut satırında --backend) seçilir.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.data_processor import (
+    NULL_TOKENS,
+    _clean_name,
+    _clean_tc_column,
+    _map_unique,
+    _mapped_text,
+    _split_full_names,
+    clean_amount_kurus,
+    clean_tc_number,
+    split_full_name,
+)
+from utils.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+pa = lazy_import('pyarrow')
+pc = lazy_import('pyarrow.compute')
+
+
+# Varsayılan motor
+DEFAULT_BACKEND = os.environ.get('CEVIRICI_BACKEND', 'pandas')
+
+# Arrow motorunda thread havuzuna bir seferde verilen benzersiz değer sayısı
+ARROW_CHUNK_ROWS = 65536
+
+# fix_turkish_chars ile aynı sırada uygulanan bozuk karakter düzeltmeleri
+_TURKISH_FIXES = (
+    ('Ã¼', 'ü'), ('Ã¶', 'ö'), ('Ã§', 'ç'), ('ÅŸ', 'ş'), ('Ä±', 'ı'), ('ÄŸ', 'ğ'),
+    ('Ãœ', 'Ü'), ('Ã–', 'Ö'), ('Ã‡', 'Ç'), ('Åž', 'Ş'), ('Ä°', 'İ'), ('Äž', 'Ğ'),
+    ('Ý', 'İ'), ('Þ', 'Ş'), ('ð', 'ğ'), ('ý', 'ı'), ('þ', 'ş'), ('Ð', 'Ğ'),
+)
+
+# RE2'nin \d / \s sınıflarının Python'dan farklı olduğu karakterler; bu değerler
+# Python fonksiyonlarıyla işlenir (sonuçlar birebir aynı kalır)
+_NON_ASCII_DIGIT = r'[^\x00-\x7f\P{Nd}]'
+_PYTHON_ONLY_SPACE = r'[\x{0b}\x{1c}-\x{1f}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}]'
+
+# Tutar: işaret, tam kısım ve ondalık kısım (gürültü temizlendikten sonra)
+_AMOUNT_PARTS = r'^(?P<sign>-?)(?P<whole>\d*)(?:\.(?P<fraction>\d*))?$'
+
+# int64'e taşmadan çevrilebilen en uzun tutar metni
+_MAX_AMOUNT_DIGITS = 17
+
+
+class PandasBackend:
+    """
+    Varsayılan motor: nesne (object) dizileri üzerinde, her benzersiz değere
+    bir kez uygulanan Python temizleme fonksiyonları.
+    """
+    
+    name = 'pandas'
+    
+    def mapped_text(self, df_raw, col):
+        """Eşlenen sütunu kırpılmış metne çevirir (boş hücreler ve null metinleri '')."""
+        return _mapped_text(df_raw, col)
+    
+    def clean_tc(self, tc_text):
+        """11 haneli TC'ler; geçersiz değerler ''."""
+        return _clean_tc_column(tc_text)
+    
+    def amount_kurus(self, amount_text):
+        """Tutarlar kuruş cinsinden (int64)."""
+        return _map_unique(amount_text, clean_amount_kurus, dtype=np.int64)
+    
+    def clean_names(self, name_text):
+        """Türkçe karakterleri düzeltilmiş adlar (null metinleri '')."""
+        return _map_unique(name_text, _clean_name)
+    
+    def split_full_names(self, full_name_text):
+        """Birleşik adı ad ve soyada ayırır, ikisini de düzeltir."""
+        return _split_full_names(full_name_text)
+
+
+class ArrowBackend(PandasBackend):
+    """
+    pyarrow.compute motoru: benzersiz değerler Arrow dizilerinde vektörel
+    temizlenir. Çekirdekler GIL'i bıraktığından büyük sütunlar parçalar
+    halinde eşzamanlı işlenir. Python'la birebir aynı sonucu garanti
+    edemediği nadir değerler (ASCII olmayan rakam/boşluk, çok uzun sayılar)
+    Python fonksiyonlarına bırakılır.
+    """
+    
+    name = 'arrow'
+    
+    def clean_tc(self, tc_text):
+        return _map_unique_arrow(tc_text, _tc_kernel)
+    
+    def amount_kurus(self, amount_text):
+        return _map_unique_arrow(amount_text, _amount_kernel)
+    
+    def clean_names(self, name_text):
+        return _map_unique_arrow(name_text, _name_kernel)
+    
+    def split_full_names(self, full_name_text):
+        return _map_unique_arrow(full_name_text, _split_kernel)
+
+
+BACKENDS = {
+    PandasBackend.name: PandasBackend,
+    ArrowBackend.name: ArrowBackend,
+}
+
+
+def get_backend(name=None):
+    """
+    Temizleme motorunu döndürür.
+    
+    Args:
+        name (str): Motor adı (None ise CEVIRICI_BACKEND / 'pandas')
+    
+    Returns:
+        PandasBackend: Motor nesnesi
+    """
+    name = name or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Bilinmeyen temizleme motoru: {name} (seçenekler: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+
+def _map_unique_arrow(values, kernel):
+    """Çekirdeği benzersiz değerlere (büyükse parçalar halinde eşzamanlı) uygular ve tüm satırlara yayar."""
+    codes, uniques = pd.factorize(values)
+    text = pa.array(uniques, type=pa.string())
+    
+    if len(text) <= ARROW_CHUNK_ROWS or (os.cpu_count() or 1) == 1:
+        results = [kernel(text)]
+    else:
+        parts = [text.slice(start, ARROW_CHUNK_ROWS) for start in range(0, len(text), ARROW_CHUNK_ROWS)]
+        with ThreadPoolExecutor(max_workers=min(len(parts), os.cpu_count())) as pool:
+            results = list(pool.map(kernel, parts))
+    
+    if isinstance(results[0], tuple):
+        return tuple(np.concatenate(columns)[codes] for columns in zip(*results))
+    return np.concatenate(results)[codes]
+
+
+def _python_fallback(result, text, mask, func):
+    """Maskeli değerleri Python fonksiyonuyla hesaplayıp sonuca yazar."""
+    mask = mask.to_numpy(zero_copy_only=False)
+    if mask.any():
+        result[mask] = [func(value) for value in text.filter(pa.array(mask)).to_pylist()]
+    return result
+
+
+def _tc_kernel(text):
+    """clean_tc_number'ın vektörel karşılığı (noktalı değerler Python'la işlenir)."""
+    digits = pc.replace_substring_regex(text, r'\D', '')
+    result = pc.if_else(pc.equal(pc.utf8_length(digits), 11), digits, '').to_numpy(zero_copy_only=False)
+    fallback = pc.or_(pc.match_substring(text, '.'), pc.match_substring_regex(text, _NON_ASCII_DIGIT))
+    return _python_fallback(result, text, fallback, clean_tc_number)
+
+
+def _amount_kernel(text):
+    """clean_amount_kurus'un vektörel karşılığı (ondalık yarım yukarı yuvarlama dahil)."""
+    # Son virgül son noktadan sonraysa Türkçe biçim (1.234,56), değilse İngilizce (1,234.56)
+    has_comma = pc.match_substring(text, ',')
+    turkish = pc.and_(has_comma, pc.match_substring_regex(text, r',[^.]*$'))
+    normalized = pc.if_else(
+        turkish,
+        pc.replace_substring(pc.replace_substring(text, '.', ''), ',', '.'),
+        pc.if_else(has_comma, pc.replace_substring(text, ',', ''), text)
+    )
+    normalized = pc.replace_substring_regex(normalized, r'[^\d.\-]', '')
+    
+    # Birden fazla nokta: son nokta ondalık ayracıdır
+    last_dot = pc.extract_regex(normalized, r'^(?P<head>.*)\.(?P<tail>[^.]*)$')
+    normalized = pc.if_else(
+        pc.greater(pc.count_substring(normalized, '.'), 1),
+        pc.binary_join_element_wise(
+            pc.replace_substring(pc.struct_field(last_dot, 'head'), '.', ''), pc.struct_field(last_dot, 'tail'), '.'
+        ),
+        normalized
+    )
+    
+    parts = pc.extract_regex(normalized, _AMOUNT_PARTS)
+    too_long = pc.greater(pc.utf8_length(normalized), _MAX_AMOUNT_DIGITS)
+    fraction = pc.struct_field(parts, 'fraction')
+    cents = pc.utf8_rpad(pc.utf8_slice_codeunits(fraction, 0, 2), 2, '0')
+    # Taşabilecek değerler Python'a bırakılır; çevrim hata vermesin diye '0' yazılır
+    digits = pc.if_else(too_long, '0', pc.binary_join_element_wise(pc.struct_field(parts, 'whole'), cents, ''))
+    magnitude = pc.add(
+        pc.cast(digits, pa.int64()),
+        pc.cast(pc.greater_equal(pc.utf8_slice_codeunits(fraction, 2, 3), '5'), pa.int64())
+    )
+    result = pc.if_else(pc.equal(pc.struct_field(parts, 'sign'), '-'), pc.negate(magnitude), magnitude)
+    result = pc.fill_null(result, 0).to_numpy(zero_copy_only=False).copy()
+    
+    fallback = pc.or_(pc.or_(pc.invert(pc.is_valid(parts)), too_long), pc.match_substring_regex(text, _NON_ASCII_DIGIT))
+    return _python_fallback(result, text, fallback, clean_amount_kurus)
+
+
+def _fix_names(text):
+    """Null metinlerini boşaltır ve bozuk Türkçe karakterleri düzeltir."""
+    text = pc.if_else(pc.is_in(text, value_set=pa.array(NULL_TOKENS)), '', text)
+    for bad, good in _TURKISH_FIXES:
+        text = pc.replace_substring(text, bad, good)
+    return text
+
+
+def _name_kernel(text):
+    """_clean_name'in vektörel karşılığı."""
+    return _fix_names(text).to_numpy(zero_copy_only=False)
+
+
+def _split_kernel(text):
+    """split_full_name + _clean_name'in vektörel karşılığı: son kelime soyad, kalanı ad."""
+    collapsed = pc.utf8_trim(pc.replace_substring_regex(text, r'\s+', ' '), ' ')
+    parts = pc.extract_regex(collapsed, r'^(?P<first>.*) (?P<last>[^ ]*)$')
+    has_space = pc.is_valid(parts)
+    first = pc.if_else(has_space, pc.struct_field(parts, 'first'), collapsed)
+    last = pc.if_else(has_space, pc.struct_field(parts, 'last'), '')
+    # split_full_name tam değeri null metni olan adı boş sayar
+    first = pc.if_else(pc.is_in(text, value_set=pa.array(NULL_TOKENS)), '', first)
+    
+    first_names = _fix_names(first).to_numpy(zero_copy_only=False)
+    last_names = _fix_names(last).to_numpy(zero_copy_only=False)
+    
+    fallback = pc.match_substring_regex(text, _PYTHON_ONLY_SPACE)
+    _python_fallback(first_names, text, fallback, lambda value: _clean_name(split_full_name(value)[0]))
+    _python_fallback(last_names, text, fallback, lambda value: _clean_name(split_full_name(value)[1]))
+    return first_names, last_names
@@ -0,0 +1,141 @@
+"""
+Sütun Bazlı Temizleme Önbelleği
+Bu modül, apply_column_mapping'in sütun bazındaki temizleme sonuçlarını
+(yükleme özeti, sütun, temizleyici) anahtarıyla bellekte tutar. Eşleştirme
+değiştiğinde yalnızca değişen alanlar yeniden temizlenir; diğer sütunlar
+önbellekten alınıp temiz liste yeniden birleştirilir.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from utils.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+
+# Önbelleğin bellek üst sınırı (MB, ortam değişkeni ile değiştirilebilir)
+DEFAULT_CACHE_MB = int(os.environ.get('CEVIRICI_COLUMN_CACHE_MB', '512'))
+
+# Yükleme özeti hesaplanırken okunan blok boyutu (byte)
+DIGEST_CHUNK_BYTES = 1024 * 1024
+
+# Nesne (metin) dizilerinde eleman başına tahmini bellek (işaretçi + kısa str)
+_OBJECT_ITEM_BYTES = 64
+
+
+def upload_digest(uploaded_files, *options):
+    """
+    Yüklenen dosyaların içerik özetini hesaplar (okuma seçenekleri dahil).
+    Aynı dosyalar aynı seçeneklerle tekrar yüklendiğinde aynı özet döner.
+    
+    Args:
+        uploaded_files (list): Dosya nesneleri
+        *options: Ham tabloyu etkileyen okuma seçenekleri (örn: tüm sayfalar)
+    
+    Returns:
+        str: Onaltılık özet
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for uploaded_file in uploaded_files:
+        digest.update(uploaded_file.name.encode('utf-8') + b'\0')
+        uploaded_file.seek(0)
+        for block in iter(lambda: uploaded_file.read(DIGEST_CHUNK_BYTES), b''):
+            digest.update(block)
+        uploaded_file.seek(0)
+        digest.update(b'\0')
+    digest.update(repr(options).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _estimate_bytes(value):
+    """Önbellek değerinin yaklaşık bellek boyutu (dizi, demet veya skaler)."""
+    if isinstance(value, tuple):
+        return sum(_estimate_bytes(item) for item in value)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return len(value) * _OBJECT_ITEM_BYTES
+        return value.nbytes
+    return 64
+
+
+def _freeze(value):
+    """Önbellekteki dizilerin yanlışlıkla değiştirilmesini engeller."""
+    if isinstance(value, tuple):
+        for item in value:
+            _freeze(item)
+    elif isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    return value
+
+
+class ColumnCache:
+    """
+    Boyut sınırlı LRU önbellek. Arka plan işleri ayrı thread'lerde çalıştığı
+    için erişim kilitle korunur; aynı anahtar eşzamanlı hesaplanırsa ilk
+    yazılan sonuç korunur.
+    
+    Args:
+        max_mb (int): Bellek üst sınırı (MB)
+    """
+    
+    def __init__(self, max_mb=DEFAULT_CACHE_MB):
+        self.max_bytes = max_mb * 1024 * 1024
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    @property
+    def size_bytes(self):
+        return self._size
+    
+    def get_or_compute(self, key, compute):
+        """
+        Anahtarın değerini döndürür; önbellekte yoksa hesaplayıp saklar.
+        
+        Args:
+            key (tuple): Önbellek anahtarı
+            compute (callable): Değeri üreten parametresiz fonksiyon
+        
+        Returns:
+            Önbellekteki (salt okunur) değer
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        
+        # Hesaplama kilit dışında yapılır (uzun sürebilir)
+        value = _freeze(compute())
+        size = _estimate_bytes(value)
+        
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key][0]
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+        return value
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Uygulama genelinde paylaşılan önbellek
+COLUMN_CACHE = ColumnCache()
@@ -3,8 +3,75 @@ Veri İşleme Yardımcı Fonksiyonlar
 Bu modül, dosya okuma, karakter düzeltme ve veri temizleme işlemlerini içerir.
 """
 
-import pandas as pd
+import codecs
+import csv
 import re
+from collections import Counter
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+from utils.column_cache import COLUMN_CACHE
+from utils.error_log import ErrorLog, ERROR_MISSING_TC, ERROR_INVALID_TC, ERROR_MISSING_COLUMN, ERROR_INVALID_AMOUNT
+from utils.lazy_imports import lazy_import
+from utils.money import AMOUNT_COLUMN, total_kurus
+from utils.name_matching import MATCH_SCORE_COLUMN
+from utils.page_rows import count_page_rows, detect_page_rows
+from utils.spooled_upload import local_path, mapped, path_or_buffer, release_pages
+
+# pandas/numpy ilk kullanımda yüklenir; format kütüphaneleri (openpyxl, xlrd)
+# yalnızca ilgili format okunurken içe aktarılır
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# Metin dosyalarında sırayla denenen kodlamalar
+TEXT_ENCODINGS = ['cp1254', 'utf-8', 'iso-8859-9', 'latin-1']
+
+# Kodlama kontrolünde eşlenmiş dosyadan bir seferde çözülen blok (byte)
+DECODE_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Başlangıç satırı tespitinde okunan dosya başı bloğu (byte)
+HEAD_CHUNK_BYTES = 64 * 1024
+
+# Başlık tespitinde metin dosyalarından okunan en fazla byte (dosya boyutundan bağımsız)
+HEADER_SCAN_BYTES = 256 * 1024
+
+# Salt okunur Excel akışında tek seferde tabloya çevrilen satır sayısı
+XLSX_CHUNK_ROWS = 50000
+
+# Başlık tespiti: 11 haneli TC dizisi, sayısal hücre (rakam, nokta, virgül) ve
+# başlık satırlarında geçen alan adları (küçük harfe çevrilmiş hücrede aranır)
+_TC_RUN = re.compile(r'\d{11}')
+_NUMERIC_CELL = re.compile(r'[\d.,]*\d[\d.,]*')
+_HEADER_WORD = re.compile(
+    r'(?<!\w)(?:t\.?c\.?|kimlik|ad[ıi]?|soyad[ıi]?|isim|[üu]ye|sicil|s[ıi]ra|no|numaras[ıi]'
+    r'|tutar[ıi]?|aidat|kesinti|miktar[ıi]?|ücret)(?!\w)'
+)
+
+# Başlık etiketinden alan önerisi (ad alanları tam eşleşmeli, diğerleri içerik araması)
+_NAME_FIELDS = ('full_name', 'first_name', 'last_name')
+_LABEL_PATTERNS = {
+    'tc_no': re.compile(r'(?<!\w)t\.?c\.?(?![a-zçğıöşü])|kimlik'),
+    'amount': re.compile(r'tutar|aidat|kesinti|miktar|ücret'),
+    'member_no': re.compile(r'[üu]ye|sicil|s[ıi]ra'),
+    'full_name': re.compile(r'(?:ad[ıi]?|isim)\s*[-/]?\s*(?:soyad[ıi]?|soyisim)'),
+    'first_name': re.compile(r'ad[ıi]?|isim|[üu]ye ad[ıi]'),
+    'last_name': re.compile(r'soyad[ıi]?|soyisim|[üu]ye soyad[ıi]'),
+}
+
+# Tutar metninde rakam, nokta ve eksi dışındaki karakterler
+_AMOUNT_NOISE = re.compile(r'[^\d.\-]')
+
+# Kuruş yuvarlaması için birim
+_ONE = Decimal(1)
+
+# Kuruş tutarlarının sınırları (int64). Aşan değerler (örn: tutar diye eşleştirilmiş
+# IBAN) geçersiz tutardır; bu değerlerin metni en az 17 karakterdir
+KURUS_MIN = -2 ** 63
+KURUS_MAX = 2 ** 63 - 1
+_KURUS_MAX_TEXT = 17
+
+# Sayfa XML'indeki birleşik hücre tanımı (<mergeCell ref="..."/>)
+_MERGE_CELL_TAG = re.compile(rb'<(?:\w+:)?mergeCell[\s/>]')
 
 
 def fix_turkish_chars(text):
@@ -33,14 +100,289 @@ def fix_turkish_chars(text):
     return text
 
 
-def read_file_with_encoding(uploaded_file, skip_rows=0):
+def list_excel_sheets(uploaded_file):
+    """
+    Excel dosyasındaki sayfa isimlerini listeler.
+    
+    Args:
+        uploaded_file: Streamlit file uploader objesi
+    
+    Returns:
+        list: Sayfa isimleri (Excel değilse boş liste)
+    """
+    if not (uploaded_file.name.endswith('.xlsx') or uploaded_file.name.endswith('.xls')):
+        return []
+    
+    try:
+        uploaded_file.seek(0)
+        with pd.ExcelFile(path_or_buffer(uploaded_file)) as xls:
+            sheet_names = list(xls.sheet_names)
+        uploaded_file.seek(0)
+        return sheet_names
+    except Exception:
+        uploaded_file.seek(0)
+        return []
+
+
+def compact_rows_left(df):
+    """
+    Birleşik hücre kaymasını vektörel olarak düzeltir: her satırdaki dolu hücreleri
+    sıralarını koruyarak sola kaydırır ve aynı geçişte satır uzunluklarının moduna
+    göre kısa (başlık/metadata) satırları eler.
+    
+    Args:
+        df (pd.DataFrame): Ham veri
+    
+    Returns:
+        pd.DataFrame: Sola kaydırılmış ve filtrelenmiş veri (df.attrs korunur)
+    """
+    if df.empty:
+        return df
+    
+    values = df.to_numpy(dtype=object)
+    filled = ~pd.isna(values)
+    
+    # Kararlı argsort: dolu hücreler öne gelir, kendi aralarındaki sıra korunur
+    order = np.argsort(~filled, axis=1, kind='stable')
+    compacted = np.take_along_axis(values, order, axis=1)
+    
+    row_lengths = filled.sum(axis=1)
+    compacted[np.arange(values.shape[1]) >= row_lengths[:, None]] = np.nan
+    
+    # Kısa satırları filtrele (başlık/metadata): en sık görülen uzunluğun yarısından kısa olanlar
+    expected = int(np.bincount(row_lengths).argmax())
+    min_len = max(expected // 2, 3)
+    keep = row_lengths >= min_len
+    
+    width = int(row_lengths.max())
+    result = pd.DataFrame(compacted[keep, :width])
+    result.attrs.update(df.attrs)
+    return result
+
+
+def _read_xls(uploaded_file, skip_rows=0, sheet_name=None, max_rows=None):
+    """
+    Eski .xls dosyalarını okur; çok sayıda boş hücre varsa birleşik hücre
+    kaymasını vektörel sola kaydırma ile düzeltir.
+    
+    Args:
+        uploaded_file: Streamlit file uploader objesi
+        skip_rows (int): Atlanacak başlangıç satır sayısı
+        sheet_name (str): Okunacak sayfa (None ise ilk sayfa)
+        max_rows (int): En fazla okunacak satır (None ise tümü)
+    
+    Returns:
+        pd.DataFrame: Ham veri; attrs['rows_read'] sola kaydırmadan önce okunan satır sayısıdır
+    """
+    df = pd.read_excel(path_or_buffer(uploaded_file), header=None, dtype=str, skiprows=skip_rows,
+                       sheet_name=sheet_name if sheet_name is not None else 0, nrows=max_rows)
+    df.attrs['rows_read'] = len(df)
+    
+    # xls dosyalarında da birleşik hücre kayması olabilir
+    # Çok sayıda boş sütun varsa shift-left uygula
+    empty_ratio = df.isna().mean().mean()
+    if empty_ratio > 0.5:
+        df = compact_rows_left(df)
+    
+    return df
+
+
+def _sheet_has_merged_cells(ws):
+    """
+    Salt okunur sayfada birleşik hücre olup olmadığını sayfa XML'ini akışla
+    tarayarak bulur (read-only modda merged_cells bilgisi yüklenmez).
+    
+    Args:
+        ws: openpyxl ReadOnlyWorksheet
+    
+    Returns:
+        bool: Birleşik hücre varsa True
+    """
+    tail = b''
+    with ws._get_source() as source:
+        while True:
+            block = source.read(DECODE_CHUNK_BYTES)
+            if not block:
+                return False
+            # Blok sınırına denk gelen etiketi kaçırmamak için önceki bloğun sonunu ekle
+            if _MERGE_CELL_TAG.search(tail + block):
+                return True
+            tail = block[-32:]
+
+
+def _rows_to_frame(rows):
+    """
+    Satır listesini metin tablosuna çevirir. Satırlar en uzun satıra göre None
+    ile tamamlanır; tablo önce object olarak kurulur, böylece tam sayılar boş
+    hücrelerle aynı sütunda float'a (örn: "25250132516.0") dönüşmez.
+    
+    Args:
+        rows (list): Hücre değerleri listeleri
+    
+    Returns:
+        pd.DataFrame: Ham veri (metin)
+    """
+    max_cols = max((len(row) for row in rows), default=0)
+    for row in rows:
+        if len(row) < max_cols:
+            row.extend([None] * (max_cols - len(row)))
+    return pd.DataFrame(rows, dtype=object).astype(str)
+
+
+def _read_xlsx(uploaded_file, skip_rows=0, sheet_name=None, max_rows=None):
+    """
+    .xlsx dosyalarını openpyxl'in salt okunur (akış) modunda okur; birleşik hücre
+    varsa boşlukları kaldırarak satırları sola kaydırır. Satırlar bloklar halinde
+    tabloya çevrildiğinden bellekte tüm sayfanın hücre nesneleri tutulmaz.
+    
+    Args:
+        uploaded_file: Streamlit file uploader objesi
+        skip_rows (int): Atlanacak başlangıç satır sayısı
+        sheet_name (str): Okunacak sayfa (None ise aktif sayfa)
+        max_rows (int): En fazla okunacak dolu satır (None ise tümü)
+    
+    Returns:
+        pd.DataFrame: Ham veri; attrs['rows_read'] ayıklamadan önce okunan dolu satır sayısıdır
+    """
+    from openpyxl import load_workbook
+    
+    uploaded_file.seek(0)
+    wb = load_workbook(path_or_buffer(uploaded_file), read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name is not None else wb.active
+        
+        # Bazı üreticiler yanlış boyut (dimension) yazar: satırları sonuna kadar oku
+        ws.reset_dimensions()
+        has_merged = _sheet_has_merged_cells(ws)
+        
+        chunks = []
+        rows = []
+        row_lengths = []
+        for row in ws.iter_rows(min_row=skip_rows + 1, values_only=True):
+            if has_merged:
+                # Birleşik hücreli dosyalarda: None boşluklarını
+                # kaldırarak sola kaydır (shift-left)
+                # Bu, çok sayfalı Excel'lerde sütun kaymasını düzeltir
+                compacted = []
+                for v in row:
+                    if v is None:
+                        continue
+                    # Float'ları tam sayıya çevir (ondalık kısmı yoksa)
+                    if isinstance(v, float) and v == int(v) and v == v:
+                        compacted.append(int(v))
+                    else:
+                        compacted.append(v)
+            else:
+                # Birleşik hücre yoksa: orijinal yapıyı koru
+                # Sadece float→int dönüşümü yap
+                compacted = []
+                for v in row:
+                    if v is not None and isinstance(v, float) and v == int(v) and v == v:
+                        compacted.append(int(v))
+                    else:
+                        compacted.append(v)
+            
+            # Tamamen boş satırları atla
+            if any(v is not None for v in compacted):
+                rows.append(compacted)
+                row_lengths.append(len(compacted))
+                if len(rows) >= XLSX_CHUNK_ROWS:
+                    chunks.append(_rows_to_frame(rows))
+                    rows = []
+                if max_rows is not None and len(row_lengths) >= max_rows:
+                    break
+    finally:
+        wb.close()
+    
+    # Bloklar arasında genişlik farklıysa eksik sütunlar NaN ile tamamlanır
+    if rows or not chunks:
+        chunks.append(_rows_to_frame(rows))
+    df = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+    
+    # Birleşik hücreli dosyalarda: tekrarlanan başlık/metadata
+    # satırlarını otomatik filtrele (veri satırlarından kısa olanlar)
+    if has_merged and row_lengths:
+        expected_length = Counter(row_lengths).most_common(1)[0][0]
+        min_length = max(expected_length // 2, 3)
+        df = df[np.asarray(row_lengths) >= min_length].reset_index(drop=True)
+    
+    df.attrs['rows_read'] = len(row_lengths)
+    return df
+
+
+def _decodes_cleanly(data, encoding):
+    """
+    İçeriğin verilen kodlamayla hatasız çözülüp çözülmediğini bloklar halinde
+    kontrol eder (dosyanın tamamı metne çevrilip bellekte tutulmaz).
+    
+    Args:
+        data (mmap.mmap veya bytes): Dosya içeriği
+        encoding (str): Kodlama adı
+    
+    Returns:
+        bool: Hatasız çözülürse True
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        for start in range(0, len(data), DECODE_CHUNK_BYTES):
+            decoder.decode(data[start:start + DECODE_CHUNK_BYTES])
+            release_pages(data, start, DECODE_CHUNK_BYTES)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _line_start(data, line_index):
+    """line_index numaralı satırın başladığı byte konumunu döndürür (satır yoksa içerik uzunluğu)."""
+    position = 0
+    for _ in range(line_index):
+        newline = data.find(b'\n', position)
+        if newline < 0:
+            return len(data)
+        position = newline + 1
+    return position
+
+
+def _read_text(path, encoding, separator, skip_rows=0, max_rows=None):
+    """
+    Metin dosyasını diskten akışla C motoruyla ayrıştırır; C motorunun reddettiği
+    dosyalarda Python motoruna düşer. Ayrıştırma boyunca dosya eşlenmiş tutulmaz
+    (okunan sayfalar süreç belleğinde kalır ve tepe belleği dosya boyutu kadar artırır).
+    
+    Args:
+        path (str): Dosya yolu
+        encoding (str): Kodlama
+        separator (str): Ayırıcı
+        skip_rows (int): Atlanacak başlangıç satır sayısı
+        max_rows (int): En fazla okunacak satır (None ise tümü)
+    
+    Returns:
+        pd.DataFrame: Ham veri
+    """
+    try:
+        return pd.read_csv(path, sep=separator, header=None, dtype=str, encoding=encoding,
+                           skiprows=skip_rows, nrows=max_rows)
+    except (pd.errors.ParserError, pd.errors.EmptyDataError):
+        return pd.read_csv(path, sep=separator, header=None, dtype=str, encoding=encoding,
+                           skiprows=skip_rows, nrows=max_rows, engine='python')
+
+
+def read_file_with_encoding(uploaded_file, skip_rows=0, sheet_name=None, max_rows=None):
     """
     Yüklenen dosyayı uygun encoding ile okur.
     Excel ve metin dosyalarını destekler.
     
+    max_rows verilirse yalnızca dosyanın baş kısmı okunur (önizleme); metin
+    dosyalarında kodlama da yalnızca okunan kısımdan tespit edilir. Boş ve
+    başlık satırları ayıklanmadan önce okunan satır sayısı attrs['rows_read']
+    içinde döner (önizlemenin dosya sonuna ulaşıp ulaşmadığı buradan anlaşılır).
+    
     Args:
         uploaded_file: Streamlit file uploader objesi
         skip_rows (int): Atlanacak başlangıç satır sayısı
+        sheet_name (str): Okunacak Excel sayfası (None ise aktif/ilk sayfa)
+        max_rows (int): En fazla okunacak veri satırı (None ise tümü)
     
     Returns:
         pd.DataFrame: Ham veri DataFrame'i
@@ -52,89 +394,15 @@ def read_file_with_encoding(uploaded_file, skip_rows=0):
             # İlk olarak openpyxl ile merged cell bilgisini alalım (sadece .xlsx için)
             if uploaded_file.name.endswith('.xlsx'):
                 try:
-                    from openpyxl import load_workbook
-                    from io import BytesIO
-                    
-                    # Dosyayı oku
-                    uploaded_file.seek(0)
-                    wb = load_workbook(BytesIO(uploaded_file.read()), data_only=True)
-                    ws = wb.active
-                    
-                    # Merged cell kontrolü
-                    merged_ranges = list(ws.merged_cells.ranges)
-                    has_merged = len(merged_ranges) > 0
-                    
-                    # Merged cell'leri çöz (değerler sadece sol üst hücrede kalır)
-                    for merged_range in merged_ranges:
-                        ws.unmerge_cells(str(merged_range))
-                    
-                    data = []
-                    for row in ws.iter_rows(min_row=skip_rows + 1, values_only=True):
-                        if has_merged:
-                            # Birleşik hücreli dosyalarda: None boşluklarını
-                            # kaldırarak sola kaydır (shift-left)
-                            # Bu, çok sayfalı Excel'lerde sütun kaymasını düzeltir
-                            compacted = []
-                            for v in row:
-                                if v is None:
-                                    continue
-                                # Float'ları tam sayıya çevir (ondalık kısmı yoksa)
-                                if isinstance(v, float) and v == int(v) and v == v:
-                                    compacted.append(int(v))
-                                else:
-                                    compacted.append(v)
-                        else:
-                            # Birleşik hücre yoksa: orijinal yapıyı koru
-                            # Sadece float→int dönüşümü yap
-                            compacted = []
-                            for v in row:
-                                if v is not None and isinstance(v, float) and v == int(v) and v == v:
-                                    compacted.append(int(v))
-                                else:
-                                    compacted.append(v)
-                        
-                        # Tamamen boş satırları atla
-                        if any(v is not None for v in compacted):
-                            data.append(compacted)
-                    
-                    # Birleşik hücreli dosyalarda: tekrarlanan başlık/metadata
-                    # satırlarını otomatik filtrele (veri satırlarından kısa olanlar)
-                    if has_merged and data:
-                        from collections import Counter
-                        lengths = Counter(len(r) for r in data)
-                        expected_length = lengths.most_common(1)[0][0]
-                        min_length = max(expected_length // 2, 3)
-                        data = [r for r in data if len(r) >= min_length]
-                    
-                    # Tüm satırları aynı uzunluğa getir (en uzun satıra göre)
-                    max_cols = max((len(r) for r in data), default=0)
-                    for row in data:
-                        while len(row) < max_cols:
-                            row.append(None)
-                    
-                    df = pd.DataFrame(data, dtype=str)
-                    
-                    wb.close()
-                    
+                    df = _read_xlsx(uploaded_file, skip_rows, sheet_name, max_rows)
                 except Exception as e:
                     # openpyxl başarısız olursa normal pandas ile oku
                     uploaded_file.seek(0)
-                    df = pd.read_excel(uploaded_file, header=None, dtype=str, skiprows=skip_rows)
+                    df = pd.read_excel(path_or_buffer(uploaded_file), header=None, dtype=str, skiprows=skip_rows,
+                                       sheet_name=sheet_name if sheet_name is not None else 0, nrows=max_rows)
             else:
-                # .xls dosyaları için normal okuma
-                df = pd.read_excel(uploaded_file, header=None, dtype=str, skiprows=skip_rows)
-                
-                # xls dosyalarında da birleşik hücre kayması olabilir
-                # Çok sayıda boş sütun varsa shift-left uygula
-                empty_ratio = df.isna().mean().mean()
-                if empty_ratio > 0.5:
-                    df = df.apply(lambda x: pd.Series(x.dropna().values), axis=1)
-                    # Kısa satırları filtrele (başlık/metadata)
-                    row_lengths = df.notna().sum(axis=1)
-                    if len(row_lengths) > 0 and not row_lengths.mode().empty:
-                        expected = int(row_lengths.mode().iloc[0])
-                        min_len = max(expected // 2, 3)
-                        df = df[row_lengths >= min_len].reset_index(drop=True)
+                df = _read_xls(uploaded_file, skip_rows, sheet_name, max_rows)
+            rows_read = df.attrs.get('rows_read', len(df))
             
             # None değerlerini NaN'a çevir (openpyxl'den gelen)
             df = df.replace(['None', 'none', ''], pd.NA)
@@ -148,37 +416,38 @@ def read_file_with_encoding(uploaded_file, skip_rows=0):
             # Sütun numaralarını yeniden düzenle
             df.columns = range(len(df.columns))
             
+            df.attrs['rows_read'] = rows_read
             return df
         except Exception as e:
             raise ValueError(f"Excel okuma hatası: {e}")
     
-    # Metin dosyası (CSV/TXT) için encoding denemeleri
-    raw_bytes = uploaded_file.getvalue()
-    
-    encodings = ['cp1254', 'utf-8', 'iso-8859-9', 'latin-1']
-    
-    for enc in encodings:
-        try:
-            string_data = raw_bytes.decode(enc)
-            
-            # Atlanacak satırları çıkar
-            if skip_rows > 0:
-                lines = string_data.split('\n')
-                string_data = '\n'.join(lines[skip_rows:])
+    # Metin dosyası (CSV/TXT): bellekteki yüklemeler önce diske akıtılır,
+    # kodlama ve ayırıcı eşlenmiş dosyadan tespit edilip doğrudan dosyadan ayrıştırılır
+    with local_path(uploaded_file) as path, mapped(path) as data:
+        # Önizlemede kodlama yalnızca okunacak satırlardan tespit edilir
+        checked = data if max_rows is None else data[:_line_start(data, skip_rows + max_rows)]
+        for enc in TEXT_ENCODINGS:
+            if not _decodes_cleanly(checked, enc):
+                continue
             
-            # Ayırıcıyı tespit et
-            if ';' in string_data.split('\n')[0]:
+            # Ayırıcıyı atlanan satırlardan sonraki ilk satırdan tespit et
+            start = _line_start(data, skip_rows)
+            end = data.find(b'\n', start)
+            first_line = data[start:end if end >= 0 else len(data)].decode(enc)
+            if ';' in first_line:
                 separator = ';'
-            elif ',' in string_data.split('\n')[0]:
+            elif ',' in first_line:
                 separator = ','
-            elif '\t' in string_data.split('\n')[0]:
+            elif '\t' in first_line:
                 separator = '\t'
             else:
                 separator = ','
             
-            # DataFrame'e dönüştür
-            from io import StringIO
-            df = pd.read_csv(StringIO(string_data), sep=separator, header=None, dtype=str, engine='python')
+            try:
+                df = _read_text(path, enc, separator, skip_rows, max_rows)
+            except Exception:
+                continue
+            rows_read = len(df)
             
             # Tamamen boş satırları temizle
             df = df.dropna(how='all').reset_index(drop=True)
@@ -187,34 +456,30 @@ def read_file_with_encoding(uploaded_file, skip_rows=0):
             # Sütun numaralarını yeniden düzenle
             df.columns = range(len(df.columns))
             
+            df.attrs['rows_read'] = rows_read
             return df
-            
-        except UnicodeDecodeError:
-            continue
-        except Exception:
-            continue
     
     raise ValueError("Dosya okunamadı. Desteklenen formatlar: CSV, TXT, XLSX, XLS")
 
 
-def clean_amount_value(value):
+def _normalize_amount_text(value):
     """
-    Tutar değerini temizler ve sayıya çevirir.
+    Ham tutarı "1234.56" biçiminde sade ondalık metne çevirir.
     
     Args:
         value (str): Ham tutar değeri
     
     Returns:
-        float: Temizlenmiş tutar
+        str: Sadece rakam, nokta ve eksi işareti içeren metin (tutar yoksa '')
     """
     if pd.isna(value) or value == "" or value is None:
-        return 0.0
+        return ''
     
     value_str = str(value).strip()
     
     # Boş string kontrolü
     if not value_str or value_str in ['None', 'nan', 'NaN', 'null', '-']:
-        return 0.0
+        return ''
     
     # Tırnak işaretlerini temizle
     value_str = value_str.replace('"', '').replace("'", "").strip()
@@ -247,7 +512,7 @@ def clean_amount_value(value):
     # Sadece nokta varsa zaten doğru format
     
     # Sadece sayı, nokta ve eksi işareti bırak
-    value_str = re.sub(r'[^\d.\-]', '', value_str)
+    value_str = _AMOUNT_NOISE.sub('', value_str)
     
     # Birden fazla nokta varsa (örn: 1.234.567) son noktayı ondalık olarak kabul et
     if value_str.count('.') > 1:
@@ -256,14 +521,75 @@ def clean_amount_value(value):
     
     # Boş string kontrolü
     if not value_str or value_str == '.' or value_str == '-':
-        return 0.0
+        return ''
+    
+    return value_str
+
+
+def clean_amount_value(value):
+    """
+    Tutar değerini temizler ve sayıya çevirir.
+    
+    Args:
+        value (str): Ham tutar değeri
     
+    Returns:
+        float: Temizlenmiş tutar
+    """
     try:
-        return float(value_str)
+        return float(_normalize_amount_text(value))
     except ValueError:
         return 0.0
 
 
+def clean_amount_kurus(value):
+    """
+    Tutar değerini temizler ve kuruş cinsinden tam sayıya çevirir. Dönüşüm
+    ondalık metin üzerinden yapılır (float yuvarlama hatası olmaz); ikiden
+    fazla ondalık basamak yarım yukarı yuvarlanır.
+    
+    Args:
+        value (str): Ham tutar değeri
+    
+    Returns:
+        int: Kuruş cinsinden tutar (int64 aralığını aşan tutarlar 0; bkz. amount_out_of_range)
+    """
+    kurus = _parse_kurus(value)
+    return kurus if KURUS_MIN <= kurus <= KURUS_MAX else 0
+
+
+def amount_out_of_range(value):
+    """
+    Tutar kuruş cinsinden int64 aralığını aşıyor mu? (örn: tutar diye eşleştirilmiş IBAN)
+    
+    Args:
+        value (str): Ham tutar değeri
+    
+    Returns:
+        bool: Aşıyorsa True
+    """
+    return not KURUS_MIN <= _parse_kurus(value) <= KURUS_MAX
+
+
+def _parse_kurus(value):
+    """Ham tutarı kuruş cinsinden (sınırsız) tam sayıya çevirir; tutar değilse 0."""
+    value_str = _normalize_amount_text(value)
+    
+    # Hızlı yol: en fazla iki ondalık basamak doğrudan tam sayıya çevrilir ("12.5" -> 1250)
+    whole, _, fraction = value_str.partition('.')
+    if len(fraction) <= 2 and (not fraction or fraction.isdigit()):
+        try:
+            return int(whole + fraction.ljust(2, '0'))
+        except ValueError:
+            return 0
+    
+    try:
+        amount = Decimal(value_str)
+    except InvalidOperation:
+        return 0
+    return int(amount.scaleb(2).quantize(_ONE, rounding=ROUND_HALF_UP))
+
+
 def split_full_name(full_name):
     """
     Tam adı (Ad Soyad) ayrı ayrı ad ve soyad olarak ayırır.
@@ -327,181 +653,579 @@ def clean_tc_number(value):
     return ""
 
 
-def apply_column_mapping(df_raw, column_mapping):
+# Eşleştirmede boş kabul edilen metin değerleri
+NULL_TOKENS = ['None', 'nan', 'NaN']
+
+def _mapped_text(df_raw, col):
+    """Eşlenen sütunu kırpılmış metne çevirir; boş hücreler ve null metinleri '' olur."""
+    series = df_raw[col]
+    text = series.astype(str).str.strip().where(series.notna(), '')
+    return text.where(~text.isin(NULL_TOKENS), '').to_numpy(dtype=object)
+
+
+def _map_unique(values, func, dtype=object):
+    """Fonksiyonu yalnızca benzersiz değerlere uygular ve sonucu tüm satırlara yayar."""
+    codes, uniques = pd.factorize(values)
+    mapped = np.array([func(value) for value in uniques], dtype=dtype)
+    return mapped[codes] if len(mapped) else np.empty(len(values), dtype=dtype)
+
+
+def _amount_out_of_range_column(amount_text):
+    """Kuruş aralığını aşan tutarların maskesi; yalnızca uzun metinler ayrıştırılır."""
+    candidates = pd.Series(amount_text, dtype=object).str.len().to_numpy() >= _KURUS_MAX_TEXT
+    out_of_range = np.zeros(len(amount_text), dtype=bool)
+    if candidates.any():
+        out_of_range[candidates] = _map_unique(amount_text[candidates], amount_out_of_range, dtype=bool)
+    return out_of_range
+
+
+def _clean_tc_column(tc_text):
+    """TC sütununu vektörel temizler; noktalı (float biçimli) değerler eski fonksiyonla işlenir."""
+    text = pd.Series(tc_text, dtype=object)
+    digits = text.str.replace(r'\D', '', regex=True)
+    cleaned = digits.where(digits.str.len() == 11, '').to_numpy(dtype=object, copy=True)
+    
+    has_dot = text.str.contains('.', regex=False).to_numpy(dtype=bool)
+    if has_dot.any():
+        cleaned[has_dot] = [clean_tc_number(value) for value in tc_text[has_dot]]
+    return cleaned
+
+
+def _neighbour_amounts(amounts, labels):
+    """
+    Her satır için bir önceki ve bir sonraki satırın pozitif tutarını döndürür
+    (Excel'deki birleşik hücre kayması sorununu çözmek için). Komşu satır
+    indeks etiketine göre bulunur; pozitif tutar yoksa 0 döner (tam sayı
+    kalır, büyük kuruş değerleri float'a çevrilip hassasiyet kaybetmez).
+    """
+    lookup = pd.Series(amounts, index=labels)
+    lookup = lookup[lookup > 0]
+    previous = lookup.reindex(labels - 1, fill_value=0).to_numpy(dtype=np.int64)
+    following = lookup.reindex(labels + 1, fill_value=0).to_numpy(dtype=np.int64)
+    return previous, following
+
+
+def _clean_name(value):
+    """Ad/soyad değerini düzeltir (null metinleri boş olur)."""
+    return '' if value in NULL_TOKENS else fix_turkish_chars(value)
+
+
+def _shifted_amounts(amounts, labels, empty, page_rows=None):
+    """
+    Kuruş cinsinden tutarlarda boş/sıfır tutarı komşu satırdan alır.
+    Sayfa başlığı/altlığı/toplamı satırlarının tutarları sıfırlanır; sayfa
+    toplamları komşu veri satırlarına kaydırılmaz.
+    
+    Returns:
+        tuple: (np.ndarray: Kuruş tutarları, int: Komşudan alınan tutar sayısı)
+    """
+    skip = empty
+    if page_rows is not None:
+        amounts = np.where(page_rows, 0, amounts)
+        skip = empty | page_rows
+    previous, following = _neighbour_amounts(amounts, labels)
+    needs_shift = (amounts == 0) & ~skip
+    from_previous = needs_shift & (previous > 0)
+    from_following = needs_shift & ~from_previous & (following > 0)
+    amounts = np.where(from_previous, previous, np.where(from_following, following, amounts)).astype(np.int64)
+    return amounts, int(from_previous.sum() + from_following.sum())
+
+
+def _split_full_names(full_name_text):
+    """Birleşik ad sütununu ayırır ve iki parçayı da düzeltir."""
+    pairs = _map_unique(full_name_text, split_full_name)
+    first_names = np.array([pair[0] for pair in pairs], dtype=object)
+    last_names = np.array([pair[1] for pair in pairs], dtype=object)
+    return _map_unique(first_names, _clean_name), _map_unique(last_names, _clean_name)
+
+
+def apply_column_mapping(df_raw, column_mapping, sources=None, progress_callback=None, cache_key=None,
+                         reference=None, backend=None):
     """
     Kullanıcının yaptığı sütun eşleştirmesine göre veriyi işler.
+    Tüm adımlar sütun bazında vektörel çalışır; elenen satırlar konum, hata
+    kodu ve ham değerleriyle stats['error_log'] (ErrorLog) içinde döner.
+    
+    cache_key verilirse sütun bazındaki temizleme sonuçları (cache_key, motor, sütun,
+    temizleyici) anahtarıyla önbelleğe alınır; aynı ham veride eşleştirme
+    değiştiğinde yalnızca yeni eşlenen sütunlar temizlenir.
+    
+    Basılı raporlardan gelen sayfa başlığı, altlığı ve ara toplam satırları
+    temizlemeden önce ayıklanır (bkz. utils/page_rows.py); bu satırlar hata
+    raporuna girmez, türe göre sayıları stats['page_rows_by_type'] içinde döner.
+    
+    reference verilirse TC'si eksik/geçersiz satırlar ad, soyad ve üye no ile
+    referans üye listesinde aranır (bkz. utils/name_matching.py); eşleşenler
+    listedeki TC ile temiz listeye girer, skorları "Eşleşme Skoru" sütununda,
+    sayıları stats['recovered_rows'] içinde döner.
+    
+    int64 kuruş aralığını aşan tutarlı satırlar ERROR_INVALID_AMOUNT ile elenir
+    ve stats['invalid_amount'] içinde sayılır. Sayaçlar satırları paylaşmaz:
+    processed_rows + invalid_tc + invalid_amount + empty_rows + page_rows +
+    skipped_rows = total_rows.
+    
+    Sütun temizleme çekirdekleri (TC, tutar, isim) seçilen motorda çalışır
+    (bkz. utils/cleaning_backends.py); motorlar aynı sonucu verir.
     
     Args:
         df_raw (pd.DataFrame): Ham veri
         column_mapping (dict): Sütun eşleştirme haritası
+        sources (list): Birleşik veride kaynak aralıkları [(etiket, başlangıç, bitiş), ...]
+        progress_callback (callable): İlerleme bildirimi, progress_callback(oran, mesaj)
+        cache_key (str): Ham verinin kimliği (örn: yükleme özeti); None ise önbellek kullanılmaz
+        reference (MemberIndex): İsimle eşleştirme için üye listesi dizini; None ise eşleştirme yapılmaz
+        backend (str): Temizleme motoru ('pandas', 'arrow'; None ise CEVIRICI_BACKEND)
     
     Returns:
         tuple: (pd.DataFrame: Temizlenmiş veri, dict: İşlem istatistikleri)
     """
     
-    processed_data = []
+    # Çok kaynaklı veri: her kaynak ayrı işlenir (tutar kaydırması kaynak sınırını aşmasın)
+    if sources:
+        return _apply_mapping_per_source(df_raw, column_mapping, sources, progress_callback, cache_key, reference,
+                                         backend)
+    
+    # Motorlar bu modülün temizleme fonksiyonlarını kullandığından burada yüklenir
+    from utils.cleaning_backends import get_backend
+    engine = get_backend(backend)
+    
+    def report(fraction, message):
+        if progress_callback is not None:
+            progress_callback(fraction, message)
+    
+    def cached(compute, *key):
+        if cache_key is None:
+            return compute()
+        return COLUMN_CACHE.get_or_compute((cache_key, engine.name) + key, compute)
+    
     stats = {
         'total_rows': len(df_raw),
         'processed_rows': 0,
         'skipped_rows': 0,
         'invalid_tc': 0,
+        'invalid_amount': 0,
         'empty_rows': 0,
         'amount_shifted': 0,
-        'sample_skipped': []
+        'page_rows': 0,
+        'page_rows_by_type': {},
+        'recovered_rows': 0,
+        'sample_skipped': [],
+        'error_log': ErrorLog()
     }
     
-    use_combined_name = column_mapping.get('use_combined_name', False)
+    use_combined_name = column_mapping.get('use_combined_name', False) and 'full_name' in column_mapping
+    name_fields = ['full_name'] if use_combined_name else ['first_name', 'last_name']
+    fields = [f for f in ['member_no', 'tc_no', 'amount'] + name_fields if f in column_mapping]
     
-    # Tutar sütunu için önceki/sonraki satırdan değer alma hazırlığı
-    # (Excel'deki merged cell kayması sorununu çözmek için)
-    amount_col = column_mapping.get('amount', None)
+    # Tamamen boş satırlar işlenmez
+    empty = cached(lambda: df_raw.isna().all(axis=1).to_numpy(dtype=bool), 'empty_rows')
+    stats['empty_rows'] = int(empty.sum())
+    rows = np.flatnonzero(~empty)
     
-    # Tutar değerlerini önbellekle - kayma sorununu çözmek için
-    amount_lookup = {}
-    if amount_col is not None:
-        for idx, row in df_raw.iterrows():
-            try:
-                raw_val = row[amount_col]
-                amount_val = str(raw_val).strip() if pd.notna(raw_val) else ""
-                
-                if amount_val and amount_val not in ['None', 'nan', 'NaN', '']:
-                    cleaned = clean_amount_value(amount_val)
-                    if cleaned > 0:
-                        amount_lookup[idx] = amount_val
-            except:
-                continue
+    # Eşlenen sütun dosyada yoksa hiçbir satır işlenemez
+    missing_columns = [f for f in fields if column_mapping[f] not in df_raw.columns]
+    if missing_columns:
+        stats['skipped_rows'] = len(rows)
+        stats['error_log'] = ErrorLog(
+            rows,
+            np.full(len(rows), ERROR_MISSING_COLUMN, dtype=np.int8),
+            {f: np.full(len(rows), '', dtype=object) for f in fields}
+        )
+        return pd.DataFrame(), stats
     
-    for idx, row in df_raw.iterrows():
-        try:
-            # Tamamen boş satır kontrolü
-            if row.isna().all():
-                stats['empty_rows'] += 1
-                continue
-            
-            # Her alan için mapping'e göre veriyi al
-            member_no = str(row[column_mapping.get('member_no', 0)]).strip() if 'member_no' in column_mapping else ""
-            tc_no = str(row[column_mapping.get('tc_no', 0)]).strip() if 'tc_no' in column_mapping else ""
-            amount = str(row[column_mapping.get('amount', 0)]).strip() if 'amount' in column_mapping else "0"
-            
-            # Tutar boşsa veya 0 ise, bir önceki veya sonraki satırdan almayı dene
-            if amount in ['None', 'nan', 'NaN', '', '0'] or clean_amount_value(amount) == 0:
-                # Önce bir önceki satıra bak
-                if idx - 1 in amount_lookup:
-                    amount = amount_lookup[idx - 1]
-                    stats['amount_shifted'] += 1
-                # Sonra bir sonraki satıra bak
-                elif idx + 1 in amount_lookup:
-                    amount = amount_lookup[idx + 1]
-                    stats['amount_shifted'] += 1
-            
-            # Ad-Soyad işleme
-            if use_combined_name and 'full_name' in column_mapping:
-                # Birleşik ad/soyad varsa ayır
-                full_name = str(row[column_mapping.get('full_name', 0)]).strip()
-                first_name, last_name = split_full_name(full_name)
-            else:
-                # Ayrı sütunlar varsa direkt al
-                first_name = str(row[column_mapping.get('first_name', 0)]).strip() if 'first_name' in column_mapping else ""
-                last_name = str(row[column_mapping.get('last_name', 0)]).strip() if 'last_name' in column_mapping else ""
-            
-            # None veya nan kontrolü
-            if member_no in ['None', 'nan', 'NaN']:
-                member_no = ""
-            if first_name in ['None', 'nan', 'NaN']:
-                first_name = ""
-            if last_name in ['None', 'nan', 'NaN']:
-                last_name = ""
-            if tc_no in ['None', 'nan', 'NaN']:
-                tc_no = ""
-            if amount in ['None', 'nan', 'NaN']:
-                amount = "0"
-            
-            # Türkçe karakter düzeltmeleri
-            first_name = fix_turkish_chars(first_name)
-            last_name = fix_turkish_chars(last_name)
-            
-            # TC temizle
-            tc_no_original = tc_no
-            tc_no = clean_tc_number(tc_no)
-            
-            # Tutar temizle
-            amount_clean = clean_amount_value(amount)
-            
-            # Geçerli TC varsa ekle
-            if tc_no and len(tc_no) == 11:
-                processed_data.append({
-                    "Üye No": member_no,
-                    "Adı": first_name,
-                    "Soyadı": last_name,
-                    "TC Kimlik No": tc_no,
-                    "Aidat Tutarı": amount_clean
-                })
-                stats['processed_rows'] += 1
-            else:
-                stats['invalid_tc'] += 1
-                if len(stats['sample_skipped']) < 5:
-                    stats['sample_skipped'].append({
-                        'satir': idx + 1,
-                        'tc': tc_no_original,
-                        'ad': first_name,
-                        'soyad': last_name
-                    })
+    blank = np.full(len(df_raw), '', dtype=object)
+    
+    def mapped_text(field):
+        # Yalnızca çıktıya ham haliyle giren sütunların metni önbelleğe alınır
+        col = column_mapping[field]
+        return cached(lambda: engine.mapped_text(df_raw, col), col, '_mapped_text')
+    
+    # TC doğrulama
+    report(0.1, "TC Kimlik numaraları doğrulanıyor")
+    if 'tc_no' in fields:
+        tc_original = mapped_text('tc_no')
+        tc_numbers = cached(lambda: engine.clean_tc(tc_original), column_mapping['tc_no'], '_clean_tc_column')
+    else:
+        tc_original = tc_numbers = blank
+    
+    valid = ~empty & (tc_numbers != '')
+    
+    # Sayfa başlığı/altlığı: dosya başına bir kez öğrenilen tekrarlayan satır imzaları
+    report(0.2, "Sayfa başlık ve altlıkları ayıklanıyor")
+    if 'tc_no' in fields:
+        page_kinds = cached(lambda: detect_page_rows(df_raw, ~empty & ~valid, valid),
+                            column_mapping['tc_no'], '_page_rows')
+    else:
+        page_kinds = np.full(len(df_raw), None, dtype=object)
+    page_rows = page_kinds != None  # noqa: E711
+    stats['page_rows'] = int(page_rows.sum())
+    stats['page_rows_by_type'] = count_page_rows(page_kinds)
+    
+    # Tutar: kuruş cinsinden tam sayı (int64) olarak tutulur; temizleme benzersiz
+    # değerlere uygulanır, boş/sıfır tutar komşu satırdan alınır
+    report(0.3, "Tutarlar taranıyor")
+    if 'amount' in fields:
+        labels = df_raw.index
+        if not (pd.api.types.is_integer_dtype(labels) and labels.is_unique):
+            labels = pd.RangeIndex(len(df_raw))
+        bad_amounts = cached(
+            lambda: _amount_out_of_range_column(engine.mapped_text(df_raw, column_mapping['amount'])),
+            column_mapping['amount'], '_amount_out_of_range'
+        )
+        # Aralık dışı tutarlı satırlar elenir; komşudan tutar alıp kaydırma sayacına girmez
+        amounts, stats['amount_shifted'] = cached(
+            lambda: _shifted_amounts(engine.amount_kurus(engine.mapped_text(df_raw, column_mapping['amount'])),
+                                     labels, empty | bad_amounts, page_rows),
+            column_mapping['amount'], column_mapping.get('tc_no'), '_shifted_amounts'
+        )
+    else:
+        amounts = np.zeros(len(df_raw), dtype=np.int64)
+        bad_amounts = np.zeros(len(df_raw), dtype=bool)
+    
+    # Ad-Soyad: birleşik ad benzersiz değerler üzerinden ayrılır, Türkçe karakterler düzeltilir
+    report(0.5, "İsimler düzenleniyor")
+    if use_combined_name:
+        first_names, last_names = cached(
+            lambda: engine.split_full_names(engine.mapped_text(df_raw, column_mapping['full_name'])),
+            column_mapping['full_name'], '_split_full_names'
+        )
+    else:
+        first_names = blank
+        last_names = blank
+        if 'first_name' in fields:
+            first_names = cached(lambda: engine.clean_names(engine.mapped_text(df_raw, column_mapping['first_name'])),
+                                 column_mapping['first_name'], '_clean_name')
+        if 'last_name' in fields:
+            last_names = cached(lambda: engine.clean_names(engine.mapped_text(df_raw, column_mapping['last_name'])),
+                                column_mapping['last_name'], '_clean_name')
+    
+    # İsimle eşleştirme: TC'si eksik/geçersiz satırlar üye listesindeki TC ile kurtarılır
+    match_scores = None
+    unmatched = np.flatnonzero(~empty & ~valid & ~page_rows)
+    if reference is not None and len(reference) and len(unmatched):
+        report(0.6, "İsimler üye listesiyle eşleştiriliyor")
+        member_text = mapped_text('member_no') if 'member_no' in fields else blank
+        matched_tc, scores = reference.match(first_names[unmatched], last_names[unmatched], member_text[unmatched])
+        recovered = unmatched[matched_tc != '']
+        if len(recovered):
+            # Önbellekteki diziler salt okunurdur; kopyası üzerinde güncellenir
+            tc_numbers = tc_numbers.copy()
+            tc_numbers[recovered] = matched_tc[matched_tc != '']
+            valid = valid.copy()
+            valid[recovered] = True
+            match_scores = np.full(len(df_raw), np.nan)
+            match_scores[recovered] = scores[matched_tc != '']
+        stats['recovered_rows'] = len(recovered)
+    
+    invalid = ~empty & ~valid & ~page_rows
+    stats['invalid_tc'] = int(invalid.sum())
+    
+    # Sayı aralığını aşan tutarlı satırlar (TC'si geçerli olsa da) elenir
+    bad_amounts = valid & bad_amounts
+    valid = valid & ~bad_amounts
+    stats['invalid_amount'] = int(bad_amounts.sum())
+    stats['processed_rows'] = int(valid.sum())
+    
+    # Hata kaydı yalnızca hatalı satırlardan oluşturulur
+    error_rows = np.flatnonzero(invalid | bad_amounts)
+    if len(error_rows):
+        reasons = np.where(
+            bad_amounts[error_rows], ERROR_INVALID_AMOUNT,
+            np.where(tc_original[error_rows] == '', ERROR_MISSING_TC, ERROR_INVALID_TC)
+        ).astype(np.int8)
+        raw_values = {}
+        for f in fields:
+            values = df_raw[column_mapping[f]].to_numpy(dtype=object)[error_rows]
+            raw_values[f] = np.where(pd.isna(values), '', values)
+        stats['error_log'] = ErrorLog(error_rows, reasons, raw_values)
         
-        except Exception as e:
-            stats['skipped_rows'] += 1
-            continue
+        for position in error_rows[:5]:
+            stats['sample_skipped'].append({
+                'satir': int(df_raw.index[position]) + 1,
+                'tc': tc_original[position],
+                'ad': first_names[position],
+                'soyad': last_names[position]
+            })
+    
+    if not valid.any():
+        return pd.DataFrame(), stats
     
-    # DataFrame oluştur
-    df_clean = pd.DataFrame(processed_data)
+    columns = {
+        "Üye No": mapped_text('member_no') if 'member_no' in fields else blank,
+        "Adı": first_names,
+        "Soyadı": last_names,
+        "TC Kimlik No": tc_numbers,
+        "Aidat Tutarı": amounts
+    }
+    if match_scores is not None:
+        columns[MATCH_SCORE_COLUMN] = match_scores
+    df_clean = pd.DataFrame({name: values[valid] for name, values in columns.items()})
     
+    report(1.0, f"{len(df_clean):,} kayıt hazır")
     return df_clean, stats
 
 
-def find_data_start_row(uploaded_file, max_rows_to_check=50):
+def _apply_mapping_per_source(df_raw, column_mapping, sources, progress_callback=None, cache_key=None,
+                              reference=None, backend=None):
     """
-    Excel/CSV dosyasında gerçek verinin başladığı satırı bulur.
+    Aynı eşleştirmeyi her kaynağa ayrı uygular ve sonuçları birleştirir.
+    Her satır "Kaynak" sütunuyla etiketlenir, istatistikler kaynak bazında da tutulur.
+    
+    Args:
+        df_raw (pd.DataFrame): Birleşik ham veri
+        column_mapping (dict): Sütun eşleştirme haritası
+        sources (list): [(etiket, başlangıç, bitiş), ...] satır aralıkları
+        progress_callback (callable): İlerleme bildirimi, progress_callback(oran, mesaj)
+        cache_key (str): Ham verinin kimliği (bkz. apply_column_mapping)
+        reference (MemberIndex): İsimle eşleştirme için üye listesi dizini (bkz. apply_column_mapping)
+        backend (str): Temizleme motoru (bkz. apply_column_mapping)
+    
+    Returns:
+        tuple: (pd.DataFrame: Temizlenmiş veri, dict: İşlem istatistikleri)
+    """
+    counters = ['processed_rows', 'skipped_rows', 'invalid_tc', 'invalid_amount', 'empty_rows', 'amount_shifted',
+                'page_rows', 'recovered_rows']
+    stats = {key: 0 for key in counters}
+    stats['page_rows_by_type'] = Counter()
+    stats['total_rows'] = len(df_raw)
+    stats['sample_skipped'] = []
+    stats['per_source'] = {}
+    
+    frames = []
+    error_logs = []
+    total_rows = max(len(df_raw), 1)
+    for label, start, stop in sources:
+        part_progress = None
+        if progress_callback is not None:
+            # Kaynak içi ilerlemeyi toplam satır sayısına göre ölçekle
+            def part_progress(fraction, message=None, start=start, stop=stop, label=label):
+                progress_callback((start + fraction * (stop - start)) / total_rows, f"{label}: {message or ''}")
+        
+        part_key = None if cache_key is None else (cache_key, start, stop)
+        part_df, part_stats = apply_column_mapping(df_raw.iloc[start:stop], column_mapping,
+                                                   progress_callback=part_progress, cache_key=part_key,
+                                                   reference=reference, backend=backend)
+        
+        if not part_df.empty:
+            part_df["Kaynak"] = label
+            frames.append(part_df)
+        part_stats['amount_total'] = total_kurus(part_df[AMOUNT_COLUMN]) if not part_df.empty else 0
+        
+        for key in counters:
+            stats[key] += part_stats[key]
+        stats['page_rows_by_type'].update(part_stats.pop('page_rows_by_type'))
+        
+        remaining = 5 - len(stats['sample_skipped'])
+        if remaining > 0:
+            stats['sample_skipped'].extend(
+                dict(sample, kaynak=label) for sample in part_stats['sample_skipped'][:remaining]
+            )
+        
+        del part_stats['sample_skipped']
+        error_logs.append(part_stats.pop('error_log'))
+        stats['per_source'][label] = part_stats
+    
+    # Hata satırları kaynak içindeki konumlarıyla ve kaynak etiketiyle tutulur
+    stats['error_log'] = ErrorLog.concat(error_logs, labels=[label for label, _, _ in sources])
+    stats['page_rows_by_type'] = dict(stats['page_rows_by_type'])
+    
+    df_clean = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    
+    return df_clean, stats
+
+
+# Satır sınıfları (başlık tespiti)
+ROW_EMPTY = 'empty'
+ROW_METADATA = 'metadata'
+ROW_HEADER = 'header'
+ROW_DATA = 'data'
+
+
+def _split_prefix_line(line):
+    """Ön ek satırını en çok hücre veren ayırıcıyla (eşitlikte ; , sekme sırasıyla) hücrelere böler."""
+    best = [line]
+    for separator in (';', ',', '\t'):
+        if separator in line:
+            cells = next(csv.reader([line], delimiter=separator))
+            if len(cells) > len(best):
+                best = cells
+    return best
+
+
+def _read_text_prefix(uploaded_file, max_rows, max_bytes):
+    """
+    Metin dosyasının yalnızca baş kısmını (en fazla max_bytes) okuyup kayıtlara böler.
+    Yarım kalan son satır atılır; maliyet dosya boyutundan bağımsızdır. Kayıt
+    numaraları okumadaki skiprows ile aynıdır (boş satırlar sayılır, tırnak
+    içindeki satır sonları kaydı bölmez).
+    
+    Returns:
+        list: Hücre listeleri (dosyadaki kayıt sırasıyla)
+    """
+    uploaded_file.seek(0)
+    blocks = []
+    size = 0
+    line_count = 0
+    at_eof = False
+    while line_count <= max_rows and size < max_bytes:
+        block = uploaded_file.read(min(HEAD_CHUNK_BYTES, max_bytes - size))
+        if not block:
+            at_eof = True
+            break
+        blocks.append(block)
+        size += len(block)
+        line_count += block.count(b'\n')
+    uploaded_file.seek(0)
+    
+    data = b''.join(blocks)
+    if not at_eof and b'\n' in data:
+        data = data[:data.rfind(b'\n') + 1]
+    
+    # Başlık etiketleri için UTF-8 önce denenir (cp1254 hemen her byte dizisini çözer)
+    for enc in ['utf-8-sig'] + TEXT_ENCODINGS:
+        try:
+            text = data.decode(enc)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        text = data.decode('cp1254', errors='ignore')
+    
+    records = []
+    pending = None
+    for line in text.split('\n'):
+        line = line.rstrip('\r')
+        pending = line if pending is None else pending + '\n' + line
+        # Tek sayıda tırnak: alan bir sonraki satırda devam ediyor
+        if pending.count('"') % 2 == 0:
+            records.append(_split_prefix_line(pending))
+            pending = None
+            if len(records) >= max_rows:
+                break
+    return records
+
+
+def _normalize_header_cell(value):
+    """Türkçe büyük/küçük harf dönüşümüyle küçük harfe çevirir (İ -> i, I -> ı)."""
+    return value.replace('İ', 'i').replace('I', 'ı').lower()
+
+
+def classify_row(cells):
+    """
+    Satırı hücre içeriklerine göre sınıflandırır.
+    
+    Args:
+        cells (list): Satırın hücreleri (boş/None hücreler dahil)
+    
+    Returns:
+        str: ROW_DATA (en az 3 dolu hücre ve TC/sayısal değerler), ROW_HEADER
+             (sayısal hücre içermeyen, alan adı geçen satır), ROW_METADATA (diğer
+             dolu satırlar) veya ROW_EMPTY
+    """
+    values = [str(cell).strip() for cell in cells if cell is not None and not pd.isna(cell)]
+    values = [value for value in values if value]
+    if not values:
+        return ROW_EMPTY
+    
+    numeric_count = sum(1 for value in values if _NUMERIC_CELL.fullmatch(value))
+    if len(values) >= 3 and (numeric_count >= 2 or any(_TC_RUN.search(value) for value in values)):
+        return ROW_DATA
+    
+    if len(values) >= 2 and numeric_count == 0 and any(
+        _HEADER_WORD.search(_normalize_header_cell(value)) for value in values
+    ):
+        return ROW_HEADER
+    
+    return ROW_METADATA
+
+
+def detect_header(uploaded_file, max_rows_to_check=50, sheet_name=None, max_bytes=HEADER_SCAN_BYTES):
+    """
+    Dosyanın yalnızca baş kısmını inceleyerek veri başlangıç satırını ve (varsa)
+    başlık satırını bulur. Satırlar önceden derlenmiş desenlerle başlık, üst
+    bilgi veya veri olarak sınıflandırılır.
     
     Args:
         uploaded_file: Streamlit file uploader objesi
-        max_rows_to_check (int): Kontrol edilecek maksimum satır sayısı
+        max_rows_to_check (int): İncelenecek maksimum satır sayısı
+        sheet_name (str): İncelenecek Excel sayfası (None ise ilk sayfa)
+        max_bytes (int): Metin dosyalarında okunacak en fazla byte
     
     Returns:
-        int: Veri başlangıç satırı (0-indexed)
+        dict: {'data_start': int (0-indexed, veri yoksa 0),
+               'header_row': int veya None,
+               'header_labels': list veya None (ilk veri satırının dolu hücrelerine hizalı başlıklar),
+               'row_kinds': list (incelenen satırların sınıfları)}
     """
+    result = {'data_start': 0, 'header_row': None, 'header_labels': None, 'row_kinds': []}
     try:
-        # Dosyayı header olmadan oku
         if uploaded_file.name.endswith('.xlsx') or uploaded_file.name.endswith('.xls'):
-            df_temp = pd.read_excel(uploaded_file, header=None, nrows=max_rows_to_check, dtype=str)
+            df_temp = pd.read_excel(path_or_buffer(uploaded_file), header=None, nrows=max_rows_to_check, dtype=str,
+                                    sheet_name=sheet_name if sheet_name is not None else 0)
+            rows = df_temp.astype(object).where(df_temp.notna(), None).values.tolist()
         else:
-            uploaded_file.seek(0)
-            raw_bytes = uploaded_file.getvalue()
-            string_data = raw_bytes.decode('cp1254', errors='ignore')
-            
-            from io import StringIO
-            df_temp = pd.read_csv(StringIO(string_data), header=None, nrows=max_rows_to_check, dtype=str, sep=None, engine='python')
-        
-        # Her satırı analiz et
-        for idx, row in df_temp.iterrows():
-            # Satırdaki dolu hücre sayısı
-            non_empty = row.notna().sum()
-            
-            # En az 3 sütun dolu ise ve TC kimlik pattern'i varsa
-            if non_empty >= 3:
-                row_str = ' '.join(row.dropna().astype(str).tolist())
-                
-                # TC Kimlik var mı kontrol et (11 haneli sayı)
-                if re.search(r'\d{11}', row_str):
-                    return idx
-                
-                # Veya çok sayıda sayısal veri varsa (tablo başlangıcı olabilir)
-                numeric_count = sum(1 for val in row.dropna() if str(val).replace(',', '').replace('.', '').isdigit())
-                if numeric_count >= 2:
-                    return idx
-        
-        return 0
-        
+            rows = _read_text_prefix(uploaded_file, max_rows_to_check, max_bytes)
     except Exception:
-        return 0
+        return result
+    
+    kinds = [classify_row(cells) for cells in rows]
+    result['row_kinds'] = kinds
+    if ROW_DATA not in kinds:
+        return result
+    
+    data_start = kinds.index(ROW_DATA)
+    result['data_start'] = data_start
+    
+    # Başlık: veri satırından önceki ilk dolu satır (aradaki boş satırlar atlanır)
+    header_row = data_start - 1
+    while header_row >= 0 and kinds[header_row] == ROW_EMPTY:
+        header_row -= 1
+    if header_row < 0 or kinds[header_row] != ROW_HEADER:
+        return result
+    
+    # Okuma tamamen boş sütunları attığından başlıklar veri satırının dolu hücrelerine hizalanır
+    header_cells = ['' if cell is None else str(cell).strip() for cell in rows[header_row]]
+    data_positions = [
+        position for position, cell in enumerate(rows[data_start])
+        if cell is not None and str(cell).strip()
+    ]
+    result['header_row'] = header_row
+    result['header_labels'] = [
+        header_cells[position] if position < len(header_cells) else '' for position in data_positions
+    ]
+    return result
+
+
+def header_labels_for(detected, df_raw):
+    """
+    detect_header'ın bulduğu başlıkları, sütun sayısı okunan ham veriyle uyuşuyorsa döndürür.
+    
+    Args:
+        detected (dict): detect_header sonucu
+        df_raw (pd.DataFrame): Okunan ham veri
+    
+    Returns:
+        list veya None: Ham verinin sütun sırasıyla başlıklar
+    """
+    labels = detected.get('header_labels')
+    if labels is None or len(labels) != len(df_raw.columns):
+        return None
+    return labels
+
+
+def find_data_start_row(uploaded_file, max_rows_to_check=50, sheet_name=None):
+    """
+    Excel/CSV dosyasında gerçek verinin başladığı satırı bulur (bkz. detect_header).
+    
+    Args:
+        uploaded_file: Streamlit file uploader objesi
+        max_rows_to_check (int): Kontrol edilecek maksimum satır sayısı
+        sheet_name (str): İncelenecek Excel sayfası (None ise ilk sayfa)
+    
+    Returns:
+        int: Veri başlangıç satırı (0-indexed)
+    """
+    return detect_header(uploaded_file, max_rows_to_check, sheet_name)['data_start']
 
 
 def detect_file_structure(df_raw, sample_size=50):
@@ -550,3 +1274,131 @@ def detect_file_structure(df_raw, sample_size=50):
     
     return info
 
+
+def suggest_from_labels(column_labels, use_combined_name=False):
+    """
+    Dosyadaki başlık etiketlerine göre eşleştirme önerir (örn: "TC Kimlik No" -> tc_no).
+    
+    Args:
+        column_labels (list): Sütun başlıkları (ham verinin sütun sırasıyla)
+        use_combined_name (bool): Ad-Soyad birleşik mi?
+    
+    Returns:
+        dict: Önerilen eşleşmeler {internal_key: column_index}
+    """
+    name_fields = ['full_name'] if use_combined_name else ['first_name', 'last_name']
+    suggestions = {}
+    for col_idx, label in enumerate(column_labels or []):
+        label = _normalize_header_cell(str(label)).strip()
+        if not label:
+            continue
+        for field in ['tc_no', 'amount', 'member_no'] + name_fields:
+            if field in suggestions:
+                continue
+            pattern = _LABEL_PATTERNS[field]
+            matched = pattern.fullmatch(label) if field in _NAME_FIELDS else pattern.search(label)
+            if matched:
+                suggestions[field] = col_idx
+                break
+    return suggestions
+
+
+def auto_suggest_columns(df, required_columns, use_combined_name=False, column_labels=None):
+    """
+    Sütun içeriğine göre otomatik eşleştirme önerisi yapar. Başlık etiketleri
+    verilirse önce etiketlerden eşleştirilir, kalan alanlar içerikten önerilir.
+    
+    Args:
+        df (pd.DataFrame): Ham veri
+        required_columns (dict): Gerekli sütunlar
+        use_combined_name (bool): Ad-Soyad birleşik mi?
+        column_labels (list): Dosyadaki başlık etiketleri (bkz. detect_header)
+    
+    Returns:
+        dict: Önerilen eşleşmeler {internal_key: column_index}
+    """
+    suggestions = {}
+    if column_labels is not None and len(column_labels) == len(df.columns):
+        suggestions = suggest_from_labels(column_labels, use_combined_name)
+    labelled_columns = set(suggestions.values())
+    
+    # Her sütunu analiz et
+    for col_idx in range(len(df.columns)):
+        if col_idx in labelled_columns:
+            continue
+        
+        # İlk 20 satırı sample olarak al
+        sample_values = df[col_idx].astype(str).head(20)
+        
+        # TC Kimlik tespiti (11 haneli sayılar)
+        if 'tc_no' not in suggestions:
+            tc_pattern_count = sample_values.str.match(r'^\d{11}$').sum()
+            if tc_pattern_count >= 5:  # En az 5 satır TC formatında
+                suggestions['tc_no'] = col_idx
+                continue
+        
+        # Tutar tespiti (sayısal değerler, virgül/nokta içeren)
+        if 'amount' not in suggestions:
+            amount_pattern_count = sample_values.str.match(r'^[\d\.,]+$').sum()
+            if amount_pattern_count >= 5:
+                suggestions['amount'] = col_idx
+                continue
+        
+        # Üye No / Sıra No tespiti (1-6 haneli sayılar)
+        if 'member_no' not in suggestions:
+            member_pattern_count = sample_values.str.match(r'^\d{1,7}$').sum()
+            if member_pattern_count >= 5:
+                suggestions['member_no'] = col_idx
+                continue
+        
+        # İsim tespiti (2 veya daha fazla kelime, boşluk içeren)
+        if use_combined_name:
+            if 'full_name' not in suggestions:
+                # Birleşik isim tespiti (boşluk içeren isimler)
+                combined_name_count = sample_values.str.match(r'^[A-Za-zÇçĞğİıÖöŞşÜü]+\s+[A-Za-zÇçĞğİıÖöŞşÜü]+').sum()
+                if combined_name_count >= 5:
+                    suggestions['full_name'] = col_idx
+                    continue
+        else:
+            # Ayrı isim tespiti
+            if 'first_name' not in suggestions or 'last_name' not in suggestions:
+                name_pattern_count = sample_values.str.match(r'^[A-Za-zÇçĞğİıÖöŞşÜü\s]{2,30}$').sum()
+                if name_pattern_count >= 5:
+                    # Boşluk içermeyen veya tek kelime ise muhtemelen tek isim
+                    single_word_count = sample_values.str.match(r'^[A-Za-zÇçĞğİıÖöŞşÜü]+$').sum()
+                    if single_word_count >= 5:
+                        if 'first_name' not in suggestions:
+                            suggestions['first_name'] = col_idx
+                        elif 'last_name' not in suggestions:
+                            suggestions['last_name'] = col_idx
+    
+    return suggestions
+
+
+def validate_mapping(mapping, required_columns):
+    """
+    Eşleştirmenin geçerli olup olmadığını kontrol eder.
+    
+    Args:
+        mapping (dict): Kullanıcının yaptığı eşleştirme
+        required_columns (dict): Gerekli sütunlar
+    
+    Returns:
+        tuple: (is_valid: bool, missing_fields: list)
+    """
+    # Birleşik isim modu kontrolü
+    use_combined_name = mapping.get('use_combined_name', False)
+    
+    if use_combined_name:
+        # Birleşik isim modunda first_name ve last_name yerine full_name gerekli
+        required_keys = set(required_columns.values()) - {'first_name', 'last_name'}
+        required_keys.add('full_name')
+    else:
+        required_keys = set(required_columns.values())
+    
+    # use_combined_name'i mapped_keys'den çıkar (çünkü bu bir bool değer, sütun değil)
+    mapped_keys = set(k for k in mapping.keys() if k != 'use_combined_name')
+    
+    missing = required_keys - mapped_keys
+    
+    return len(missing) == 0, list(missing)
@@ -0,0 +1,134 @@
+"""
+Satır Bazlı Hata Kaydı
+Bu modül, temizleme sırasında elenen satırların konumunu, hata kodunu ve ham
+değerlerini sütun bazlı (numpy dizileri) tutan hata kaydını içerir. Kayıt,
+temizleme ile aynı vektörel geçişte yalnızca hatalı satırlardan oluşturulur;
+hata az olduğunda ek maliyeti yok denecek kadar azdır.
+"""
+
+from utils.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# Hata kodları (int8 olarak saklanır)
+ERROR_MISSING_TC = 1
+ERROR_INVALID_TC = 2
+ERROR_MISSING_COLUMN = 3
+ERROR_INVALID_AMOUNT = 4
+
+ERROR_REASONS = {
+    ERROR_MISSING_TC: "TC Kimlik No boş",
+    ERROR_INVALID_TC: "TC Kimlik No 11 haneli değil",
+    ERROR_MISSING_COLUMN: "Eşleştirilen sütun dosyada yok",
+    ERROR_INVALID_AMOUNT: "Tutar geçersiz (çok büyük sayı)",
+}
+
+# Ham değer sütunlarının rapordaki başlıkları
+FIELD_LABELS = {
+    'member_no': "Üye No",
+    'first_name': "Adı",
+    'last_name': "Soyadı",
+    'full_name': "Ad Soyad",
+    'tc_no': "TC Kimlik No",
+    'amount': "Aidat Tutarı",
+}
+
+
+class ErrorLog:
+    """
+    Elenen satırların sütun bazlı kaydı.
+    
+    Args:
+        rows (np.ndarray): Satır konumları (0 tabanlı, int64)
+        reasons (np.ndarray): Hata kodları (int8)
+        values (dict): Alan adı -> ham değerler (object dizisi)
+        sources (np.ndarray): Kaynak etiketleri (çoklu dosya/sayfa; yoksa None)
+    """
+    
+    def __init__(self, rows=None, reasons=None, values=None, sources=None):
+        self.rows = np.asarray(rows if rows is not None else [], dtype=np.int64)
+        self.reasons = np.asarray(reasons if reasons is not None else [], dtype=np.int8)
+        self.values = values or {}
+        self.sources = sources
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def __repr__(self):
+        return f"<ErrorLog {len(self)} satır>"
+    
+    def counts(self):
+        """
+        Hata nedenine göre satır sayılarını döndürür.
+        
+        Returns:
+            dict: {hata açıklaması: satır sayısı}
+        """
+        codes, counts = np.unique(self.reasons, return_counts=True)
+        return {ERROR_REASONS.get(int(code), str(code)): int(count) for code, count in zip(codes, counts)}
+    
+    @classmethod
+    def concat(cls, logs, labels=None):
+        """
+        Birden fazla kaydı birleştirir.
+        
+        Args:
+            logs (list): ErrorLog listesi
+            labels (list): Her kaydın kaynak etiketi (None ise etiketlenmez)
+        
+        Returns:
+            ErrorLog: Birleşik kayıt
+        """
+        logs = list(logs)
+        if not logs:
+            return cls()
+        
+        fields = list(dict.fromkeys(field for log in logs for field in log.values))
+        values = {
+            field: np.concatenate([
+                log.values.get(field, np.full(len(log), '', dtype=object)) for log in logs
+            ])
+            for field in fields
+        }
+        
+        sources = None
+        if labels is not None:
+            sources = np.concatenate([np.full(len(log), label, dtype=object) for log, label in zip(logs, labels)])
+        
+        return cls(
+            np.concatenate([log.rows for log in logs]),
+            np.concatenate([log.reasons for log in logs]),
+            values,
+            sources
+        )
+    
+    def to_frame(self, limit=None):
+        """
+        Kaydı rapor tablosuna çevirir (Satır numaraları 1 tabanlıdır).
+        
+        Args:
+            limit (int): En fazla satır sayısı (None ise tamamı)
+        
+        Returns:
+            pd.DataFrame: Hata raporu
+        """
+        part = slice(None, limit)
+        data = {"Satır": self.rows[part] + 1}
+        if self.sources is not None:
+            data["Kaynak"] = self.sources[part]
+        data["Hata Kodu"] = self.reasons[part]
+        data["Hata"] = pd.Series(self.reasons[part]).map(ERROR_REASONS).to_numpy()
+        for field, values in self.values.items():
+            data[f"{FIELD_LABELS.get(field, field)} (ham)"] = values[part]
+        return pd.DataFrame(data)
+    
+    def to_csv_bytes(self):
+        """
+        Hata raporunu Excel uyumlu (BOM'lu UTF-8) CSV olarak kodlar.
+        
+        Returns:
+            bytes: CSV içeriği
+        """
+        return self.to_frame().to_csv(index=False).encode('utf-8-sig')
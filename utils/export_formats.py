@@ -0,0 +1,113 @@
+"""
+Parquet ve Arrow IPC Dışa/İçe Aktarma
+Bu modül, temizlenmiş listenin tipli sütunlarla Parquet ve Arrow IPC (Feather v2)
+formatlarında yazılmasını ve daha önce dışa aktarılmış Parquet dosyalarının
+temizleme adımı atlanarak geri yüklenmesini sağlar.
+"""
+
+import io
+
+from utils.money import AMOUNT_COLUMN, lira_to_kurus, to_export_frame
+
+
+# Dosyadaki temiz liste sütunlarının tipleri (Kaynak sütunu çoklu dosya/sayfa okumada,
+# Eşleşme Skoru isimle eşleştirmede eklenir). Tutar dosyada TL (float64) olarak yazılır, bellekte kuruş (int64) tutulur.
+CLEAN_COLUMN_TYPES = {
+    "Üye No": "string",
+    "Adı": "string",
+    "Soyadı": "string",
+    "TC Kimlik No": "string",
+    "Aidat Tutarı": "float64",
+    "Kaynak": "string",
+    "Eşleşme Skoru": "float64",
+}
+
+REQUIRED_CLEAN_COLUMNS = ["Üye No", "Adı", "Soyadı", "TC Kimlik No", "Aidat Tutarı"]
+
+
+def _to_arrow_table(df):
+    """DataFrame'i tipli Arrow tablosuna çevirir (object sütunlar string olarak yazılır)."""
+    import pyarrow as pa
+    
+    df = to_export_frame(df)
+    typed = df.astype({col: dtype for col, dtype in CLEAN_COLUMN_TYPES.items() if col in df.columns})
+    return pa.Table.from_pandas(typed, preserve_index=False)
+
+
+def to_parquet_bytes(df, compression='zstd'):
+    """
+    Temiz listeyi Parquet formatında yazar.
+    
+    Args:
+        df (pd.DataFrame): Temizlenmiş veri
+        compression (str): Sıkıştırma algoritması ('zstd', 'snappy', 'gzip', None)
+    
+    Returns:
+        bytes: Parquet dosya içeriği
+    """
+    import pyarrow.parquet as pq
+    
+    buffer = io.BytesIO()
+    pq.write_table(_to_arrow_table(df), buffer, compression=compression)
+    return buffer.getvalue()
+
+
+def to_arrow_ipc_bytes(df, compression='zstd'):
+    """
+    Temiz listeyi Arrow IPC (Feather v2) formatında yazar.
+    
+    Args:
+        df (pd.DataFrame): Temizlenmiş veri
+        compression (str): Sıkıştırma algoritması ('zstd', 'lz4', None)
+    
+    Returns:
+        bytes: Arrow IPC dosya içeriği
+    """
+    import pyarrow as pa
+    
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    table = _to_arrow_table(df)
+    with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def read_clean_parquet(uploaded_file):
+    """
+    Daha önce dışa aktarılmış temiz listeyi Parquet dosyasından okur.
+    Dosya okuma ve temizleme adımları atlanır; sadece şema doğrulanır.
+    
+    Args:
+        uploaded_file: Streamlit file uploader objesi
+    
+    Returns:
+        pd.DataFrame: Temizlenmiş veri
+    """
+    import pyarrow.parquet as pq
+    
+    uploaded_file.seek(0)
+    try:
+        table = pq.read_table(uploaded_file)
+    except Exception as e:
+        raise ValueError(f"Parquet okuma hatası: {e}")
+    
+    missing = [col for col in REQUIRED_CLEAN_COLUMNS if col not in table.column_names]
+    if missing:
+        raise ValueError(f"Parquet dosyası temiz liste formatında değil. Eksik sütunlar: {', '.join(missing)}")
+    
+    df = table.to_pandas()
+    
+    # Uygulamanın geri kalanı object tipli metin sütunlarıyla çalışıyor
+    for col, dtype in CLEAN_COLUMN_TYPES.items():
+        if col not in df.columns:
+            continue
+        if dtype == "string":
+            df[col] = df[col].astype(object).where(df[col].notna(), "")
+        else:
+            df[col] = df[col].astype(dtype)
+    
+    # Tutar bellekte kuruş cinsinden tutulur
+    df[AMOUNT_COLUMN] = lira_to_kurus(df[AMOUNT_COLUMN].fillna(0))
+    
+    return df
@@ -0,0 +1,393 @@
+"""
+Klasör İzleme
+Bu modül, paylaşılan bir giriş dizinine bırakılan listeleri arayüz açmadan
+dönüştüren izleyiciyi içerir. Dizin belirli aralıklarla taranır; boyutu ve
+değişiklik zamanı bir süre sabit kalan (yazımı bitmiş) dosyalar süreç
+havuzuna verilir. Her dosyanın düzeni parmak iziyle tanınır ve kayıtlı
+eşleştirmesi uygulanır (bkz. utils/layout_store.py); temiz liste, hata raporu
+ve JSON istatistik manifestosu çıktı dizinine yazılır, işlenen dosya giriş
+dizinindeki alt klasörlerden birine taşınır.
+
+Bellek sınırlıdır: ana süreç dosya içeriği okumaz, aynı anda en fazla worker
+sayısı kadar dosya işlenir (sıradakiler yalnızca dizinde bekler) ve worker
+süreçleri belirli sayıda dosyadan sonra yenilenir.
+"""
+
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+from utils.archive_ingest import MEMBER_SUFFIXES
+from utils.data_processor import apply_column_mapping, validate_mapping
+from utils.layout_store import layout_fingerprint, load_saved_mapping
+from utils.money import AMOUNT_COLUMN, format_decimal, total_kurus
+from utils.pipeline import (
+    REQUIRED_COLUMNS,
+    MappingError,
+    encode_output,
+    normalize_mapping,
+    open_source,
+    read_source,
+    suggest_mapping
+)
+from utils.stream_export import write_chunks
+from utils.validation_rules import apply_rules, compile_rules
+
+
+# Dosyanın yazımı bitmiş sayılması için boyut/zamanın sabit kalma süresi (saniye)
+SETTLE_SECONDS = 5
+
+# Dizin tarama aralığı (saniye)
+POLL_SECONDS = 2
+
+# Bir worker sürecinin yenilenmeden önce işlediği dosya sayısı (Python 3.11+)
+MAX_TASKS_PER_CHILD = 20
+
+# Worker sürecini çökerten dosyanın kaç kez yeniden deneneceği
+MAX_CRASH_RETRIES = 1
+
+# Giriş dizininde işlenen dosyaların taşındığı alt klasörler
+DONE_DIR = 'islenen'
+FAILED_DIR = 'hatali'
+UNMATCHED_DIR = 'eslesmeyen'
+
+# Çıktı dizininde her dosya için bir satır eklenen manifesto günlüğü
+MANIFEST_JOURNAL = 'manifest.ndjson'
+
+# Dosya durumları
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+STATUS_UNMATCHED = 'unmatched'
+
+# Yazılmakta olan / geçici dosyalar (örn: .liste.csv.swp, ~$liste.xlsx)
+_IGNORED_PREFIXES = ('.', '~$')
+
+
+def list_candidates(directory):
+    """
+    Giriş dizinindeki işlenebilir dosyaları listeler (alt klasörler, gizli/geçici
+    dosyalar ve desteklenmeyen uzantılar, örn: yazılırken kullanılan .part, atlanır).
+    
+    Args:
+        directory (str): Giriş dizini
+    
+    Returns:
+        dict: dosya adı -> (boyut, değişiklik zamanı ns)
+    """
+    candidates = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(_IGNORED_PREFIXES) or not entry.name.lower().endswith(MEMBER_SUFFIXES):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            candidates[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    return candidates
+
+
+class SettleTracker:
+    """
+    Dosyaların boyut ve değişiklik zamanını taramalar arasında izler; yazımı
+    süren (kopyalanan, ağdan gelen) dosyalar değişmeyi bırakana kadar beklenir.
+    
+    Args:
+        settle_seconds (float): Dosyanın hazır sayılması için sabit kalma süresi
+    """
+    
+    def __init__(self, settle_seconds=SETTLE_SECONDS):
+        self.settle_seconds = settle_seconds
+        self._seen = {}
+    
+    def update(self, candidates, now=None):
+        """
+        Tarama sonucunu işler ve hazır dosyaları döndürür.
+        
+        Args:
+            candidates (dict): list_candidates sonucu
+            now (float): Şimdiki zaman (time.monotonic; None ise okunur)
+        
+        Returns:
+            list: Hazır dosya adları (sıralı; boş dosyalar hiçbir zaman hazır sayılmaz)
+        """
+        now = time.monotonic() if now is None else now
+        seen = {}
+        ready = []
+        for name, signature in candidates.items():
+            previous = self._seen.get(name)
+            stable_since = previous[1] if previous is not None and previous[0] == signature else now
+            seen[name] = (signature, stable_since)
+            if signature[0] > 0 and now - stable_since >= self.settle_seconds:
+                ready.append(name)
+        self._seen = seen
+        return sorted(ready)
+
+
+def _write_atomic(chunks, path):
+    """Blokları önce .part dosyasına yazar, bitince yerine taşır (izleyen sistemler yarım dosya görmez)."""
+    written = write_chunks(chunks, path + '.part')
+    os.replace(path + '.part', path)
+    return written
+
+
+def convert_file(path, output_base, output_format='csv', mappings_dir=None, auto_mapping=False, rules=None,
+                 backend=None):
+    """
+    Tek dosyayı okur, düzenini parmak iziyle tanıyıp kayıtlı eşleştirmeyi
+    uygular ve çıktıları yazar (süreç havuzunda çalışır).
+    
+    Args:
+        path (str): Girdi dosyası
+        output_base (str): Çıktı dosyalarının uzantısız yolu (örn: cikti/liste)
+        output_format (str): 'csv', 'ndjson' veya 'parquet'
+        mappings_dir (str): Kayıtlı eşleştirme dizini (None ise MAPPINGS_DIR)
+        auto_mapping (bool): Kayıtlı eşleştirme yoksa otomatik öneri kullanılsın mı?
+        rules (list): Doğrulama kuralı tanımları (load_rules çıktısı; worker'da derlenir)
+        backend (str): Temizleme motoru
+    
+    Returns:
+        dict: Manifesto ('status' STATUS_DONE veya eşleştirme yoksa STATUS_UNMATCHED,
+              'fingerprint', 'mapping', 'stats', 'errors', 'outputs', ...)
+    """
+    start = time.perf_counter()
+    df_raw, skip_rows, column_labels = read_source(open_source(path))
+    fingerprint = layout_fingerprint(df_raw, column_labels)
+    manifest = {
+        'input': os.path.basename(path),
+        'fingerprint': fingerprint,
+        'skip_rows': skip_rows,
+        'rows': len(df_raw),
+        'columns': len(df_raw.columns),
+    }
+    
+    mapping = load_saved_mapping(fingerprint, mappings_dir)
+    manifest['mapping_source'] = 'saved'
+    if mapping is None:
+        suggested = suggest_mapping(df_raw, column_labels)
+        if not auto_mapping:
+            manifest.update(status=STATUS_UNMATCHED, header_labels=column_labels, suggested_mapping=suggested)
+            return manifest
+        mapping, manifest['mapping_source'] = suggested, 'auto'
+    
+    mapping = normalize_mapping(mapping)
+    is_valid, missing_fields = validate_mapping(mapping, REQUIRED_COLUMNS)
+    if not is_valid:
+        raise MappingError(f"Eşleştirilemeyen alanlar: {', '.join(sorted(missing_fields))}")
+    
+    df_clean, stats = apply_column_mapping(df_raw, mapping, backend=backend)
+    del df_raw
+    if rules:
+        apply_rules(df_clean, stats, compile_rules(rules))
+    
+    outputs = {'output': f"{output_base}.{output_format}"}
+    written = _write_atomic(encode_output(df_clean, output_format), outputs['output'])
+    
+    stats.pop('sample_skipped', None)
+    error_log = stats.pop('error_log')
+    if len(error_log):
+        outputs['errors'] = f"{output_base}.hatalar.csv"
+        _write_atomic([error_log.to_csv_bytes()], outputs['errors'])
+    
+    rule_report = stats.pop('rule_report', None)
+    if rule_report is not None and not rule_report.empty:
+        outputs['rule_report'] = f"{output_base}.kural_ihlalleri.csv"
+        _write_atomic([rule_report.to_csv(index=False).encode('utf-8-sig')], outputs['rule_report'])
+    
+    manifest.update(
+        status=STATUS_DONE,
+        mapping=mapping,
+        amount_total=format_decimal(total_kurus(df_clean[AMOUNT_COLUMN]) if not df_clean.empty else 0),
+        errors=error_log.counts(),
+        stats=stats,
+        outputs={key: os.path.basename(value) for key, value in outputs.items()},
+        bytes=written,
+        elapsed=round(time.perf_counter() - start, 3),
+    )
+    return manifest
+
+
+def _ignore_interrupt():
+    """Worker'lar Ctrl+C'yi yok sayar; durdurmayı ana süreç yönetir."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _unique_path(directory, stem, suffix, exists):
+    """Ad kullanılıyorsa zaman damgası (ve gerekirse sayaç) ekler."""
+    path = os.path.join(directory, stem + suffix)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    counter = 1
+    while exists(path):
+        path = os.path.join(directory, f"{stem}_{stamp}{'' if counter == 1 else f'_{counter}'}{suffix}")
+        counter += 1
+    return path
+
+
+class FolderWatcher:
+    """
+    Giriş dizinini izleyip hazır dosyaları süreç havuzunda dönüştürür.
+    
+    Args:
+        input_dir (str): İzlenen dizin
+        output_dir (str): Çıktı ve manifesto dizini
+        workers (int): Süreç havuzundaki worker sayısı (aynı anda işlenen en fazla dosya)
+        output_format (str): 'csv', 'ndjson' veya 'parquet'
+        mappings_dir (str): Kayıtlı eşleştirme dizini (None ise MAPPINGS_DIR)
+        auto_mapping (bool): Kayıtlı eşleştirmesi olmayan dosyalara otomatik öneri uygulansın mı?
+        rules (list): Doğrulama kuralı tanımları (load_rules çıktısı)
+        backend (str): Temizleme motoru
+        settle_seconds (float): Dosyanın hazır sayılması için sabit kalma süresi
+        poll_seconds (float): Tarama aralığı
+        log (callable): Olay satırlarını yazan fonksiyon
+    """
+    
+    def __init__(self, input_dir, output_dir, workers=None, output_format='csv', mappings_dir=None,
+                 auto_mapping=False, rules=None, backend=None, settle_seconds=SETTLE_SECONDS,
+                 poll_seconds=POLL_SECONDS, log=print):
+        self.input_dir = input_dir
+        self.output_dir = output_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.output_format = output_format
+        self.mappings_dir = mappings_dir
+        self.auto_mapping = auto_mapping
+        self.rules = rules
+        self.backend = backend
+        self.poll_seconds = poll_seconds
+        self.log = log
+        self.tracker = SettleTracker(settle_seconds)
+        self.counts = {STATUS_DONE: 0, STATUS_FAILED: 0, STATUS_UNMATCHED: 0}
+        self._running = {}
+        self._reserved = set()
+        self._crashes = {}
+        self._stop = False
+        self._executor = None
+    
+    def _new_executor(self):
+        # Worker'lar belirli sayıda dosyadan sonra yenilenir; pandas'ın tuttuğu bellek birikmez
+        options = {'max_tasks_per_child': MAX_TASKS_PER_CHILD} if sys.version_info >= (3, 11) else {}
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_ignore_interrupt, **options)
+    
+    def stop(self):
+        """Yeni dosya almayı bırakır; işlenen dosyalar bittikten sonra run döner."""
+        self._stop = True
+    
+    def _submit(self, name):
+        base = _unique_path(
+            self.output_dir, os.path.splitext(name)[0], '',
+            lambda path: path in self._reserved or os.path.exists(path + '.manifest.json')
+        )
+        self._reserved.add(base)
+        future = self._executor.submit(
+            convert_file, os.path.join(self.input_dir, name), base, self.output_format, self.mappings_dir,
+            self.auto_mapping, self.rules, self.backend
+        )
+        self._running[future] = (name, base)
+    
+    def _finish(self, name, base, manifest):
+        """Girdiyi durumuna göre alt klasöre taşır, manifestoyu ve günlük satırını yazar."""
+        status = manifest['status']
+        target_dir = os.path.join(self.input_dir, {STATUS_DONE: DONE_DIR, STATUS_UNMATCHED: UNMATCHED_DIR}.get(
+            status, FAILED_DIR))
+        os.makedirs(target_dir, exist_ok=True)
+        target = _unique_path(target_dir, *os.path.splitext(name), os.path.exists)
+        try:
+            os.replace(os.path.join(self.input_dir, name), target)
+            manifest['moved_to'] = os.path.relpath(target, self.input_dir)
+        except FileNotFoundError:
+            # Dosya işlenirken dizinden kaldırılmış
+            manifest['moved_to'] = None
+        manifest['finished_at'] = datetime.now().isoformat(timespec='seconds')
+        text = json.dumps(manifest, ensure_ascii=False, default=str)
+        _write_atomic([json.dumps(manifest, ensure_ascii=False, indent=2, default=str).encode('utf-8')],
+                      base + '.manifest.json')
+        with open(os.path.join(self.output_dir, MANIFEST_JOURNAL), 'a', encoding='utf-8') as f:
+            f.write(text + '\n')
+        
+        self._reserved.discard(base)
+        self.counts[status] += 1
+        if status == STATUS_DONE:
+            self.log(f"✅ {name} → {manifest['outputs']['output']} ({manifest['stats']['processed_rows']:,} satır, "
+                     f"{manifest['elapsed']:.2f} sn)")
+        elif status == STATUS_UNMATCHED:
+            self.log(f"❔ {name}: kayıtlı eşleştirme yok (parmak izi {manifest['fingerprint']}) "
+                     f"→ {UNMATCHED_DIR}/")
+        else:
+            self.log(f"❌ {name}: {manifest['error']} → {FAILED_DIR}/")
+    
+    def _collect(self, timeout=0):
+        """Biten işleri toplar (timeout kadar en az birinin bitmesini bekler)."""
+        if not self._running:
+            return
+        done, _ = wait(list(self._running), timeout=timeout, return_when=FIRST_COMPLETED)
+        broken = False
+        for future in done:
+            name, base = self._running.pop(future)
+            try:
+                manifest = future.result()
+            except BrokenProcessPool:
+                # Çöken worker'daki dosya bilinemez: havuzdaki dosyalar bir kez daha denenir
+                broken = True
+                self._reserved.discard(base)
+                self._crashes[name] = self._crashes.get(name, 0) + 1
+                if self._crashes[name] <= MAX_CRASH_RETRIES:
+                    self.log(f"⚠️ {name}: worker süreci çöktü, yeniden denenecek")
+                    continue
+                manifest = {'input': name, 'status': STATUS_FAILED,
+                            'error': "Worker süreci çöktü (bellek yetersiz olabilir)"}
+            except Exception as e:
+                manifest = {'input': name, 'status': STATUS_FAILED, 'error': str(e)}
+            self._crashes.pop(name, None)
+            self._finish(name, base, manifest)
+        if broken:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._new_executor()
+    
+    def poll(self):
+        """
+        Tek tarama: biten işleri toplar, hazır dosyaları boşta worker olduğu kadar gönderir.
+        
+        Returns:
+            int: İşlenen veya işlenmeyi bekleyen (yazımı sürenler dahil) dosya sayısı
+        """
+        self._collect()
+        candidates = list_candidates(self.input_dir)
+        running = {name for name, _ in self._running.values()}
+        ready = [name for name in self.tracker.update(candidates) if name not in running]
+        for name in ready[:max(self.workers - len(self._running), 0)]:
+            self._submit(name)
+        pending = {name for name, signature in candidates.items() if signature[0] > 0}
+        return len(pending | running)
+    
+    def run(self, once=False):
+        """
+        İzlemeyi başlatır; stop() çağrılana kadar (once ise dizin boşalınca) döner.
+        
+        Args:
+            once (bool): Dizindeki dosyalar bitince çık (zamanlanmış görevler için)
+        
+        Returns:
+            dict: Durum bazında dosya sayıları
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._executor = self._new_executor()
+        try:
+            while not self._stop:
+                if not self.poll() and once:
+                    break
+                if self._running:
+                    self._collect(timeout=self.poll_seconds)
+                else:
+                    time.sleep(self.poll_seconds)
+            # Durdurulurken işlenen dosyalar tamamlanır (yarım çıktı bırakılmaz)
+            while self._running:
+                self._collect(timeout=None)
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        return dict(self.counts)
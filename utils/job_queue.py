@@ -0,0 +1,191 @@
+"""
+Arka Plan İş Kuyruğu
+Bu modül, uzun süren dosya okuma ve temizleme işlemlerini Streamlit betik
+thread'ini bloklamadan çalıştıran süreç içi iş kuyruğunu içerir. Her iş bir
+kimlik, durum, ilerleme ve iptal bayrağı taşır; biten işlerin sonuçları
+alınana kadar saklanır.
+"""
+
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+# İş durumları
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+ACTIVE_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+
+class JobCancelled(Exception):
+    """İş, kullanıcı tarafından iptal edildiğinde ilerleme bildiriminde fırlatılır."""
+
+
+class Job:
+    """Kuyruktaki tek bir işin durumu."""
+    
+    def __init__(self, kind):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.status = JOB_QUEUED
+        self.progress = 0.0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.traceback = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self._cancel_event = threading.Event()
+    
+    @property
+    def is_active(self):
+        return self.status in ACTIVE_STATUSES
+    
+    @property
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+    
+    def report(self, fraction, message=None):
+        """
+        İlerleme bildirir; iptal istenmişse JobCancelled fırlatır.
+        İş fonksiyonlarına progress_callback olarak verilir.
+        
+        Args:
+            fraction (float): 0-1 arası ilerleme
+            message (str): Kısa durum mesajı
+        """
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+        self.progress = min(max(float(fraction), 0.0), 1.0)
+        if message is not None:
+            self.message = message
+
+
+class JobManager:
+    """
+    İşleri bir thread havuzunda çalıştırır ve durumlarını saklar.
+    
+    Args:
+        max_workers (int): Eşzamanlı çalışan iş sayısı
+        keep_finished (int): Saklanacak en fazla bitmiş iş sayısı
+        result_ttl (int): Alınmayan sonuçların saklanma süresi (saniye)
+    """
+    
+    def __init__(self, max_workers=2, keep_finished=50, result_ttl=3600):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='cevirici-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._keep_finished = keep_finished
+        self._result_ttl = result_ttl
+    
+    def submit(self, kind, func, *args, **kwargs):
+        """
+        Yeni iş ekler. func, ilerleme için progress_callback anahtar argümanını almalıdır.
+        
+        Args:
+            kind (str): İş türü (örn: 'ingest', 'clean')
+            func (callable): Çalıştırılacak fonksiyon
+        
+        Returns:
+            str: İş kimliği
+        """
+        job = Job(kind)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job.id
+    
+    def _run(self, job, func, args, kwargs):
+        if job.cancel_requested:
+            self._finish(job, JOB_CANCELLED)
+            return
+        
+        job.status = JOB_RUNNING
+        try:
+            job.result = func(*args, progress_callback=job.report, **kwargs)
+            job.progress = 1.0
+            self._finish(job, JOB_DONE)
+        except JobCancelled:
+            self._finish(job, JOB_CANCELLED)
+        except Exception as e:
+            job.error = str(e)
+            job.traceback = traceback.format_exc()
+            self._finish(job, JOB_FAILED)
+    
+    def _finish(self, job, status):
+        job.status = status
+        job.finished_at = time.time()
+    
+    def _prune(self):
+        """Süresi dolmuş ve fazla sayıdaki bitmiş işleri siler (kilit altında çağrılır)."""
+        now = time.time()
+        finished = sorted(
+            (job for job in self._jobs.values() if not job.is_active),
+            key=lambda job: job.finished_at or 0
+        )
+        expired = [job for job in finished if now - (job.finished_at or now) > self._result_ttl]
+        overflow = finished[:max(len(finished) - self._keep_finished, 0)]
+        for job in expired + overflow:
+            self._jobs.pop(job.id, None)
+    
+    def get(self, job_id):
+        """
+        İş durumunu döndürür.
+        
+        Args:
+            job_id (str): İş kimliği
+        
+        Returns:
+            Job: İş (bulunamazsa None)
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def cancel(self, job_id):
+        """
+        İş için iptal ister. Çalışan iş bir sonraki ilerleme bildiriminde durur.
+        
+        Args:
+            job_id (str): İş kimliği
+        """
+        job = self.get(job_id)
+        if job is not None and job.is_active:
+            job._cancel_event.set()
+    
+    def pop_result(self, job_id):
+        """
+        Bitmiş işin sonucunu alır ve işi kuyruktan siler.
+        
+        Args:
+            job_id (str): İş kimliği
+        
+        Returns:
+            object: İş sonucu (iş bitmemişse None)
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JOB_DONE:
+                return None
+            del self._jobs[job_id]
+            return job.result
+    
+    def list_jobs(self):
+        """
+        Tüm işlerin özetini döndürür.
+        
+        Returns:
+            list: [{'id', 'kind', 'status', 'progress', 'message'}, ...]
+        """
+        with self._lock:
+            return [
+                {'id': job.id, 'kind': job.kind, 'status': job.status,
+                 'progress': job.progress, 'message': job.message}
+                for job in self._jobs.values()
+            ]
@@ -0,0 +1,162 @@
+"""
+Dosya Düzeni Parmak İzleri ve Kayıtlı Eşleştirmeler
+Bu modül, bir listenin sütun düzenini içerikten bağımsız bir parmak iziyle
+tanımlar ve parmak izine göre kaydedilmiş sütun eşleştirmelerini saklar.
+Aynı kurumdan her ay gelen listeler aynı düzende olduğundan eşleştirme bir
+kez kaydedilir, sonraki dosyalarda (örn: izlenen klasöre bırakılanlarda)
+otomatik uygulanır.
+
+Parmak izi sütun sayısı ile başlık etiketlerinden (başlık yoksa örnek
+satırlardaki sütun türlerinden: TC, sayısal, metin, boş) hesaplanır; tutarlar,
+isimler ve satır sayısı parmak izini değiştirmez.
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+
+from utils.data_processor import _normalize_header_cell
+
+
+# Kayıtlı eşleştirmelerin dizini (parmak izi başına bir JSON dosyası)
+MAPPINGS_DIR = os.environ.get('CEVIRICI_MAPPINGS_DIR', os.path.join('data', 'eslestirmeler'))
+
+# Başlıksız dosyalarda sütun türü için incelenen satır sayısı
+FINGERPRINT_SAMPLE_ROWS = 50
+
+# Sütun türleri
+KIND_TC = 'tc'
+KIND_NUMERIC = 'numeric'
+KIND_TEXT = 'text'
+KIND_EMPTY = 'empty'
+
+_TC_VALUE = re.compile(r'\d{11}')
+_NUMERIC_VALUE = re.compile(r'-?[\d.,]*\d[\d.,]*')
+
+
+def column_kind(values):
+    """
+    Sütunun türünü örnek değerlerin çoğunluğuna göre belirler. Tam sayı ve
+    ondalık değerler aynı türdür (aynı düzendeki dosyalarda tutarlar kimi ay
+    kuruşsuz gelebilir).
+    
+    Args:
+        values (list): Sütunun örnek değerleri (metin)
+    
+    Returns:
+        str: KIND_TC, KIND_NUMERIC, KIND_TEXT veya KIND_EMPTY
+    """
+    values = [value.strip() for value in values if value and value.strip()]
+    if not values:
+        return KIND_EMPTY
+    if sum(1 for value in values if _TC_VALUE.fullmatch(value)) * 2 > len(values):
+        return KIND_TC
+    if sum(1 for value in values if _NUMERIC_VALUE.fullmatch(value)) * 2 > len(values):
+        return KIND_NUMERIC
+    return KIND_TEXT
+
+
+def layout_signature(df_raw, column_labels=None, sample_rows=FINGERPRINT_SAMPLE_ROWS):
+    """
+    Dosya düzeninin parmak izine giren yapısal özetini döndürür.
+    
+    Args:
+        df_raw (pd.DataFrame): Ham veri
+        column_labels (list): Dosyadaki sütun başlıkları (bkz. pipeline.read_source; yoksa None)
+        sample_rows (int): Başlıksız dosyalarda incelenen satır sayısı
+    
+    Returns:
+        dict: {'columns': int, 'labels': list} veya {'columns': int, 'kinds': list}
+    """
+    if column_labels:
+        labels = [' '.join(_normalize_header_cell(str(label)).split()) for label in column_labels]
+        return {'columns': len(df_raw.columns), 'labels': labels}
+    
+    sample = df_raw.head(sample_rows)
+    kinds = [
+        column_kind(['' if value is None else str(value) for value in sample[col].tolist()])
+        for col in df_raw.columns
+    ]
+    return {'columns': len(df_raw.columns), 'kinds': kinds}
+
+
+def layout_fingerprint(df_raw, column_labels=None):
+    """
+    Dosya düzeninin parmak izini hesaplar.
+    
+    Args:
+        df_raw (pd.DataFrame): Ham veri
+        column_labels (list): Dosyadaki sütun başlıkları (yoksa None)
+    
+    Returns:
+        str: 16 karakterlik parmak izi
+    """
+    signature = json.dumps(layout_signature(df_raw, column_labels), ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(signature.encode('utf-8')).hexdigest()[:16]
+
+
+def mapping_path(fingerprint, directory=None):
+    """
+    Parmak izinin eşleştirme dosyasının yolu.
+    
+    Args:
+        fingerprint (str): Parmak izi
+        directory (str): Eşleştirme dizini (None ise MAPPINGS_DIR)
+    
+    Returns:
+        str: Dosya yolu
+    """
+    return os.path.join(directory or MAPPINGS_DIR, f"{fingerprint}.json")
+
+
+def load_saved_mapping(fingerprint, directory=None):
+    """
+    Parmak izi için kaydedilmiş eşleştirmeyi okur.
+    
+    Args:
+        fingerprint (str): Parmak izi
+        directory (str): Eşleştirme dizini (None ise MAPPINGS_DIR)
+    
+    Returns:
+        dict veya None: Sütun eşleştirme haritası (kayıt yoksa None)
+    """
+    path = mapping_path(fingerprint, directory)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)['mapping']
+    except (ValueError, KeyError) as e:
+        raise ValueError(f"Kayıtlı eşleştirme okunamadı ({path}): {e}") from e
+
+
+def save_mapping(fingerprint, mapping, directory=None, example=None, column_labels=None):
+    """
+    Eşleştirmeyi parmak izine kaydeder (varsa üzerine yazar).
+    
+    Args:
+        fingerprint (str): Parmak izi
+        mapping (dict): Sütun eşleştirme haritası
+        directory (str): Eşleştirme dizini (None ise MAPPINGS_DIR)
+        example (str): Eşleştirmenin yapıldığı örnek dosyanın adı
+        column_labels (list): Örnek dosyanın sütun başlıkları (kontrol için saklanır)
+    
+    Returns:
+        str: Yazılan dosyanın yolu
+    """
+    path = mapping_path(fingerprint, directory)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    record = {
+        'fingerprint': fingerprint,
+        'mapping': mapping,
+        'example': example,
+        'header_labels': column_labels,
+        'saved_at': datetime.now().isoformat(timespec='seconds'),
+    }
+    # İzleyici okurken yarım dosya görmesin diye önce geçici dosyaya yazılır
+    with open(path + '.part', 'w', encoding='utf-8') as f:
+        json.dump(record, f, ensure_ascii=False, indent=2)
+    os.replace(path + '.part', path)
+    return path
@@ -0,0 +1,44 @@
+"""
+Gecikmeli (Lazy) Modül Yükleme
+Bu modül, pandas ve numpy gibi ağır kütüphanelerin içe aktarılmasını ilk
+kullanıldıkları ana kadar erteler. Uygulamanın ilk sayfası (dosya yükleme)
+bu kütüphaneler yüklenmeden açılır; soğuk başlatma süresi kısalır.
+"""
+
+import importlib
+
+
+class LazyModule:
+    """
+    İlk öznitelik erişiminde gerçek modülü yükleyen vekil nesne.
+    Yükleme importlib üzerinden yapıldığı için thread'ler arasında güvenlidir;
+    yüklemeden sonra modülün öznitelikleri vekile kopyalanır, sonraki erişimler
+    ek maliyet getirmez.
+    
+    Args:
+        name (str): Modül adı (örn: 'pandas')
+    """
+    
+    def __init__(self, name):
+        self._lazy_name = name
+    
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._lazy_name)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+    
+    def __repr__(self):
+        return f"<LazyModule {self._lazy_name!r}>"
+
+
+def lazy_import(name):
+    """
+    Modülü ilk kullanımda yüklenecek şekilde döndürür.
+    
+    Args:
+        name (str): Modül adı
+    
+    Returns:
+        LazyModule: Modül vekili
+    """
+    return LazyModule(name)
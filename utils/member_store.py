@@ -0,0 +1,309 @@
+"""
+Yerel Üye Deposu
+Bu modül, temizlenmiş listelerin TC Kimlik No ve dönem bazında saklandığı
+yerel SQLite deposunu yönetir. Sorgular indeksler üzerinden çalışır; eski
+dosyaları yeniden okumaya ve temizlemeye gerek kalmaz.
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from utils.lazy_imports import lazy_import
+from utils.money import to_export_frame
+
+pd = lazy_import('pandas')
+
+
+# Depo dosyasının varsayılan konumu (ortam değişkeni ile değiştirilebilir)
+DEFAULT_STORE_PATH = os.environ.get('CEVIRICI_STORE_PATH', os.path.join('data', 'uye_deposu.sqlite3'))
+
+# Temiz liste sütunları -> depo sütunları
+STORE_COLUMNS = {
+    "TC Kimlik No": "tc_no",
+    "Üye No": "member_no",
+    "Adı": "first_name",
+    "Soyadı": "last_name",
+    "Aidat Tutarı": "amount",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    tc_no TEXT NOT NULL,
+    period TEXT NOT NULL,
+    member_no TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    last_name_key TEXT,
+    amount REAL,
+    source TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (tc_no, period)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_members_last_name ON members (last_name_key);
+CREATE INDEX IF NOT EXISTS idx_members_member_no ON members (member_no);
+"""
+
+_UPSERT_SQL = """
+INSERT INTO members (tc_no, period, member_no, first_name, last_name, last_name_key, amount, source, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (tc_no, period) DO UPDATE SET
+    member_no = excluded.member_no,
+    first_name = excluded.first_name,
+    last_name = excluded.last_name,
+    last_name_key = excluded.last_name_key,
+    amount = excluded.amount,
+    source = excluded.source,
+    updated_at = excluded.updated_at
+"""
+
+_SELECT_COLUMNS = "tc_no, period, member_no, first_name, last_name, amount, source, updated_at"
+
+# Sorgu sonuçlarının gösterim isimleri
+_RESULT_COLUMNS = {
+    'tc_no': "TC Kimlik No",
+    'period': "Dönem",
+    'member_no': "Üye No",
+    'first_name': "Adı",
+    'last_name': "Soyadı",
+    'amount': "Aidat Tutarı",
+    'source': "Kaynak",
+    'updated_at': "Güncelleme",
+}
+
+
+def normalize_surname_key(text):
+    """
+    Soyadını indeksli arama için normalize eder (Türkçe büyük harf).
+    
+    Args:
+        text (str): Soyadı
+    
+    Returns:
+        str: Arama anahtarı
+    """
+    if not isinstance(text, str):
+        return ""
+    # Python'un upper() fonksiyonu 'i' -> 'I' yapar; Türkçe kuralı önce uygula
+    return text.strip().replace('i', 'İ').replace('ı', 'I').upper()
+
+
+def open_store(path=None):
+    """
+    Üye deposunu açar, yoksa şemayı oluşturur.
+    
+    Args:
+        path (str): SQLite dosya yolu (None ise varsayılan konum)
+    
+    Returns:
+        sqlite3.Connection: Depo bağlantısı
+    """
+    path = path or DEFAULT_STORE_PATH
+    if path != ':memory:':
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    
+    # Thread'e bağlı bağlantılar thread bittikten sonra başka thread'de kapanabilir (bkz. ThreadConnections)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+class ThreadConnections:
+    """
+    Aynı depoya her thread için ayrı bağlantı açar. Streamlit oturumları
+    betiği ayrı thread'lerde çalıştırır; tek bağlantı paylaşılırsa bir
+    oturumun `with conn:` işlemi diğerinin commit/rollback'iyle iç içe geçer.
+    WAL kipinde ayrı bağlantılar eşzamanlı okur, yazmalar sırayla yapılır.
+    """
+    
+    def __init__(self, path=None):
+        self.path = path
+        self._local = threading.local()
+    
+    def get(self):
+        """
+        Geçerli thread'in bağlantısını döndürür (ilk çağrıda açılır; thread
+        bitince bağlantı da kapanır).
+        
+        Returns:
+            sqlite3.Connection: Depo bağlantısı
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = open_store(self.path)
+        return conn
+
+
+def upsert_members(conn, df_clean, period, source=None):
+    """
+    Temizlenmiş listeyi (TC Kimlik No, dönem) anahtarıyla depoya yazar.
+    Aynı dönemde tekrar yüklenen kayıtlar güncellenir.
+    
+    Args:
+        conn (sqlite3.Connection): Depo bağlantısı
+        df_clean (pd.DataFrame): apply_column_mapping çıktısı
+        period (str): Dönem (örn: '2026-05')
+        source (str): Kaynak dosya adı
+    
+    Returns:
+        int: Yazılan kayıt sayısı
+    """
+    if df_clean is None or df_clean.empty:
+        return 0
+    
+    # Depoda tutar TL (REAL) olarak saklanır; önceki kayıtlarla uyumlu kalır
+    df_clean = to_export_frame(df_clean)
+    count = len(df_clean)
+    updated_at = datetime.now().isoformat(timespec='seconds')
+    
+    # Satır satır tuple üretmek yerine sütun listelerini zip'le (hızlı toplu yazma)
+    columns = {
+        key: df_clean[col].astype(object).where(df_clean[col].notna(), None).tolist()
+        if col in df_clean.columns else [None] * count
+        for col, key in STORE_COLUMNS.items()
+    }
+    last_name_keys = [normalize_surname_key(v) for v in columns['last_name']]
+    
+    rows = zip(
+        columns['tc_no'],
+        [period] * count,
+        columns['member_no'],
+        columns['first_name'],
+        columns['last_name'],
+        last_name_keys,
+        columns['amount'],
+        [source] * count,
+        [updated_at] * count,
+    )
+    
+    with conn:
+        conn.executemany(_UPSERT_SQL, rows)
+    
+    return count
+
+
+def _query(conn, where, params, limit):
+    sql = f"SELECT {_SELECT_COLUMNS} FROM members WHERE {where} ORDER BY period DESC, last_name_key LIMIT ?"
+    df = pd.read_sql_query(sql, conn, params=list(params) + [limit])
+    return df.rename(columns=_RESULT_COLUMNS)
+
+
+def lookup_members(conn, tc_no=None, last_name=None, member_no=None, period=None, limit=500):
+    """
+    Depoda indeksli arama yapar. Verilen kriterler VE ile birleştirilir.
+    Soyadı araması önek (prefix) eşleşmesidir.
+    
+    Args:
+        conn (sqlite3.Connection): Depo bağlantısı
+        tc_no (str): TC Kimlik No (tam eşleşme)
+        last_name (str): Soyadı öneki
+        member_no (str): Üye No (tam eşleşme)
+        period (str): Dönem filtresi
+        limit (int): Maksimum sonuç sayısı
+    
+    Returns:
+        pd.DataFrame: Eşleşen kayıtlar
+    """
+    conditions = []
+    params = []
+    
+    if tc_no:
+        conditions.append("tc_no = ?")
+        params.append(str(tc_no).strip())
+    if last_name:
+        # LIKE yerine aralık sorgusu: indeks kullanılır
+        key = normalize_surname_key(last_name)
+        conditions.append("last_name_key >= ? AND last_name_key < ?")
+        params.extend([key, key + '\uffff'])
+    if member_no:
+        conditions.append("member_no = ?")
+        params.append(str(member_no).strip())
+    if period:
+        conditions.append("period = ?")
+        params.append(period)
+    
+    if not conditions:
+        return pd.DataFrame(columns=list(_RESULT_COLUMNS.values()))
+    
+    return _query(conn, " AND ".join(conditions), params, limit)
+
+
+def member_history(conn, tc_no, limit=120):
+    """
+    Bir üyenin tüm dönemlerdeki kayıtlarını döndürür.
+    
+    Args:
+        conn (sqlite3.Connection): Depo bağlantısı
+        tc_no (str): TC Kimlik No
+        limit (int): Maksimum dönem sayısı
+    
+    Returns:
+        pd.DataFrame: Dönem bazında kayıtlar (yeniden eskiye)
+    """
+    return _query(conn, "tc_no = ?", [str(tc_no).strip()], limit)
+
+
+def count_members(conn):
+    """
+    Depodaki toplam kayıt sayısını döndürür (pandas yüklemeden).
+    
+    Args:
+        conn (sqlite3.Connection): Depo bağlantısı
+    
+    Returns:
+        int: Kayıt sayısı
+    """
+    return conn.execute("SELECT COUNT(*) FROM members").fetchone()[0]
+
+
+def store_version(conn):
+    """
+    Deponun içeriğini özetleyen sürüm bilgisi (kayıt sayısı, son güncelleme);
+    depodan türetilen önbellekler bununla geçersiz kılınır.
+    
+    Args:
+        conn (sqlite3.Connection): Depo bağlantısı
+    
+    Returns:
+        tuple: (int: kayıt sayısı, str: son güncelleme zamanı)
+    """
+    return tuple(conn.execute("SELECT COUNT(*), MAX(updated_at) FROM members").fetchone())
+
+
+def load_member_roll(conn):
+    """
+    İsimle eşleştirme için üye listesini yükler: her TC için en son dönemdeki
+    üye no, ad ve soyad (bkz. utils/name_matching.py).
+    
+    Args:
+        conn (sqlite3.Connection): Depo bağlantısı
+    
+    Returns:
+        pd.DataFrame: tc_no, member_no, first_name, last_name sütunları
+    """
+    # SQLite'ta MAX() ile seçilen satırın diğer sütunları da o satırdan gelir
+    df = pd.read_sql_query(
+        "SELECT tc_no, member_no, first_name, last_name, MAX(period) AS period FROM members GROUP BY tc_no",
+        conn
+    )
+    return df.drop(columns='period')
+
+
+def list_periods(conn):
+    """
+    Depodaki dönemleri ve kayıt sayılarını listeler.
+    
+    Args:
+        conn (sqlite3.Connection): Depo bağlantısı
+    
+    Returns:
+        pd.DataFrame: Dönem, kayıt sayısı ve toplam tutar
+    """
+    return pd.read_sql_query(
+        "SELECT period AS 'Dönem', COUNT(*) AS 'Kayıt', SUM(amount) AS 'Toplam Tutar' "
+        "FROM members GROUP BY period ORDER BY period DESC",
+        conn
+    )
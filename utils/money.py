@@ -0,0 +1,169 @@
+"""
+Kuruş Hassasiyetinde Tutar Aritmetiği
+Bu modül, temiz listedeki "Aidat Tutarı" sütununun kuruş cinsinden tam sayı
+(int64) olarak tutulmasına dayanan yardımcıları içerir. Toplam, ortalama ve
+grup toplamları tam sayılarla hesaplanır; float'a (TL) yalnızca dışa aktarma
+ve gösterim sınırında çevrilir.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+
+from utils.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+
+
+# Temiz listedeki tutar sütunu
+AMOUNT_COLUMN = "Aidat Tutarı"
+
+# 1 TL = 100 kuruş
+KURUS_PER_LIRA = 100
+
+
+def is_kurus(series):
+    """
+    Tutar sütununun kuruş (tam sayı) cinsinden olup olmadığını döndürür.
+    
+    Args:
+        series (pd.Series): Tutar sütunu
+    
+    Returns:
+        bool: Sütun tam sayı tipliyse True
+    """
+    return np.issubdtype(series.dtype, np.integer)
+
+
+def kurus_to_lira(values):
+    """
+    Kuruş değerlerini TL'ye (float64) çevirir. k/100 bölümü, "k/100" ondalık
+    metnine en yakın float'ı verir; yani iki basamaklı gösterim kayıpsızdır.
+    
+    Args:
+        values (np.ndarray veya pd.Series): Kuruş değerleri
+    
+    Returns:
+        np.ndarray veya pd.Series: TL değerleri
+    """
+    return values / KURUS_PER_LIRA
+
+
+def lira_to_kurus(values):
+    """
+    TL değerlerini (float) en yakın kuruşa yuvarlayarak int64'e çevirir.
+    
+    Args:
+        values (float, np.ndarray veya pd.Series): TL değerleri
+    
+    Returns:
+        int64 değer(ler): Kuruş değerleri
+    """
+    return np.rint(np.asarray(values, dtype=float) * KURUS_PER_LIRA).astype(np.int64)
+
+
+def total_kurus(series):
+    """
+    Tutar sütununun tam toplamını döndürür (Python int).
+    
+    Args:
+        series (pd.Series): Kuruş cinsinden tutar sütunu
+    
+    Returns:
+        int: Toplam (kuruş)
+    """
+    # int64 toplamı ancak ~9.2e16 TL üzerinde taşar
+    return int(series.sum()) if len(series) else 0
+
+
+def mean_kurus(series):
+    """
+    Tutar sütununun ortalamasını kuruşa yarım yukarı yuvarlayarak döndürür.
+    
+    Args:
+        series (pd.Series): Kuruş cinsinden tutar sütunu
+    
+    Returns:
+        int: Ortalama (kuruş); boş sütunda 0
+    """
+    return divide_kurus(total_kurus(series), len(series))
+
+
+def divide_kurus(total, count):
+    """
+    Kuruş toplamını adede bölüp yarım yukarı yuvarlar (önceden hesaplanmış
+    toplamlardan ortalama almak için; sütun yeniden taranmaz).
+    
+    Args:
+        total (int): Toplam (kuruş)
+        count (int): Kayıt sayısı
+    
+    Returns:
+        int: Ortalama (kuruş); adet 0 ise 0
+    """
+    if count == 0:
+        return 0
+    quotient = Decimal(int(total)) / Decimal(int(count))
+    return int(quotient.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def group_totals(df, by, column=AMOUNT_COLUMN):
+    """
+    Grup bazında tam tutar toplamlarını döndürür.
+    
+    Args:
+        df (pd.DataFrame): Temizlenmiş veri
+        by (str): Gruplama sütunu (örn: "Kaynak")
+        column (str): Tutar sütunu
+    
+    Returns:
+        dict: grup -> toplam (kuruş, int)
+    """
+    sums = df.groupby(by, sort=False)[column].sum()
+    return {key: int(value) for key, value in sums.items()}
+
+
+def format_decimal(kurus):
+    """
+    Kuruş değerini ayırıcısız ondalık metne çevirir (örn: 123456 -> "1234.56").
+    
+    Args:
+        kurus (int): Kuruş değeri
+    
+    Returns:
+        str: Ondalık metin
+    """
+    kurus = int(kurus)
+    sign = '-' if kurus < 0 else ''
+    lira, cents = divmod(abs(kurus), KURUS_PER_LIRA)
+    return f"{sign}{lira}.{cents:02d}"
+
+
+def format_lira(kurus):
+    """
+    Kuruş değerini gösterim metnine çevirir (örn: 123456 -> "1,234.56 ₺").
+    
+    Args:
+        kurus (int): Kuruş değeri
+    
+    Returns:
+        str: Biçimlendirilmiş tutar
+    """
+    kurus = int(kurus)
+    sign = '-' if kurus < 0 else ''
+    lira, cents = divmod(abs(kurus), KURUS_PER_LIRA)
+    return f"{sign}{lira:,}.{cents:02d} ₺"
+
+
+def to_export_frame(df):
+    """
+    Dışa aktarma için tutar sütunu TL (float64) olan bir kopya döndürür.
+    Tutar zaten TL ise (veya sütun yoksa) aynı DataFrame döner.
+    
+    Args:
+        df (pd.DataFrame): Temizlenmiş veri
+    
+    Returns:
+        pd.DataFrame: Tutarı TL cinsinden veri
+    """
+    if AMOUNT_COLUMN not in df.columns or not is_kurus(df[AMOUNT_COLUMN]):
+        return df
+    return df.assign(**{AMOUNT_COLUMN: kurus_to_lira(df[AMOUNT_COLUMN])})
@@ -0,0 +1,296 @@
+"""
+Çoklu Kaynak Okuma
+Bu modül, birden fazla dosyanın veya bir Excel dosyasındaki tüm sayfaların
+eşzamanlı okunup tek bir ham veri tablosunda birleştirilmesini sağlar.
+Yüklemeler thread havuzunda diske akıtılır; ayrıştırma süreç havuzunda yapılır
+ve çalışanlara dosya içerikleri yerine yalnızca dosya yolları gönderilir.
+.zip/.gz arşivleri önce üyelerine açılır; her üye ayrı bir kaynak olarak okunur.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+from utils.archive_ingest import expand_archives, is_archive
+from utils.column_cache import upload_digest
+from utils.data_processor import (
+    read_file_with_encoding,
+    find_data_start_row,
+    detect_header,
+    header_labels_for,
+    list_excel_sheets
+)
+from utils.lazy_imports import lazy_import
+from utils.spooled_upload import SpooledUpload, spool_upload
+
+pd = lazy_import('pandas')
+
+
+# Toplam boyut bu eşiğin altındaysa ayrı süreç başlatmanın maliyeti kazancı aşar
+PROCESS_POOL_MIN_BYTES = 2 * 1024 * 1024
+
+# Kademeli okumada önce ayrıştırılan satır sayısı (eşleştirme ekranı bu önizlemeyle açılır)
+PREVIEW_ROWS = 5000
+
+# Bu boyutun altındaki dosyalar önizlemesiz, tek seferde okunur (Excel sıkıştırılmış
+# olduğundan byte başına ayrıştırma maliyeti metin dosyalarından çok daha yüksektir)
+PROGRESSIVE_MIN_BYTES = 4 * 1024 * 1024
+PROGRESSIVE_MIN_EXCEL_BYTES = 256 * 1024
+
+# Süreç havuzu iş kuyruğunun thread'inden (çok thread'li Streamlit sunucusu içinde)
+# açılır; fork edilen çocuk, başka bir thread'in tuttuğu kilidi kilitli devralıp
+# takılabileceğinden çocuklar temiz bir süreçten (forkserver, yoksa spawn) başlatılır
+POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+class NamedBytesIO(BytesIO):
+    """Bellekteki dosya içeriği; okuma fonksiyonlarının beklediği .name alanını taşır."""
+    
+    def __init__(self, data, name):
+        super().__init__(data)
+        self.name = name
+
+
+def source_label(file_name, sheet_name=None):
+    """
+    Kaynak etiketi oluşturur.
+    
+    Args:
+        file_name (str): Dosya adı
+        sheet_name (str): Excel sayfa adı
+    
+    Returns:
+        str: "dosya.xlsx / Sayfa1" veya "dosya.csv"
+    """
+    if sheet_name is None:
+        return file_name
+    return f"{file_name} / {sheet_name}"
+
+
+def _load_source_specs(uploaded_file, all_sheets):
+    """Dosyayı diske akıtır, gerekiyorsa sayfa listesini çıkarır (I/O işi)."""
+    spooled = spool_upload(uploaded_file)
+    
+    sheets = [None]
+    if all_sheets:
+        sheet_names = list_excel_sheets(spooled)
+        if sheet_names:
+            sheets = sheet_names
+    
+    return spooled, [(spooled.name, spooled.path, sheet) for sheet in sheets]
+
+
+def _parse_source(name, path, sheet_name, skip_rows):
+    """Tek bir kaynağı ayrıştırır (süreç havuzunda çalışır, picklable olmalı)."""
+    with SpooledUpload(path, name) as source:
+        # Her kaynağın başlık yapısı farklı olabilir: atlanacak satırı ayrı tespit et
+        if skip_rows is None:
+            skip_rows = find_data_start_row(source, sheet_name=sheet_name)
+            source.seek(0)
+        
+        df = read_file_with_encoding(source, skip_rows=skip_rows, sheet_name=sheet_name)
+    return df, skip_rows
+
+
+def _collect_results(futures):
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except BrokenProcessPool:
+            raise
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _parse_all(specs, skip_rows, max_workers):
+    """Kaynakları eşzamanlı ayrıştırır; süreç havuzu açılamazsa thread'lere düşer."""
+    workers = max_workers or min(len(specs), os.cpu_count() or 1)
+    total_bytes = sum(os.path.getsize(path) for _, path, _ in specs)
+    
+    if len(specs) > 1 and total_bytes >= PROCESS_POOL_MIN_BYTES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context(POOL_START_METHOD)) as pool:
+                futures = [pool.submit(_parse_source, name, path, sheet, skip_rows) for name, path, sheet in specs]
+                return _collect_results(futures)
+        except (BrokenProcessPool, OSError):
+            pass
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_parse_source, name, path, sheet, skip_rows) for name, path, sheet in specs]
+        return _collect_results(futures)
+
+
+def read_sources(uploaded_files, skip_rows=None, all_sheets=True, max_workers=None):
+    """
+    Birden fazla dosyayı (veya Excel'in tüm sayfalarını) okuyup tek tabloda birleştirir.
+    
+    Args:
+        uploaded_files (list): Streamlit file uploader objeleri
+        skip_rows (int): Atlanacak satır sayısı (None ise her kaynak için otomatik tespit)
+        all_sheets (bool): Excel dosyalarında tüm sayfalar okunsun mu?
+        max_workers (int): Eşzamanlı çalışan sayısı (None ise CPU sayısı)
+    
+    Returns:
+        tuple: (pd.DataFrame: Birleşik ham veri,
+                list: [(etiket, başlangıç, bitiş), ...] kaynak satır aralıkları,
+                dict: Kaynak bazında okuma bilgileri)
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or min(len(uploaded_files), 8) or 1) as io_pool:
+        loaded = list(io_pool.map(lambda f: _load_source_specs(f, all_sheets), uploaded_files))
+    
+    specs = [spec for _, specs in loaded for spec in specs]
+    try:
+        if not specs:
+            raise ValueError("Okunacak dosya bulunamadı.")
+        results = _parse_all(specs, skip_rows, max_workers)
+    finally:
+        # Diske akıtılan geçici dosyaları sil (zaten diskte olanlara dokunulmaz)
+        for spooled, _ in loaded:
+            if spooled not in uploaded_files:
+                spooled.close()
+    
+    frames = []
+    sources = []
+    source_info = {}
+    offset = 0
+    
+    for (name, _, sheet_name), result in zip(specs, results):
+        label = source_label(name, sheet_name)
+        
+        # Aynı isimli iki dosya yüklendiyse etiketleri ayırt et
+        base_label, suffix = label, 2
+        while label in source_info:
+            label = f"{base_label} ({suffix})"
+            suffix += 1
+        
+        if isinstance(result, Exception):
+            source_info[label] = {'error': str(result)}
+            continue
+        
+        df, used_skip = result
+        source_info[label] = {'rows': len(df), 'columns': len(df.columns), 'skip_rows': used_skip}
+        
+        if df.empty:
+            continue
+        
+        frames.append(df)
+        sources.append((label, offset, offset + len(df)))
+        offset += len(df)
+    
+    if not frames:
+        errors = "; ".join(f"{k}: {v['error']}" for k, v in source_info.items() if 'error' in v)
+        raise ValueError(f"Hiçbir kaynak okunamadı. {errors}".strip())
+    
+    combined = pd.concat(frames, ignore_index=True)
+    combined.columns = range(len(combined.columns))
+    
+    return combined, sources, source_info
+
+
+def _upload_size(uploaded_file):
+    """Dosya nesnesinin byte cinsinden boyutu (okuma konumu başa alınır)."""
+    uploaded_file.seek(0, os.SEEK_END)
+    size = uploaded_file.tell()
+    uploaded_file.seek(0)
+    return size
+
+
+def ingest_uploads(uploaded_files, read_all_sheets=False, progress_callback=None, preview_rows=None):
+    """
+    Yüklenen dosyaları okur: tek dosyada başlangıç satırını tespit edip okur,
+    birden fazla dosya/sayfa varsa hepsini birleştirir. Arka plan işi olarak
+    çalıştırılabilir.
+    
+    preview_rows verilirse büyük tek dosyalarda yalnızca ilk preview_rows veri
+    satırı okunur ve sonuç 'complete': False ile döner; dosyanın tamamı ayrı
+    bir işte preview_rows olmadan okunmalıdır. Çoklu kaynaklar, küçük dosyalar
+    ve önizlemeden az satırı olan dosyalar tamamen okunmuş sayılır.
+    
+    .zip/.gz yüklemeleri üyelerine açılıp (bkz. utils/archive_ingest.py) diğer
+    dosyalarla birlikte okunur; tek üyeli bir arşiv tek dosya gibi işlenir.
+    Açılan geçici dosyalar okuma bitince silinir.
+    
+    Args:
+        uploaded_files (list): Streamlit file uploader objeleri
+        read_all_sheets (bool): Excel dosyalarında tüm sayfalar okunsun mu?
+        progress_callback (callable): İlerleme bildirimi, progress_callback(oran, mesaj)
+        preview_rows (int): Önizleme satır sayısı (None ise dosyanın tamamı okunur)
+    
+    Returns:
+        dict: {'raw_df', 'raw_sources', 'source_info', 'skip_rows', 'raw_key', 'header_labels', 'complete'};
+              raw_key yüklemelerin içerik özetidir (temizleme önbelleği anahtarı; yarım önizlemede None),
+              header_labels tek dosyada bulunan sütun başlıklarıdır (yoksa None)
+    """
+    def report(fraction, message):
+        if progress_callback is not None:
+            progress_callback(fraction, message)
+    
+    # Arşivler üyelerine açılır; önbellek anahtarı yüklenen (sıkıştırılmış) dosyalardan hesaplanır
+    if any(is_archive(f.name) for f in uploaded_files):
+        report(0.0, "Arşivler açılıyor")
+    files, extracted = expand_archives(uploaded_files)
+    try:
+        return _ingest_files(files, uploaded_files, read_all_sheets, report, preview_rows)
+    finally:
+        for member in extracted:
+            member.close()
+
+
+def preview_complete(raw_df, preview_rows):
+    """
+    Önizleme okuması dosyanın sonuna ulaştı mı? Okuyucular boş ve kısa
+    (başlık/sayfa) satırlarını ayıkladığından tablonun uzunluğuna değil,
+    ayıklamadan önce okunan satır sayısına (attrs['rows_read']) bakılır.
+    
+    Args:
+        raw_df (pd.DataFrame): read_file_with_encoding çıktısı
+        preview_rows (int): Önizleme satır sayısı (None ise dosyanın tamamı okunmuştur)
+    
+    Returns:
+        bool: Dosyanın tamamı okunduysa True
+    """
+    return preview_rows is None or raw_df.attrs.get('rows_read', len(raw_df)) < preview_rows
+
+
+def _ingest_files(files, uploaded_files, read_all_sheets, report, preview_rows):
+    """ingest_uploads'un arşivler açıldıktan sonraki kısmı (files: okunacak dosyalar)."""
+    if len(files) > 1 or read_all_sheets:
+        raw_key = upload_digest(uploaded_files, read_all_sheets)
+        report(0.0, "Kaynaklar okunuyor")
+        raw_df, raw_sources, source_info = read_sources(files, all_sheets=read_all_sheets)
+        return {'raw_df': raw_df, 'raw_sources': raw_sources, 'source_info': source_info, 'skip_rows': 0,
+                'raw_key': raw_key, 'header_labels': None, 'complete': True}
+    
+    uploaded_file = files[0]
+    
+    # Önizleme: tüm dosya özetlenmez ve ayrıştırılmaz (kalanı ayrı işte okunur)
+    is_excel = uploaded_file.name.endswith(('.xlsx', '.xls'))
+    min_bytes = PROGRESSIVE_MIN_EXCEL_BYTES if is_excel else PROGRESSIVE_MIN_BYTES
+    if preview_rows is not None and _upload_size(uploaded_file) < min_bytes:
+        preview_rows = None
+    raw_key = upload_digest(uploaded_files, read_all_sheets) if preview_rows is None else None
+    
+    # Önce veri başlangıç satırını ve başlıkları dosyanın baş kısmından tespit et
+    report(0.0, "Veri başlangıcı tespit ediliyor")
+    uploaded_file.seek(0)
+    detected = detect_header(uploaded_file)
+    skip_rows = detected['data_start']
+    
+    # Dosyayı oku
+    report(0.2, "Dosya okunuyor" if preview_rows is None else "Önizleme okunuyor")
+    uploaded_file.seek(0)
+    raw_df = read_file_with_encoding(uploaded_file, skip_rows=skip_rows, max_rows=preview_rows)
+    
+    # Önizleme dosyanın sonuna ulaştıysa ayrıca tam okuma işi gerekmez
+    complete = preview_complete(raw_df, preview_rows)
+    if complete and raw_key is None:
+        raw_key = upload_digest(uploaded_files, read_all_sheets)
+    
+    return {'raw_df': raw_df, 'raw_sources': None, 'source_info': None, 'skip_rows': skip_rows,
+            'raw_key': raw_key, 'header_labels': header_labels_for(detected, raw_df),
+            'complete': complete}
@@ -0,0 +1,327 @@
+"""
+İsimle Üye Eşleştirme
+Bu modül, TC Kimlik No'su eksik veya geçersiz satırları referans üye
+listesiyle (örn: üye deposu) ad, soyad ve üye numarasına göre eşleştirir.
+İsimler Türkçe kurallarla sadeleştirilir; her satır yalnızca aynı blok
+anahtarını (soyadı fonetik anahtarı / soyadı öneki + ad baş harfi, üye no)
+taşıyan referans kayıtlarla karşılaştırılır, tüm listeyle değil.
+"""
+
+import re
+
+from utils.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# Kurtarılan satırların temiz listede skorlarının yazıldığı sütun
+MATCH_SCORE_COLUMN = "Eşleşme Skoru"
+
+# Eşleşme sayılması için gereken en düşük benzerlik skoru (0-1)
+MATCH_THRESHOLD = 0.90
+
+# En iyi iki aday farklı kişilerse aralarında en az bu kadar fark olmalı (yoksa belirsiz)
+AMBIGUITY_MARGIN = 0.03
+
+# Üye numarası da aynıysa skora eklenen pay
+MEMBER_NO_BONUS = 0.05
+
+# Skor ağırlıkları (soyadı ad'dan daha ayırt edicidir)
+LAST_NAME_WEIGHT = 0.6
+
+# Fonetik anahtarın uzunluğu ve soyadı öneki uzunluğu
+PHONETIC_KEY_LENGTH = 4
+PREFIX_KEY_LENGTH = 3
+
+
+_ASCII_FOLD = str.maketrans('çğıöşüâîû', 'cgiosuaiu')
+_SILENT = re.compile(r'[aeiouh ]')
+_REPEATED = re.compile(r'(.)\1+')
+
+
+def normalize_names(values):
+    """
+    İsimleri karşılaştırma için sadeleştirir: Türkçe küçük harf, aksansız
+    (ç -> c, ğ -> g, ı -> i ...), harf dışı karakterler boşluk.
+    
+    Args:
+        values (array-like): İsimler
+    
+    Returns:
+        pd.Series: Sadeleştirilmiş isimler
+    """
+    text = pd.Series(values, dtype=object).fillna('').astype(str)
+    
+    # Sadeleştirme benzersiz isimlere uygulanır (aynı isim listede çok kez geçer)
+    codes, uniques = pd.factorize(text.to_numpy(dtype=object))
+    names = pd.Series(uniques, dtype=object).astype(str)
+    names = names.str.replace('İ', 'i', regex=False).str.replace('I', 'ı', regex=False).str.lower()
+    names = names.str.translate(_ASCII_FOLD)
+    names = names.str.replace(r'[^a-z]+', ' ', regex=True).str.strip().to_numpy(dtype=object)
+    return pd.Series(names[codes] if len(names) else np.full(len(codes), '', dtype=object), index=text.index)
+
+
+def phonetic_key(name):
+    """
+    Sadeleştirilmiş ismin kaba fonetik anahtarı: ilk harf + ünsüz iskeleti
+    (sesliler ve h atılır, tekrarlanan harfler teklenir), ilk PHONETIC_KEY_LENGTH karakter.
+    
+    Args:
+        name (str): normalize_names çıktısındaki isim
+    
+    Returns:
+        str: Anahtar
+    """
+    return _REPEATED.sub(r'\1', name[:1] + _SILENT.sub('', name[1:]))[:PHONETIC_KEY_LENGTH]
+
+
+def jaro_winkler(a, b):
+    """
+    Jaro-Winkler benzerliği (0-1).
+    
+    Args:
+        a (str): Birinci metin
+        b (str): İkinci metin
+    
+    Returns:
+        float: Benzerlik
+    """
+    if a == b:
+        return 1.0 if a else 0.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+    
+    window = max(max(len_a, len_b) // 2 - 1, 0)
+    matched_b = [False] * len_b
+    matches_a = []
+    for i, char in enumerate(a):
+        # Pencere içindeki ilk eşlenmemiş aynı karakter (str.find C tarafında arar)
+        high = min(i + window + 1, len_b)
+        j = b.find(char, max(0, i - window), high)
+        while j >= 0 and matched_b[j]:
+            j = b.find(char, j + 1, high)
+        if j >= 0:
+            matched_b[j] = True
+            matches_a.append(char)
+    matches = len(matches_a)
+    if not matches:
+        return 0.0
+    
+    matches_b = [b[j] for j in range(len_b) if matched_b[j]]
+    transpositions = sum(x != y for x, y in zip(matches_a, matches_b)) // 2
+    jaro = (matches / len_a + matches / len_b + (matches - transpositions) / matches) / 3
+    
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * 0.1 * (1 - jaro)
+
+
+def _letter_counts(names):
+    """İsimlerdeki harf sayıları: (isim sayısı x 26) matris (Jaro üst sınırı için)."""
+    letters = [name.replace(' ', '') for name in names]
+    lengths = np.fromiter(map(len, letters), dtype=np.int64, count=len(letters))
+    codes = np.frombuffer(''.join(letters).encode('ascii'), dtype=np.uint8) - 97
+    counts = np.zeros((len(letters), 26), dtype=np.int16)
+    np.add.at(counts, (np.repeat(np.arange(len(letters)), lengths), codes), 1)
+    return counts
+
+
+def _jaro_winkler_bound(name, counts, lengths):
+    """
+    Adayların Jaro-Winkler benzerliği için üst sınır: eşleşen karakter sayısı
+    ortak harf sayısını aşamaz, Winkler öneki en çok 4 karakterdir.
+    """
+    query = _letter_counts([name])[0]
+    shared = np.minimum(counts, query).sum(axis=1)
+    jaro = (shared / max(len(name), 1) + shared / np.maximum(lengths, 1) + 1) / 3
+    jaro = np.where(shared > 0, jaro, 0.0)
+    return jaro + 0.4 * (1 - jaro)
+
+
+def _block_index(keys):
+    """
+    Anahtar -> konumlar dizini: (anahtar -> blok no sözlüğü, bloklara göre sıralı
+    konumlar, blok başlangıçları). Boş anahtarlar atlanır.
+    """
+    codes, uniques = pd.factorize(np.asarray(keys, dtype=object))
+    order = np.argsort(codes, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(uniques)))])
+    lookup = dict(zip(uniques, range(len(uniques))))
+    lookup.pop('', None)
+    return lookup, order, starts
+
+
+def _block(index, key):
+    """_block_index dizininde anahtarın konumları (yoksa boş dizi)."""
+    lookup, order, starts = index
+    code = lookup.get(key)
+    if code is None:
+        return np.empty(0, dtype=np.intp)
+    return order[starts[code]:starts[code + 1]]
+
+
+class MemberIndex:
+    """
+    Referans üye listesi üzerinde bloklu isim arama dizini.
+    
+    Bloklar satırlar yerine benzersiz (ad, soyad) çiftlerini tutar: aynı isimli
+    binlerce üye tek bir çift olarak karşılaştırılır. Üye numarası aynı olan
+    satırlar ayrıca aday olur ve skorlarına MEMBER_NO_BONUS eklenir.
+    
+    Args:
+        reference (pd.DataFrame): 'tc_no', 'first_name', 'last_name' ve isteğe
+            bağlı 'member_no' sütunları olan liste (her TC bir kez)
+    """
+    
+    def __init__(self, reference):
+        reference = reference.reset_index(drop=True)
+        self.tc_numbers = reference['tc_no'].astype(str).to_numpy(dtype=object)
+        self.member_numbers = (reference['member_no'].fillna('').astype(str).str.strip().to_numpy(dtype=object)
+                               if 'member_no' in reference.columns else np.full(len(reference), '', dtype=object))
+        first = normalize_names(reference['first_name']).to_numpy(dtype=object)
+        last = normalize_names(reference['last_name']).to_numpy(dtype=object)
+        
+        # İsimler benzersiz değerlerin kodlarıyla tutulur; benzerlik her benzersiz isim için bir kez hesaplanır
+        self._tc_codes, _ = pd.factorize(self.tc_numbers)
+        first_codes, self._first_uniques = pd.factorize(first)
+        last_codes, self._last_uniques = pd.factorize(last)
+        self._last_letters = _letter_counts(self._last_uniques)
+        self._last_lengths = np.array([len(name) for name in self._last_uniques], dtype=np.int64)
+        
+        # (ad, soyad) çiftleri: her çiftin kodları, ilk satırı ve taşıdığı farklı TC sayısı
+        self._pair_codes, pairs = pd.factorize(first_codes * max(len(self._last_uniques), 1) + last_codes)
+        _, self._pair_positions = np.unique(self._pair_codes, return_index=True)
+        self._pair_first = first_codes[self._pair_positions]
+        self._pair_last = last_codes[self._pair_positions]
+        pair_tc = np.unique(self._pair_codes.astype(np.int64) * max(len(self.tc_numbers), 1) + self._tc_codes)
+        self._pair_sizes = np.bincount(pair_tc // max(len(self.tc_numbers), 1), minlength=len(pairs))
+        
+        # Bloklar: (soyadı fonetik anahtarı, ad baş harfi), (soyadı öneki, ad baş harfi), üye no
+        first_initials = np.array(['|' + name[:1] for name in self._first_uniques], dtype=object)
+        last_phonetic = np.array([phonetic_key(name) for name in self._last_uniques], dtype=object)
+        last_prefix = np.array([name[:PREFIX_KEY_LENGTH] for name in self._last_uniques], dtype=object)
+        if len(pairs):
+            has_last = self._last_uniques[self._pair_last] != ''
+            initials = first_initials[self._pair_first]
+            self._phonetic_blocks = _block_index(np.where(has_last, last_phonetic[self._pair_last] + initials, ''))
+            self._prefix_blocks = _block_index(np.where(has_last, last_prefix[self._pair_last] + initials, ''))
+        else:
+            self._phonetic_blocks = self._prefix_blocks = _block_index([])
+        self._member_blocks = _block_index(self.member_numbers)
+    
+    def __len__(self):
+        return len(self.tc_numbers)
+    
+    def _candidates(self, phonetic, prefix, member_no):
+        """Aday (ad, soyad) çiftleri ve üye numarası aynı olan satırlar."""
+        member_rows = _block(self._member_blocks, member_no) if member_no else np.empty(0, dtype=np.intp)
+        pairs = np.unique(np.concatenate([
+            _block(self._phonetic_blocks, phonetic),
+            _block(self._prefix_blocks, prefix),
+            self._pair_codes[member_rows],
+        ]))
+        return pairs, member_rows
+    
+    def _similarities(self, name, codes, uniques):
+        """Aday isim kodları için benzerlikler (her benzersiz isim bir kez karşılaştırılır)."""
+        distinct, inverse = np.unique(codes, return_inverse=True)
+        scores = np.array([jaro_winkler(name, uniques[code]) for code in distinct])
+        return scores[inverse]
+    
+    def _name_scores(self, first, last, pairs, bonus, threshold):
+        """
+        Çiftlerin isim skorları. Soyadları üst sınırı en yüksek olandan başlayarak
+        karşılaştırılır; kalanların üst sınırı (üye no payı dahil) en iyi skorun ve
+        eşiğin belirsizlik payı altına düşünce sonuç değişemeyeceği için durulur
+        (karşılaştırılmayanların soyadı skoru 0 sayılır).
+        """
+        partial = (1 - LAST_NAME_WEIGHT) * self._similarities(first, self._pair_first[pairs], self._first_uniques)
+        distinct, inverse = np.unique(self._pair_last[pairs], return_inverse=True)
+        bound = _jaro_winkler_bound(last, self._last_letters[distinct], self._last_lengths[distinct])
+        best_partial = np.full(len(distinct), -np.inf)
+        np.maximum.at(best_partial, inverse, partial + bonus)
+        limits = LAST_NAME_WEIGHT * bound + best_partial
+        
+        last_scores = np.zeros(len(distinct))
+        best_score = -np.inf
+        for i in np.argsort(-limits, kind='stable'):
+            if limits[i] < max(threshold, best_score) - AMBIGUITY_MARGIN - 1e-9:
+                break
+            last_scores[i] = jaro_winkler(last, self._last_uniques[distinct[i]])
+            best_score = max(best_score, LAST_NAME_WEIGHT * last_scores[i] + best_partial[i])
+        return LAST_NAME_WEIGHT * last_scores[inverse] + partial
+    
+    def _best(self, first, last, pairs, member_rows, threshold):
+        """Adaylar arasında en iyi eşleşme: (konum, skor) veya belirsiz/yetersizse (-1, skor)."""
+        member_pairs = np.searchsorted(pairs, self._pair_codes[member_rows])
+        bonus = np.zeros(len(pairs))
+        bonus[member_pairs] = MEMBER_NO_BONUS
+        name_scores = self._name_scores(first, last, pairs, bonus, threshold)
+        
+        # Adaylar: üye numarası tutan satırlar (skor + pay) ve çiftler; birden çok
+        # TC taşıyan çift kendi içinde belirsizdir (TC kodu -1)
+        pair_sizes = self._pair_sizes[pairs]
+        pair_positions = self._pair_positions[pairs]
+        scores = np.concatenate([name_scores[member_pairs] + MEMBER_NO_BONUS, name_scores])
+        positions = np.concatenate([member_rows, pair_positions])
+        tc_codes = np.concatenate([self._tc_codes[member_rows],
+                                   np.where(pair_sizes == 1, self._tc_codes[pair_positions], -1)])
+        
+        best = int(np.argmax(scores))
+        best_score = scores[best]
+        
+        # Aynı isimde başka bir kişi (farklı TC) yakın skorla eşleşiyorsa sonuç belirsizdir
+        others = (tc_codes != tc_codes[best]) | (tc_codes == -1)
+        runner_up = scores[others].max() if others.any() else 0.0
+        
+        if best_score < threshold or best_score - runner_up < AMBIGUITY_MARGIN:
+            return -1, best_score
+        return int(positions[best]), min(float(best_score), 1.0)
+    
+    def match(self, first_names, last_names, member_numbers=None, threshold=MATCH_THRESHOLD):
+        """
+        Satırları referans listeyle eşleştirir. Aynı (ad, soyad, üye no) bir kez aranır.
+        
+        Args:
+            first_names (array-like): Adlar
+            last_names (array-like): Soyadlar
+            member_numbers (array-like): Üye numaraları (None ise kullanılmaz)
+            threshold (float): En düşük benzerlik skoru
+        
+        Returns:
+            tuple: (np.ndarray: eşleşen TC'ler (yoksa ''), np.ndarray: skorlar (float, eşleşme yoksa NaN))
+        """
+        first = normalize_names(first_names)
+        last = normalize_names(last_names)
+        member = (pd.Series(member_numbers, dtype=object).fillna('').astype(str).str.strip()
+                  if member_numbers is not None else pd.Series([''] * len(first), dtype=object))
+        queries = pd.DataFrame({
+            'first': first.to_numpy(dtype=object),
+            'last': last.to_numpy(dtype=object),
+            'member': member.to_numpy(dtype=object),
+        })
+        if queries.empty:
+            return np.empty(0, dtype=object), np.empty(0)
+        codes, uniques = pd.factorize(pd.MultiIndex.from_frame(queries))
+        
+        unique_tc = np.full(len(uniques), '', dtype=object)
+        unique_score = np.full(len(uniques), np.nan)
+        for code, (first_name, last_name, member_no) in enumerate(uniques):
+            if not last_name:
+                continue
+            initial = '|' + first_name[:1]
+            pairs, member_rows = self._candidates(phonetic_key(last_name) + initial,
+                                                  last_name[:PREFIX_KEY_LENGTH] + initial, member_no)
+            if not len(pairs):
+                continue
+            position, score = self._best(first_name, last_name, pairs, member_rows, threshold)
+            if position >= 0:
+                unique_tc[code] = self.tc_numbers[position]
+                unique_score[code] = round(score, 3)
+        
+        return unique_tc[codes], unique_score[codes]
@@ -0,0 +1,189 @@
+"""
+Sayfa Başlığı / Altlığı Ayıklama
+Bu modül, çok sayfalı basılı raporlardan alınmış listelerde her sayfada
+tekrarlanan başlık satırlarını (rapor adı, sütun başlıkları), altlıkları
+(sayfa numarası, baskı bilgisi) ve ara/sayfa toplamı satırlarını bulur.
+Satırlar normalleştirilmiş içeriklerinin özetiyle (hash) imzalanır; dosya
+başına bir kez öğrenilen tekrarlayan imzaların tüm geçtiği satırlar vektörel
+olarak işaretlenir.
+"""
+
+import re
+
+from utils.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# Satır türleri
+PAGE_HEADER = 'header'
+PAGE_FOOTER = 'footer'
+PAGE_TOTAL = 'total'
+
+PAGE_ROW_LABELS = {
+    PAGE_HEADER: "Sayfa başlığı",
+    PAGE_FOOTER: "Sayfa altlığı",
+    PAGE_TOTAL: "Ara / sayfa toplamı",
+}
+
+# Bir imzanın sayfa başlığı/altlığı sayılması için geçtiği en az farklı sayfa (blok) sayısı
+MIN_REPEATS = 2
+
+# İmzada sayılar '#' olur (sayfa numarası ve tutarlar değişse de imza aynı kalır)
+_DIGITS = r'\d+'
+_NUMERIC_CELL = r'[\d.,\s₺]*\d[\d.,\s₺]*(?:tl)?'
+
+# Toplam satırları tek geçse de ayıklanır. Anahtar sözcük tam sözcük olarak ve
+# kısa bir etiket hücresinde ("Sayfa Toplamı", "Nakli Yekün:", "Toplam 102,00")
+# aranır; adında bu sözcükleri barındıran kayıt hücreleri eşleşmez.
+_TOTAL_LABEL = re.compile(r'(?:[^\W_]+\s+){0,2}\b(?:toplam[ıi]?|yek[üu]n[uü]?|devreden|nakli)\b'
+                          r'(?:\s+[^\W_]+){0,2}[\s:]*(?:' + _NUMERIC_CELL + r')?')
+_TOTAL_HINT = r'toplam|yek|devreden|nakl'
+
+
+def _normalize(text):
+    """Hücre metnini Türkçe kurallarla küçük harfe çevirir (İ -> i, I -> ı)."""
+    return text.str.replace('İ', 'i', regex=False).str.replace('I', 'ı', regex=False).str.lower()
+
+
+def _total_label_cells(raw, text):
+    """
+    Toplam etiketi hücrelerini bulur. Yalnızca anahtar sözcüğe benzeyen az
+    sayıdaki hücrenin bozuk karakterleri düzeltilir ve tam eşleşme Python
+    re ile aranır (Arrow metin sütunlarında sözcük sınırı yalnızca ASCII'dir).
+    
+    Args:
+        raw (pd.Series): Kırpılmış hücre metinleri
+        text (pd.Series): Normalleştirilmiş hücre metinleri
+    
+    Returns:
+        np.ndarray: Hücre başına etiket mi (bool)
+    """
+    found = text.str.contains(_TOTAL_HINT, regex=True).to_numpy(dtype=bool, na_value=False)
+    if found.any():
+        # data_processor bu modülü içe aktarır; döngü olmasın diye burada alınır
+        from utils.data_processor import fix_turkish_chars
+        labels = _normalize(raw[found].map(fix_turkish_chars))
+        found = found.copy()
+        found[found] = [_TOTAL_LABEL.fullmatch(label) is not None for label in labels]
+    return found
+
+
+def row_signatures(df_raw, rows):
+    """
+    Satırların normalleştirilmiş içerik imzalarını hesaplar: dolu hücreler
+    küçük harfe çevrilip sayılar '#' ile değiştirilir, boş hücreler atılır.
+    
+    Args:
+        df_raw (pd.DataFrame): Ham veri
+        rows (np.ndarray): İmzalanacak satır konumları
+    
+    Returns:
+        tuple: (np.ndarray: normalleştirilmiş metinler, np.ndarray: uint64 imzalar,
+                np.ndarray: satırdaki sayısal hücre sayısı,
+                np.ndarray: satırda toplam etiketi hücresi var mı (bool))
+    """
+    subset = df_raw.iloc[rows]
+    cells = []
+    numeric_cells = np.zeros(len(rows), dtype=np.int64)
+    total_labels = np.zeros(len(rows), dtype=bool)
+    for col in subset.columns:
+        values = subset[col]
+        stripped = values.astype(str).str.strip()
+        text = _normalize(stripped).where(values.notna(), '')
+        numeric_cells += text.str.fullmatch(_NUMERIC_CELL).to_numpy(dtype=bool, na_value=False)
+        total_labels |= _total_label_cells(stripped, text)
+        cells.append(text.str.replace(_DIGITS, '#', regex=True))
+    
+    if not cells:
+        empty = np.empty(0, dtype=object)
+        return empty, np.empty(0, dtype=np.uint64), numeric_cells, total_labels
+    
+    # Boş hücreler atlanarak birleştirilir (birleşik hücre kayması imzayı değiştirmesin)
+    joined = cells[0].str.cat(cells[1:], sep='\x1f') if len(cells) > 1 else cells[0]
+    joined = joined.str.replace(r'\x1f+', ' | ', regex=True).str.strip(' |').str.replace(r'\s+', ' ', regex=True)
+    texts = joined.to_numpy(dtype=object)
+    return texts, pd.util.hash_array(texts), numeric_cells, total_labels
+
+
+def detect_page_rows(df_raw, candidates, data_rows):
+    """
+    Sayfa başlığı, altlığı ve toplam satırlarını bulur. Yalnızca aday satırlar
+    (TC'si geçersiz, boş olmayan satırlar) incelenir; veri satırları hiçbir
+    zaman işaretlenmez.
+    
+    Tekrarlayan bir imza, aradaki veri satırlarıyla ayrılmış en az MIN_REPEATS
+    blokta geçiyorsa sayfa satırıdır. Türü, blok içinde önceki veri satırına
+    mı (altlık) sonraki veri satırına mı (başlık) daha yakın geçtiğine göre
+    belirlenir. En az iki sayısal hücresi olan satırlar kayıt olarak kabul
+    edilir ve ayıklanmaz (hatalı üye satırları hata raporunda kalır).
+    
+    Args:
+        df_raw (pd.DataFrame): Ham veri
+        candidates (np.ndarray): Aday satır maskesi (bool)
+        data_rows (np.ndarray): Veri satırı maskesi (bool, geçerli TC)
+    
+    Returns:
+        np.ndarray: Satır başına tür (object; sayfa satırı olmayanlarda None)
+    """
+    kinds = np.full(len(df_raw), None, dtype=object)
+    positions = np.flatnonzero(candidates)
+    if len(positions) == 0:
+        return kinds
+    
+    texts, signatures, numeric_cells, is_total = row_signatures(df_raw, positions)
+    has_letter = pd.Series(texts, dtype=object).str.contains(r'[^\W\d_]', regex=True).to_numpy(dtype=bool)
+    eligible = has_letter & (numeric_cells < 2)
+    if not eligible.any():
+        return kinds
+    
+    # Her adayın bloğu: önceki/sonraki veri satırı (dosya başı -1, dosya sonu n)
+    data_positions = np.flatnonzero(data_rows)
+    after = np.searchsorted(data_positions, positions)
+    previous_data = np.where(after > 0, data_positions[np.maximum(after - 1, 0)], -1)
+    next_data = np.where(after < len(data_positions),
+                         data_positions[np.minimum(after, len(data_positions) - 1)], len(df_raw))
+    
+    # Blok içindeki konum: önceki veriye uzaklık (k) ve sonraki veriye uzaklık (m)
+    k = positions - previous_data
+    m = next_data - positions
+    votes = np.sign(m - k)                         # +1: altlığa yakın, -1: başlığa yakın
+    votes = np.where(previous_data < 0, -1, votes)  # ilk sayfanın üstü
+    votes = np.where(next_data >= len(df_raw), 1, votes)  # son sayfanın altı
+    
+    frame = pd.DataFrame({
+        'signature': signatures[eligible],
+        'block': previous_data[eligible],
+        'vote': votes[eligible],
+    })
+    grouped = frame.groupby('signature', sort=False)
+    blocks = grouped['block'].nunique()
+    vote_sums = grouped['vote'].sum()
+    repeated = blocks[blocks >= MIN_REPEATS].index
+    footer_signatures = vote_sums[vote_sums > 0].index
+    
+    is_repeated = np.isin(signatures, repeated)
+    is_footer = np.isin(signatures, footer_signatures)
+    
+    candidate_kinds = np.where(
+        is_total, PAGE_TOTAL,
+        np.where(is_repeated, np.where(is_footer, PAGE_FOOTER, PAGE_HEADER), None)
+    ).astype(object)
+    candidate_kinds[~eligible] = None
+    kinds[positions] = candidate_kinds
+    return kinds
+
+
+def count_page_rows(kinds):
+    """
+    Ayıklanan satırları türe göre sayar.
+    
+    Args:
+        kinds (np.ndarray): detect_page_rows çıktısı
+    
+    Returns:
+        dict: tür -> satır sayısı (yalnızca bulunan türler)
+    """
+    values, counts = np.unique(kinds[kinds != None].astype(str), return_counts=True)  # noqa: E711
+    return {str(kind): int(count) for kind, count in zip(values, counts)}
@@ -0,0 +1,171 @@
+"""
+Dönüştürme Hattı
+Bu modül, arayüz dışındaki giriş noktalarının (komut satırı, HTTP servisi)
+ortak kullandığı okuma → tespit → eşleştirme → temizleme → dışa aktarma
+adımlarını içerir.
+"""
+
+from utils.data_processor import (
+    read_file_with_encoding,
+    apply_column_mapping,
+    detect_header,
+    header_labels_for,
+    auto_suggest_columns,
+    validate_mapping
+)
+from utils.money import AMOUNT_COLUMN, format_decimal, total_kurus
+from utils.spooled_upload import SpooledUpload
+from utils.validation_rules import apply_rules
+from utils.stream_export import iter_csv_chunks, iter_ndjson_chunks, DEFAULT_CHUNK_ROWS
+
+
+REQUIRED_COLUMNS = {
+    "Üye No": "member_no",
+    "Adı": "first_name",
+    "Soyadı": "last_name",
+    "TC Kimlik No": "tc_no",
+    "Aidat Tutarı": "amount"
+}
+
+OUTPUT_FORMATS = ['csv', 'ndjson', 'parquet']
+
+OUTPUT_MIME_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+
+class MappingError(ValueError):
+    """Zorunlu alanlar eşleştirilemediğinde (okuma hatalarından ayrı tutulur) fırlatılır."""
+
+
+def open_source(path, file_name=None):
+    """
+    Diskteki dosyayı okuma fonksiyonlarının beklediği dosya nesnesine çevirir
+    (içerik belleğe alınmaz, ayrıştırıcılar doğrudan dosyadan okur).
+    
+    Args:
+        path (str): Dosya yolu
+        file_name (str): Format tespiti için kullanılacak dosya adı (None ise yolun adı)
+    
+    Returns:
+        SpooledUpload: Dosya nesnesi
+    """
+    return SpooledUpload(path, file_name)
+
+
+def read_source(source, skip_rows=None):
+    """
+    Başlangıç satırını ve başlıkları (belirtilmediyse) tespit edip dosyayı okur.
+    
+    Args:
+        source: Dosya nesnesi (.name, .seek, .read, .getvalue)
+        skip_rows (int): Atlanacak satır sayısı (None ise otomatik)
+    
+    Returns:
+        tuple: (pd.DataFrame: Ham veri, int: Atlanan satır sayısı,
+                list: Sütun başlıkları (bulunamadıysa veya skip_rows verildiyse None))
+    """
+    detected = {}
+    if skip_rows is None:
+        source.seek(0)
+        detected = detect_header(source)
+        skip_rows = detected['data_start']
+    source.seek(0)
+    df_raw = read_file_with_encoding(source, skip_rows=skip_rows)
+    return df_raw, skip_rows, header_labels_for(detected, df_raw)
+
+
+def suggest_mapping(df_raw, column_labels=None):
+    """
+    Başlıklara ve sütun içeriğine göre eşleştirme önerir; ayrı ad/soyad bulunamazsa birleşik ad dener.
+    
+    Args:
+        df_raw (pd.DataFrame): Ham veri
+        column_labels (list): Dosyadaki sütun başlıkları (bkz. read_source)
+    
+    Returns:
+        dict: Sütun eşleştirme haritası
+    """
+    use_combined = False
+    mapping = auto_suggest_columns(df_raw, REQUIRED_COLUMNS, use_combined_name=False, column_labels=column_labels)
+    if 'first_name' not in mapping or 'last_name' not in mapping:
+        combined = auto_suggest_columns(df_raw, REQUIRED_COLUMNS, use_combined_name=True,
+                                        column_labels=column_labels)
+        if 'full_name' in combined:
+            mapping, use_combined = combined, True
+    
+    mapping['use_combined_name'] = use_combined
+    return mapping
+
+
+def normalize_mapping(mapping):
+    """
+    JSON'dan gelen eşleştirmedeki sütun indekslerini int'e çevirir.
+    
+    Args:
+        mapping (dict): Ham eşleştirme
+    
+    Returns:
+        dict: Sütun eşleştirme haritası
+    """
+    return {k: (bool(v) if k == 'use_combined_name' else int(v)) for k, v in mapping.items()}
+
+
+def encode_output(df_clean, output_format, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Temiz listeyi istenen formatta kodlanmış bloklar halinde üretir.
+    
+    Args:
+        df_clean (pd.DataFrame): Temizlenmiş veri
+        output_format (str): 'csv', 'ndjson' veya 'parquet'
+        chunk_rows (int): Akışlı formatlarda parça boyutu
+    
+    Returns:
+        iterable: bytes blokları
+    """
+    if output_format == 'csv':
+        return iter_csv_chunks(df_clean, chunk_rows)
+    if output_format == 'ndjson':
+        return iter_ndjson_chunks(df_clean, chunk_rows)
+    if output_format == 'parquet':
+        from utils.export_formats import to_parquet_bytes
+        return [to_parquet_bytes(df_clean)]
+    raise ValueError(f"Desteklenmeyen çıktı formatı: {output_format}")
+
+
+def convert(source, mapping=None, skip_rows=None, rules=None, reference=None, backend=None):
+    """
+    Dosyayı okur, eşleştirmeyi (verilmediyse) önerir, temizler ve (verildiyse)
+    doğrulama kurallarını uygular.
+    
+    Args:
+        source: Dosya nesnesi
+        mapping (dict): Sütun eşleştirme haritası (None ise otomatik öneri)
+        skip_rows (int): Atlanacak satır sayısı (None ise otomatik)
+        rules (list): compile_rules ile derlenmiş doğrulama kuralları
+        reference (MemberIndex): TC'si eksik/geçersiz satırların isimle eşleştirileceği üye listesi dizini
+        backend (str): Temizleme motoru (None ise CEVIRICI_BACKEND; bkz. utils/cleaning_backends.py)
+    
+    Returns:
+        tuple: (pd.DataFrame: Temizlenmiş veri, dict: İşlem istatistikleri, dict: Kullanılan eşleştirme)
+    
+    Raises:
+        MappingError: Zorunlu alanlar eşleştirilemezse
+        ValueError: Dosya okunamazsa
+    """
+    df_raw, skip_rows, column_labels = read_source(source, skip_rows)
+    
+    mapping = normalize_mapping(mapping) if mapping else suggest_mapping(df_raw, column_labels)
+    is_valid, missing_fields = validate_mapping(mapping, REQUIRED_COLUMNS)
+    if not is_valid:
+        raise MappingError(f"Eşleştirilemeyen alanlar: {', '.join(sorted(missing_fields))}")
+    
+    df_clean, stats = apply_column_mapping(df_raw, mapping, reference=reference, backend=backend)
+    stats['skip_rows'] = skip_rows
+    # Tam toplam ondalık metin olarak (JSON'da float yuvarlaması olmadan) raporlanır
+    stats['amount_total'] = format_decimal(total_kurus(df_clean[AMOUNT_COLUMN]) if not df_clean.empty else 0)
+    if rules:
+        apply_rules(df_clean, stats, rules)
+    return df_clean, stats, mapping
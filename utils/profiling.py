@@ -0,0 +1,199 @@
+"""
+İsteğe Bağlı Profil Çıkarma
+Bu modül, tek bir dosyanın okuma + temizleme + dışa aktarma geçişini
+profilleyip sonuçları yerel bir dizine yazar: cProfile çıktısı (.prof;
+snakeviz / pstats ile açılır) ve alev grafiği için katlanmış yığınlar
+(.collapsed; flamegraph.pl, speedscope veya inferno ile açılır).
+
+Profil yalnızca CEVIRICI_PROFILE ortam değişkeni açıkken arayüzde sunulur;
+kapalıyken hiçbir işlem sarmalanmaz ve profil kütüphaneleri yüklenmez.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+# Profil dosyalarının yazıldığı dizin
+PROFILE_DIR = os.environ.get('CEVIRICI_PROFILE_DIR', os.path.join('data', 'profiller'))
+
+# Örnekleyicinin yığınları okuma aralığı (saniye)
+SAMPLE_INTERVAL_SECONDS = 0.005
+
+# Özet tablodaki fonksiyon sayısı
+TOP_FUNCTIONS = 25
+
+
+def profiling_enabled():
+    """
+    Profil modu açık mı? (CEVIRICI_PROFILE=1)
+    
+    Returns:
+        bool: Açıksa True
+    """
+    return os.environ.get('CEVIRICI_PROFILE', '').strip().lower() in ('1', 'true', 'yes', 'evet')
+
+
+def _frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """
+    Arka plan thread'i ile belirli aralıklarla thread yığınlarını okuyup
+    katlanmış yığın sayaçları tutar. Profil başladığında var olan thread'ler
+    (çağıran thread hariç; örn: Streamlit sunucusu) örneklenmez; işin açtığı
+    thread havuzları örneklenir. Ayrı süreçler (süreç havuzu) örneklenemez.
+    
+    Args:
+        interval (float): Örnekleme aralığı (saniye)
+    """
+    
+    def __init__(self, interval=SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.stacks = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profil-örnekleyici', daemon=True)
+        current = threading.get_ident()
+        self._ignored = {t.ident for t in threading.enumerate() if t.ident != current}
+    
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own or ident in self._ignored:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                labels.append(names.get(ident, str(ident)))
+                stack = ';'.join(reversed(labels))
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+            self.samples += 1
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+    
+    def write_collapsed(self, path):
+        """Yığınları 'kök;...;yaprak sayı' satırları olarak yazar (alev grafiği girdisi)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+
+def top_functions(profiler, limit=TOP_FUNCTIONS):
+    """
+    cProfile sonucundan öz süresi en yüksek fonksiyonları çıkarır.
+    
+    Args:
+        profiler (cProfile.Profile): Durdurulmuş profil
+        limit (int): Fonksiyon sayısı
+    
+    Returns:
+        list: [{'Fonksiyon', 'Çağrı', 'Öz Süre (sn)', 'Toplam Süre (sn)'}, ...]
+    """
+    import pstats
+    
+    entries = sorted(pstats.Stats(profiler).stats.items(), key=lambda item: item[1][2], reverse=True)
+    rows = []
+    for (file_name, line, name), (_, calls, self_time, total_time, _) in entries[:limit]:
+        label = name if file_name == '~' else f"{name} ({os.path.basename(file_name)}:{line})"
+        rows.append({
+            'Fonksiyon': label,
+            'Çağrı': calls,
+            'Öz Süre (sn)': round(self_time, 4),
+            'Toplam Süre (sn)': round(total_time, 4),
+        })
+    return rows
+
+
+@contextmanager
+def profile_run(name, directory=None, limit=TOP_FUNCTIONS):
+    """
+    Bloğu cProfile ve yığın örnekleyiciyle profiller; blok bittiğinde
+    (hata olsa da) profil dosyalarını yazar ve verilen sözlüğü doldurur.
+    
+    Args:
+        name (str): Dosya adlarında kullanılacak çalıştırma adı
+        directory (str): Çıktı dizini (None ise PROFILE_DIR)
+        limit (int): Özetteki fonksiyon sayısı
+    
+    Yields:
+        dict: Blok bitince {'profile_path', 'collapsed_path', 'elapsed', 'samples', 'top'} ile dolar
+    """
+    import cProfile
+    
+    directory = directory or PROFILE_DIR
+    os.makedirs(directory, exist_ok=True)
+    prefix = os.path.join(directory, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{name}")
+    
+    report = {}
+    profiler = cProfile.Profile()
+    sampler = StackSampler()
+    start = time.perf_counter()
+    sampler.start()
+    profiler.enable()
+    try:
+        yield report
+    finally:
+        profiler.disable()
+        sampler.stop()
+        report['elapsed'] = time.perf_counter() - start
+        report['profile_path'] = prefix + '.prof'
+        report['collapsed_path'] = prefix + '.collapsed'
+        profiler.dump_stats(report['profile_path'])
+        sampler.write_collapsed(report['collapsed_path'])
+        report['samples'] = sampler.samples
+        report['top'] = top_functions(profiler, limit)
+
+
+def profile_pipeline(uploaded_files, column_mapping, read_all_sheets=False, directory=None):
+    """
+    Yüklenen dosyaların okuma, temizleme ve dışa aktarma (CSV + Excel) geçişini
+    bir kez, önbellek kullanmadan ve tek thread'de profiller.
+    
+    Args:
+        uploaded_files (list): Dosya nesneleri
+        column_mapping (dict): Sütun eşleştirme haritası
+        read_all_sheets (bool): Excel dosyalarında tüm sayfalar okunsun mu?
+        directory (str): Çıktı dizini (None ise PROFILE_DIR)
+    
+    Returns:
+        dict: profile_run raporu ve adım süreleri ('stages': {adım: saniye}), 'rows'
+    """
+    import io
+    
+    from utils.data_processor import apply_column_mapping
+    from utils.money import to_export_frame
+    from utils.multi_ingest import ingest_uploads
+    from utils.stream_export import iter_csv_chunks
+    
+    stages = {}
+    with profile_run('pipeline', directory) as report:
+        start = time.perf_counter()
+        result = ingest_uploads(uploaded_files, read_all_sheets=read_all_sheets)
+        stages['Okuma'] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        df_clean, _ = apply_column_mapping(result['raw_df'], column_mapping, sources=result['raw_sources'])
+        stages['Temizleme'] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for _ in iter_csv_chunks(df_clean):
+            pass
+        to_export_frame(df_clean).to_excel(io.BytesIO(), index=False, engine='xlsxwriter')
+        stages['Dışa Aktarma'] = time.perf_counter() - start
+    
+    report['stages'] = stages
+    report['rows'] = len(df_clean)
+    return report
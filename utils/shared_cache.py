@@ -0,0 +1,386 @@
+"""
+Oturumlar Arası Paylaşılan Önbellek
+Bu modül, okunmuş (ham tablo) ve temizlenmiş (temiz liste + istatistikler)
+sonuçları içerik özetiyle anahtarlayıp süreç genelinde paylaşır. Aynı dosyayı
+açan oturumlar dosyayı bir kez ayrıştırır ve bellekte aynı tabloyu kullanır;
+aynı anda açılırsa hesaplama bir kez yapılır, diğer oturumlar sonucu bekler.
+
+Her oturum kullandığı girdi için bir kira (Lease) tutar; kira bırakıldığında
+veya oturum durumu silindiğinde (çöp toplayıcı) başvuru sayısı azalır.
+Önbelleğin toplam boyutu bir bütçeyle sınırlıdır; bütçe aşılınca hiçbir
+oturumun kullanmadığı girdiler en eski erişilenden başlayarak (LRU) atılır.
+Oturumların kullandığı girdiler zaten bellekte tutulduğundan atılmaz.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from utils.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# Paylaşılan önbelleğin bellek bütçesi (MB, ortam değişkeni ile değiştirilebilir)
+SHARED_CACHE_MB = int(os.environ.get('CEVIRICI_SHARED_CACHE_MB', '1024'))
+
+# Girdi türleri
+KIND_RAW = 'raw'
+KIND_CLEAN = 'clean'
+
+
+def cache_admin_enabled():
+    """
+    Önbellek yönetim görünümü açık mı? (CEVIRICI_ADMIN=1)
+    
+    Returns:
+        bool: Açıksa True
+    """
+    return os.environ.get('CEVIRICI_ADMIN', '').strip().lower() in ('1', 'true', 'yes', 'evet')
+
+
+def estimate_bytes(value):
+    """
+    Değerin yaklaşık bellek boyutu (tablolar, diziler, kayıtlar ve kapsayıcılar).
+    
+    Args:
+        value: Önbellek değeri
+    
+    Returns:
+        int: Byte
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(index=True, deep=True)
+        return int(usage.sum() if isinstance(value, pd.DataFrame) else usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes) + (sum(sys.getsizeof(item) for item in value.flat) if value.dtype == object else 0)
+    if isinstance(value, dict):
+        return sum(estimate_bytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_bytes(item) for item in value)
+    if hasattr(value, '__dict__'):
+        # ErrorLog gibi dizileri alanlarında tutan nesneler
+        return estimate_bytes(vars(value))
+    return sys.getsizeof(value)
+
+
+class Lease:
+    """
+    Önbellek girdisinin bir oturumdaki kullanımı. Kira bırakıldığında (release)
+    veya nesne çöp toplayıcıyla silindiğinde girdinin başvuru sayısı azalır.
+    
+    Args:
+        cache (SharedCache): Önbellek (girdi saklanmadıysa None)
+        key (tuple): Girdi anahtarı
+        value: Girdinin değeri
+    """
+    
+    __slots__ = ('key', 'value', '_finalizer', '__weakref__')
+    
+    def __init__(self, cache, key, value):
+        self.key = key
+        self.value = value
+        self._finalizer = weakref.finalize(self, cache._release, key) if cache is not None else None
+    
+    @property
+    def active(self):
+        return self._finalizer is not None and self._finalizer.alive
+    
+    def release(self):
+        """Kirayı bırakır (birden fazla çağrılabilir)."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+class _Entry:
+    __slots__ = ('value', 'size', 'refs', 'hits', 'created_at', 'used_at')
+    
+    def __init__(self, value, size):
+        self.value = value
+        self.size = size
+        self.refs = 0
+        self.hits = 0
+        self.created_at = self.used_at = time.time()
+
+
+class SharedCache:
+    """
+    Başvuru sayımlı, bütçe sınırlı, içerik anahtarlı LRU önbellek. Oturumlar ve
+    arka plan işleri ayrı thread'lerde çalıştığından erişim kilitle korunur.
+    
+    Args:
+        max_mb (int): Bellek bütçesi (MB)
+    """
+    
+    def __init__(self, max_mb=SHARED_CACHE_MB):
+        self.max_bytes = max_mb * 1024 * 1024
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    @property
+    def size_bytes(self):
+        return self._size
+    
+    def _lease(self, key, entry):
+        """Girdiye yeni kira verir (kilit tutulurken çağrılır)."""
+        entry.refs += 1
+        entry.used_at = time.time()
+        self._entries.move_to_end(key)
+        return Lease(self, key, entry.value)
+    
+    def _release(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.refs > 0:
+                entry.refs -= 1
+                self._evict()
+    
+    def _evict(self):
+        """Bütçe aşıldıysa kullanılmayan girdileri en eskiden başlayarak atar (kilit tutulurken)."""
+        if self._size <= self.max_bytes:
+            return
+        for key in [key for key, entry in self._entries.items() if entry.refs == 0]:
+            self._size -= self._entries.pop(key).size
+            self.evictions += 1
+            if self._size <= self.max_bytes:
+                return
+    
+    def lookup(self, key):
+        """
+        Girdi varsa kira verir; yoksa None döner (hesaplama başlatılmaz).
+        
+        Args:
+            key (tuple): Girdi anahtarı
+        
+        Returns:
+            Lease veya None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry.hits += 1
+            return self._lease(key, entry)
+    
+    def acquire(self, key, compute):
+        """
+        Girdinin kirasını döndürür; yoksa hesaplayıp saklar. Aynı anahtar başka
+        bir thread'de hesaplanıyorsa o hesaplamanın bitmesi beklenir.
+        
+        Args:
+            key (tuple): Girdi anahtarı
+            compute (callable): Değeri üreten parametresiz fonksiyon
+        
+        Returns:
+            Lease: Kira (değer tek başına bütçeyi aşıyorsa saklanmaz, kira boştur)
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    entry.hits += 1
+                    return self._lease(key, entry)
+                pending = self._inflight.get(key)
+                if pending is None:
+                    self._inflight[key] = threading.Event()
+                    self.misses += 1
+                    break
+            # Hesaplayan thread hata verirse (örn: iş iptali) bekleyenlerden biri yeniden hesaplar
+            pending.wait()
+        
+        try:
+            value = compute()
+            size = estimate_bytes(value)
+        except BaseException:
+            with self._lock:
+                self._inflight.pop(key).set()
+            raise
+        
+        with self._lock:
+            self._inflight.pop(key).set()
+            return self._store(key, value, size)
+    
+    def _store(self, key, value, size):
+        """Değeri saklayıp kira verir (kilit tutulurken çağrılır)."""
+        if size > self.max_bytes:
+            return Lease(None, key, value)
+        entry = _Entry(value, size)
+        self._entries[key] = entry
+        self._size += size
+        lease = self._lease(key, entry)
+        self._evict()
+        return lease
+    
+    def put(self, key, value):
+        """
+        Başka yoldan hesaplanmış değeri saklar (varsa mevcut girdi kullanılır).
+        
+        Args:
+            key (tuple): Girdi anahtarı
+            value: Değer
+        
+        Returns:
+            Lease: Kira
+        """
+        size = estimate_bytes(value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return self._lease(key, entry)
+            return self._store(key, value, size)
+    
+    def stats(self):
+        """
+        Önbellek özetini döndürür.
+        
+        Returns:
+            dict: {'entries', 'bytes', 'max_bytes', 'pinned_bytes', 'hits', 'misses', 'hit_rate', 'evictions'}
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'pinned_bytes': sum(entry.size for entry in self._entries.values() if entry.refs > 0),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+            }
+    
+    def entries(self):
+        """
+        Girdileri en son erişilenden başlayarak listeler (içerik gösterilmez).
+        
+        Returns:
+            list: [{'Tür', 'Anahtar', 'Boyut (MB)', 'Oturum', 'İsabet', 'Son Erişim'}, ...]
+        """
+        with self._lock:
+            items = list(self._entries.items())
+        return [
+            {
+                'Tür': key[0],
+                'Anahtar': key[1][:12],
+                'Boyut (MB)': round(entry.size / 1024 / 1024, 1),
+                'Oturum': entry.refs,
+                'İsabet': entry.hits,
+                'Son Erişim': time.strftime('%H:%M:%S', time.localtime(entry.used_at)),
+            }
+            for key, entry in reversed(items)
+        ]
+    
+    def clear_unused(self):
+        """
+        Hiçbir oturumun kullanmadığı girdileri atar.
+        
+        Returns:
+            int: Atılan girdi sayısı
+        """
+        with self._lock:
+            unused = [key for key, entry in self._entries.items() if entry.refs == 0]
+            for key in unused:
+                self._size -= self._entries.pop(key).size
+            return len(unused)
+
+
+# Uygulama genelinde paylaşılan önbellek
+SHARED_CACHE = SharedCache()
+
+
+def shared_ingest(uploaded_files, read_all_sheets=False, progress_callback=None, preview_rows=None,
+                  cache=SHARED_CACHE):
+    """
+    ingest_uploads'u paylaşılan önbellek üzerinden çalıştırır: aynı dosyalar
+    daha önce (herhangi bir oturumda) tamamen okunduysa ayrıştırılmaz.
+    
+    Args:
+        uploaded_files (list): Dosya nesneleri
+        read_all_sheets (bool): Excel dosyalarında tüm sayfalar okunsun mu?
+        progress_callback (callable): İlerleme bildirimi
+        preview_rows (int): Önizleme satır sayısı (None ise dosyanın tamamı okunur)
+        cache (SharedCache): Önbellek
+    
+    Returns:
+        dict: ingest_uploads sonucu ve 'lease' (tam okunan sonucun kirası; önizlemede None)
+    """
+    from utils.column_cache import upload_digest
+    from utils.multi_ingest import ingest_uploads
+    
+    key = (KIND_RAW, upload_digest(uploaded_files, read_all_sheets))
+    
+    # Tam okuma: aynı dosyayı eşzamanlı açan oturumlar tek ayrıştırmayı bekler
+    if preview_rows is None:
+        lease = cache.acquire(key, lambda: ingest_uploads(
+            uploaded_files, read_all_sheets=read_all_sheets, progress_callback=progress_callback
+        ))
+        return dict(lease.value, lease=lease)
+    
+    lease = cache.lookup(key)
+    if lease is not None:
+        return dict(lease.value, lease=lease)
+    
+    result = ingest_uploads(uploaded_files, read_all_sheets=read_all_sheets, progress_callback=progress_callback,
+                            preview_rows=preview_rows)
+    if not result['complete']:
+        return dict(result, lease=None)
+    lease = cache.put(key, result)
+    return dict(lease.value, lease=lease)
+
+
+def shared_clean(raw_df, column_mapping, sources=None, progress_callback=None, cache_key=None, reference=None,
+                 backend=None, cache=SHARED_CACHE):
+    """
+    apply_column_mapping'i paylaşılan önbellek üzerinden çalıştırır: aynı
+    yükleme aynı eşleştirmeyle ve aynı temizleme motoruyla daha önce
+    temizlendiyse sonuç yeniden kullanılır.
+    İsimle eşleştirme (reference) üye deposuna bağlı olduğundan önbelleğe alınmaz.
+    
+    Args:
+        raw_df (pd.DataFrame): Ham veri
+        column_mapping (dict): Sütun eşleştirme haritası
+        sources (list): Kaynak bilgileri (bkz. apply_column_mapping)
+        progress_callback (callable): İlerleme bildirimi
+        cache_key (str): Yüklemenin içerik özeti (None ise önbellek kullanılmaz)
+        reference (MemberIndex): İsimle eşleştirme dizini
+        backend (str): Temizleme motoru (None ise CEVIRICI_BACKEND / 'pandas')
+        cache (SharedCache): Önbellek
+    
+    Returns:
+        tuple: (pd.DataFrame: Temiz liste (paylaşılan; değiştirilmemeli),
+                dict: Oturuma ait istatistik kopyası, Lease veya None)
+    """
+    from utils.cleaning_backends import get_backend
+    from utils.data_processor import apply_column_mapping
+    
+    backend = get_backend(backend).name
+    
+    def compute():
+        return apply_column_mapping(raw_df, column_mapping, sources=sources, progress_callback=progress_callback,
+                                    cache_key=cache_key, reference=reference, backend=backend)
+    
+    if cache_key is None or reference is not None:
+        df_clean, stats = compute()
+        return df_clean, stats, None
+    
+    key = (KIND_CLEAN, cache_key, backend, json.dumps(column_mapping, sort_keys=True))
+    lease = cache.acquire(key, compute)
+    df_clean, stats = lease.value
+    # Kurallar ve özet istatistiklere oturum bazında yazılır
+    return df_clean, dict(stats), lease
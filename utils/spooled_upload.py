@@ -0,0 +1,181 @@
+"""
+Diske Akıtılmış (Spooled) Yüklemeler
+Bu modül, yüklenen dosyaların belleğe kopyalanmadan parça parça geçici
+dosyaya yazılmasını ve okuma fonksiyonlarının içeriğe dosya yolu veya mmap
+üzerinden erişmesini sağlar. Böylece bir yükleme bellekte en fazla bir kez
+(Streamlit'in kendi kopyası) bulunur; ayrıştırma doğrudan diskteki dosyadan yapılır.
+"""
+
+import mmap
+import os
+import shutil
+import tempfile
+import weakref
+from contextlib import contextmanager
+
+
+# Geçici dosyaya yazarken kullanılan blok boyutu (byte)
+SPOOL_CHUNK_BYTES = 1024 * 1024
+
+# Geçici dosyaların dizini (None ise sistem varsayılanı)
+SPOOL_DIR = os.environ.get('CEVIRICI_SPOOL_DIR')
+
+
+def _cleanup(handle, path):
+    handle.close()
+    if path is not None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class SpooledUpload:
+    """
+    Diskteki yükleme dosyası. Okuma fonksiyonlarının beklediği dosya arayüzünü
+    (.name, .seek, .read) sağlar; ayrıştırıcılar .path üzerinden doğrudan
+    dosyadan okur.
+    
+    Args:
+        path (str): Dosya yolu
+        name (str): Format tespiti için dosya adı (None ise yolun adı)
+        delete (bool): Nesne kapatıldığında/silindiğinde dosya da silinsin mi?
+    """
+    
+    def __init__(self, path, name=None, delete=False):
+        self.path = path
+        self.name = name or os.path.basename(path)
+        self._file = open(path, 'rb')
+        self._finalizer = weakref.finalize(self, _cleanup, self._file, path if delete else None)
+    
+    @property
+    def size(self):
+        return os.path.getsize(self.path)
+    
+    def seek(self, offset, whence=0):
+        return self._file.seek(offset, whence)
+    
+    def tell(self):
+        return self._file.tell()
+    
+    def read(self, size=-1):
+        return self._file.read(size)
+    
+    def seekable(self):
+        return True
+    
+    def readable(self):
+        return True
+    
+    def getvalue(self):
+        """Tüm içeriği döndürür (geriye dönük uyumluluk; büyük dosyalarda kullanılmamalı)."""
+        with open(self.path, 'rb') as f:
+            return f.read()
+    
+    def close(self):
+        self._finalizer()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def spool_upload(uploaded_file, directory=None):
+    """
+    Yüklenen dosyayı bloklar halinde geçici dosyaya yazar.
+    Dosya zaten diskteyse kopyalamadan aynı nesneyi döndürür.
+    
+    Args:
+        uploaded_file: Streamlit file uploader objesi (veya .name taşıyan dosya nesnesi)
+        directory (str): Geçici dizin (None ise SPOOL_DIR / sistem varsayılanı)
+    
+    Returns:
+        SpooledUpload: Kapatıldığında silinen disk dosyası
+    """
+    if isinstance(uploaded_file, SpooledUpload):
+        return uploaded_file
+    
+    suffix = os.path.splitext(uploaded_file.name)[1]
+    fd, path = tempfile.mkstemp(prefix='cevirici_upload_', suffix=suffix, dir=directory or SPOOL_DIR)
+    uploaded_file.seek(0)
+    with os.fdopen(fd, 'wb') as f:
+        shutil.copyfileobj(uploaded_file, f, SPOOL_CHUNK_BYTES)
+    uploaded_file.seek(0)
+    
+    return SpooledUpload(path, uploaded_file.name, delete=True)
+
+
+def path_or_buffer(uploaded_file):
+    """
+    Dosya diskteyse yolunu, değilse dosya nesnesini döndürür (pandas/openpyxl ikisini de kabul eder).
+    
+    Args:
+        uploaded_file: Dosya nesnesi
+    
+    Returns:
+        str veya dosya nesnesi
+    """
+    return getattr(uploaded_file, 'path', None) or uploaded_file
+
+
+@contextmanager
+def local_path(uploaded_file):
+    """
+    Dosyanın diskteki yolunu verir; bellekteki yüklemeler geçici dosyaya
+    akıtılır ve blok sonunda silinir.
+    
+    Args:
+        uploaded_file: Dosya nesnesi
+    
+    Yields:
+        str: Dosya yolu
+    """
+    path = getattr(uploaded_file, 'path', None)
+    if path:
+        yield path
+        return
+    
+    spooled = spool_upload(uploaded_file)
+    try:
+        yield spooled.path
+    finally:
+        spooled.close()
+
+
+@contextmanager
+def mapped(path):
+    """
+    Dosyayı salt okunur olarak belleğe eşler (boş dosyada boş bytes verir).
+    
+    Args:
+        path (str): Dosya yolu
+    
+    Yields:
+        mmap.mmap veya bytes: Dosya içeriği
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def release_pages(data, start, length):
+    """
+    Eşlenmiş dosyanın okunmuş bölümünü süreç belleğinden bırakır (sayfalar işletim
+    sisteminin önbelleğinde kalır). Tek geçişlik taramalarda tepe belleği sabit tutar;
+    desteklenmeyen platformlarda ve bytes içerikte hiçbir şey yapmaz.
+    
+    Args:
+        data (mmap.mmap veya bytes): Dosya içeriği
+        start (int): Başlangıç konumu (sayfa sınırına hizalı olmalı)
+        length (int): Uzunluk
+    """
+    if not isinstance(data, mmap.mmap) or not hasattr(mmap, 'MADV_DONTNEED'):
+        return
+    length = min(length, len(data) - start)
+    if length > 0:
+        data.madvise(mmap.MADV_DONTNEED, start, length)
@@ -0,0 +1,119 @@
+"""
+Akışlı (Streaming) Dışa Aktarma
+Bu modül, temizlenmiş listeyi parça parça kodlanmış byte blokları halinde
+üreten CSV ve NDJSON üreteçlerini içerir. Çıktının tamamı bellekte hiç
+oluşturulmaz; en yüksek bellek kullanımı parça boyutuyla orantılıdır.
+"""
+
+import os
+import shutil
+import tempfile
+import weakref
+
+from utils.money import to_export_frame
+
+
+# Varsayılan parça boyutu (satır)
+DEFAULT_CHUNK_ROWS = 50_000
+
+
+def iter_csv_chunks(df, chunk_rows=DEFAULT_CHUNK_ROWS, encoding='utf-8-sig', sep=','):
+    """
+    DataFrame'i CSV olarak parça parça kodlar.
+    BOM (utf-8-sig) ve başlık satırı yalnızca ilk parçada yazılır.
+    
+    Args:
+        df (pd.DataFrame): Temizlenmiş veri
+        chunk_rows (int): Parça başına satır sayısı
+        encoding (str): Çıktı kodlaması
+        sep (str): Alan ayırıcı
+    
+    Yields:
+        bytes: Kodlanmış CSV bloğu
+    """
+    # BOM sadece dosya başında olmalı; sonraki parçalar BOM'suz kodlanır
+    body_encoding = 'utf-8' if encoding.lower() in ('utf-8-sig', 'utf_8_sig') else encoding
+    
+    if len(df) == 0:
+        yield to_export_frame(df).to_csv(index=False, sep=sep).encode(encoding)
+        return
+    
+    for start in range(0, len(df), chunk_rows):
+        chunk = to_export_frame(df.iloc[start:start + chunk_rows])
+        text = chunk.to_csv(index=False, header=(start == 0), sep=sep)
+        yield text.encode(encoding if start == 0 else body_encoding)
+
+
+def iter_ndjson_chunks(df, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    DataFrame'i NDJSON (her satırda bir JSON kaydı) olarak parça parça kodlar.
+    
+    Args:
+        df (pd.DataFrame): Temizlenmiş veri
+        chunk_rows (int): Parça başına satır sayısı
+    
+    Yields:
+        bytes: UTF-8 kodlanmış NDJSON bloğu
+    """
+    for start in range(0, len(df), chunk_rows):
+        chunk = to_export_frame(df.iloc[start:start + chunk_rows])
+        text = chunk.to_json(orient='records', lines=True, force_ascii=False)
+        if not text.endswith('\n'):
+            text += '\n'
+        yield text.encode('utf-8')
+
+
+def write_chunks(chunks, path):
+    """
+    Kodlanmış blokları doğrudan diske yazar.
+    
+    Args:
+        chunks (iterable): bytes blokları
+        path (str): Hedef dosya yolu
+    
+    Returns:
+        int: Yazılan byte sayısı
+    """
+    written = 0
+    with open(path, 'wb') as f:
+        for block in chunks:
+            f.write(block)
+            written += len(block)
+    return written
+
+
+def spool_chunks(chunks, directory=None, file_name='export.bin'):
+    """
+    Kodlanmış blokları geçici dizindeki bir dosyaya yazar (Streamlit indirme butonları için).
+    Aynı isimle tekrar çağrıldığında dosyanın üzerine yazılır.
+    
+    Args:
+        chunks (iterable): bytes blokları
+        directory (str): Hedef dizin (None ise yeni geçici dizin)
+        file_name (str): Dosya adı
+    
+    Returns:
+        str: Yazılan dosyanın yolu
+    """
+    directory = directory or tempfile.mkdtemp(prefix='cevirici_')
+    path = os.path.join(directory, file_name)
+    write_chunks(chunks, path)
+    return path
+
+
+class ExportDir:
+    """
+    Oturuma ait geçici dışa aktarma dizini. Nesne silindiğinde (oturum
+    sıfırlandığında veya kapandığında) ya da süreç kapanırken dizin silinir.
+    
+    Args:
+        prefix (str): Dizin adı öneki
+    """
+    
+    def __init__(self, prefix='cevirici_'):
+        self.path = tempfile.mkdtemp(prefix=prefix)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.path, ignore_errors=True)
+    
+    def cleanup(self):
+        """Dizini hemen siler (birden fazla çağrılabilir)."""
+        self._finalizer()
@@ -0,0 +1,257 @@
+"""
+Özet Analizler
+Bu modül, temiz liste oluşturulduğunda yönetici özetlerini (temel metrikler,
+tutar bantlarına göre dağılım, üye no aralığı ve kaynak bazında sayılar,
+aykırı tutarlar) tek seferde hesaplar. Sonuç işlem istatistiklerinde
+('summary') temiz listeyle birlikte saklanır; gösterge paneli ve Excel özet
+sayfası sütunları yeniden taramadan bu sonucu okur.
+
+Tutar sütunu bir kez sıralanır: toplam, ortalama, medyan, çeyrekler, bant
+sayıları/toplamları ve aykırı değer sınırları sıralı dizi ve kümülatif toplam
+üzerinden ikili aramayla çıkarılır. Üye no aralıkları ve kaynaklar birer
+gruplama geçişiyle hesaplanır. Tutarlar kuruş cinsinden tam sayıdır.
+"""
+
+from utils.lazy_imports import lazy_import
+from utils.money import AMOUNT_COLUMN, KURUS_PER_LIRA, divide_kurus, format_lira, kurus_to_lira, to_export_frame
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+pa = lazy_import('pyarrow')
+pc = lazy_import('pyarrow.compute')
+
+
+# Tutar bantlarının alt sınırları (TL); ilk bandın altı "Negatif" bandıdır
+AMOUNT_BANDS = (0, 100, 250, 500, 1000, 2500)
+
+# Üye no aralıklarının genişliği (örn: 1000 -> 0-999, 1000-1999, ...)
+MEMBER_RANGE_SIZE = 1000
+
+# Aykırı değer sınırları: çeyrekler arası açıklığın katı (Tukey çitleri)
+OUTLIER_IQR_FACTOR = 1.5
+
+# Özette saklanan (medyandan en uzak) aykırı satır sayısı
+OUTLIER_LIMIT = 100
+
+# Sayısal sayılan üye no (int64'e taşmadan çevrilebilen rakam dizisi)
+_MEMBER_NUMBER = r'^[0-9]{1,18}$'
+
+# Özetin okuduğu diğer sütunlar
+MEMBER_COLUMN = "Üye No"
+TC_COLUMN = "TC Kimlik No"
+SOURCE_COLUMN = "Kaynak"
+
+
+def _quantile(sorted_amounts, q):
+    """Sıralı dizide doğrusal aradeğerlemeli yüzdelik (numpy varsayılanıyla aynı)."""
+    position = q * (len(sorted_amounts) - 1)
+    low = int(np.floor(position))
+    high = min(low + 1, len(sorted_amounts) - 1)
+    return sorted_amounts[low] + (sorted_amounts[high] - sorted_amounts[low]) * (position - low)
+
+
+def _band_labels(edges):
+    labels = [f"{low:,} – {high:,} ₺" for low, high in zip(edges, edges[1:])]
+    return ["Negatif"] + labels + [f"{edges[-1]:,} ₺ ve üzeri"]
+
+
+def _group_rows(keys, amounts, labels=None):
+    """Anahtar dizisine göre kayıt sayısı ve tam tutar toplamı (tek gruplama geçişi)."""
+    grouped = pd.Series(amounts).groupby(keys, sort=True).agg(['count', 'sum'])
+    return [
+        {'group': labels(key) if labels else key, 'count': int(row['count']), 'amount_total': int(row['sum'])}
+        for key, row in grouped.iterrows()
+    ]
+
+
+def build_summary(df_clean, bands=AMOUNT_BANDS, member_range_size=MEMBER_RANGE_SIZE,
+                  outlier_factor=OUTLIER_IQR_FACTOR, outlier_limit=OUTLIER_LIMIT):
+    """
+    Temiz listenin özet analizlerini hesaplar.
+    
+    Args:
+        df_clean (pd.DataFrame): Temizlenmiş veri (tutar kuruş cinsinden)
+        bands (tuple): Tutar bantlarının artan alt sınırları (TL)
+        member_range_size (int): Üye no aralığı genişliği
+        outlier_factor (float): Aykırı değer çitlerinin çeyrekler arası açıklık katı
+        outlier_limit (int): Saklanacak aykırı satır sayısı
+    
+    Returns:
+        dict: Metrikler ('records', 'amount_total', 'amount_mean', 'amount_median',
+              'amount_min', 'amount_max', 'unique_members'), 'amount_bands',
+              'member_ranges', 'sources' ({'group', 'count', 'amount_total'} listeleri),
+              'outlier_count', 'outlier_bounds' (alt, üst; kuruş) ve 'outliers'
+              (medyandan en uzak aykırı satırlar, TL cinsinden)
+    """
+    amounts = df_clean[AMOUNT_COLUMN].to_numpy(dtype=np.int64)
+    count = len(amounts)
+    
+    # Tek sıralama: sıralı dizi + kümülatif toplam tüm tutar metriklerini verir
+    order = np.argsort(amounts, kind='stable')
+    sorted_amounts = amounts[order]
+    prefix = np.concatenate(([0], np.cumsum(sorted_amounts)))
+    total = int(prefix[-1])
+    
+    summary = {
+        'records': count,
+        'amount_total': total,
+        'amount_mean': divide_kurus(total, count),
+        'amount_median': int(round(_quantile(sorted_amounts, 0.5))) if count else 0,
+        'amount_min': int(sorted_amounts[0]) if count else 0,
+        'amount_max': int(sorted_amounts[-1]) if count else 0,
+        'unique_members': int(df_clean[TC_COLUMN].nunique()) if TC_COLUMN in df_clean.columns else 0,
+    }
+    
+    # Tutar bantları: sınırların sıralı dizideki konumları sayıları, kümülatif toplamlar tutarları verir
+    edges = np.asarray(bands, dtype=np.int64) * KURUS_PER_LIRA
+    bounds = np.concatenate(([0], np.searchsorted(sorted_amounts, edges, side='left'), [count]))
+    counts = np.diff(bounds)
+    totals = prefix[bounds[1:]] - prefix[bounds[:-1]]
+    summary['amount_bands'] = [
+        {'group': label, 'count': int(band_count), 'amount_total': int(band_total)}
+        for index, (label, band_count, band_total) in enumerate(zip(_band_labels(bands), counts, totals))
+        if index > 0 or band_count > 0
+    ]
+    
+    # Üye no aralıkları (sayısal olmayan üye no'lar ayrı grupta)
+    summary['member_ranges'] = []
+    if MEMBER_COLUMN in df_clean.columns and count:
+        members = pa.array(df_clean[MEMBER_COLUMN], type=pa.string(), from_pandas=True)
+        numeric = pc.fill_null(pc.match_substring_regex(members, _MEMBER_NUMBER), False)
+        numbers = pc.cast(pc.if_else(numeric, members, '0'), pa.int64()).to_numpy()
+        keys = np.where(numeric.to_numpy(zero_copy_only=False), numbers // member_range_size, -1)
+        summary['member_ranges'] = _group_rows(
+            keys, amounts,
+            lambda key: "Sayısal olmayan" if key < 0
+            else f"{key * member_range_size:,} – {(key + 1) * member_range_size - 1:,}"
+        )
+    
+    # Kaynak (dosya/sayfa) bazında
+    summary['sources'] = []
+    if SOURCE_COLUMN in df_clean.columns and count:
+        summary['sources'] = _group_rows(df_clean[SOURCE_COLUMN].to_numpy(), amounts)
+    
+    # Aykırı tutarlar: çeyreklerin dışındaki çitlerin altı/üstü sıralı dizinin iki ucudur
+    summary['outlier_count'] = 0
+    summary['outlier_bounds'] = (0, 0)
+    summary['outliers'] = to_export_frame(df_clean.iloc[:0])
+    if count:
+        q1, q3 = _quantile(sorted_amounts, 0.25), _quantile(sorted_amounts, 0.75)
+        low, high = q1 - outlier_factor * (q3 - q1), q3 + outlier_factor * (q3 - q1)
+        low_end = int(np.searchsorted(sorted_amounts, low, side='left'))
+        high_start = int(np.searchsorted(sorted_amounts, high, side='right'))
+        summary['outlier_count'] = low_end + count - high_start
+        summary['outlier_bounds'] = (int(np.ceil(low)), int(np.floor(high)))
+        
+        candidates = np.concatenate((
+            order[:min(low_end, outlier_limit)], order[max(high_start, count - outlier_limit):]
+        ))
+        distance = np.abs(amounts[candidates] - summary['amount_median'])
+        picked = candidates[np.argsort(-distance, kind='stable')[:outlier_limit]]
+        summary['outliers'] = to_export_frame(df_clean.iloc[picked].reset_index(drop=True))
+    
+    return summary
+
+
+def summarize(df_clean, stats, **options):
+    """
+    Özeti hesaplayıp işlem istatistiklerine 'summary' olarak yazar.
+    
+    Args:
+        df_clean (pd.DataFrame): Temizlenmiş veri
+        stats (dict): İşlem istatistikleri (yerinde güncellenir)
+        **options: build_summary seçenekleri
+    
+    Returns:
+        dict: Özet
+    """
+    stats['summary'] = build_summary(df_clean, **options)
+    return stats['summary']
+
+
+def metric_rows(summary):
+    """
+    Temel metrikleri gösterim satırlarına çevirir.
+    
+    Args:
+        summary (dict): build_summary sonucu
+    
+    Returns:
+        list: [{'Metrik', 'Değer'}, ...]
+    """
+    return [
+        {'Metrik': 'Toplam Kayıt', 'Değer': f"{summary['records']:,}"},
+        {'Metrik': 'Benzersiz Üye', 'Değer': f"{summary['unique_members']:,}"},
+        {'Metrik': 'Toplam Tutar', 'Değer': format_lira(summary['amount_total'])},
+        {'Metrik': 'Ortalama Tutar', 'Değer': format_lira(summary['amount_mean'])},
+        {'Metrik': 'Medyan Tutar', 'Değer': format_lira(summary['amount_median'])},
+        {'Metrik': 'En Düşük Tutar', 'Değer': format_lira(summary['amount_min'])},
+        {'Metrik': 'En Yüksek Tutar', 'Değer': format_lira(summary['amount_max'])},
+        {'Metrik': 'Aykırı Tutarlı Kayıt', 'Değer': f"{summary['outlier_count']:,}"},
+    ]
+
+
+def group_frame(rows, label):
+    """
+    Grup satırlarını (bant, aralık, kaynak) tabloya çevirir; tutarlar TL cinsinden.
+    
+    Args:
+        rows (list): build_summary'deki {'group', 'count', 'amount_total'} listesi
+        label (str): Grup sütununun başlığı
+    
+    Returns:
+        pd.DataFrame: label, "Kayıt", "Pay (%)", "Toplam Tutar" sütunları
+    """
+    frame = pd.DataFrame(rows, columns=['group', 'count', 'amount_total'])
+    records = frame['count'].sum()
+    return pd.DataFrame({
+        label: frame['group'],
+        "Kayıt": frame['count'],
+        "Pay (%)": (frame['count'] * 100 / records).round(2) if records else 0.0,
+        "Toplam Tutar": kurus_to_lira(frame['amount_total']),
+    })
+
+
+def summary_tables(summary):
+    """
+    Özetin gösterim/dışa aktarma tablolarını döndürür.
+    
+    Args:
+        summary (dict): build_summary sonucu
+    
+    Returns:
+        dict: başlık -> pd.DataFrame (boş gruplar atlanır)
+    """
+    tables = {
+        "Özet": pd.DataFrame(metric_rows(summary)),
+        "Tutar Bantları": group_frame(summary['amount_bands'], "Tutar Bandı"),
+    }
+    if summary['member_ranges']:
+        tables["Üye No Aralıkları"] = group_frame(summary['member_ranges'], "Üye No Aralığı")
+    if len(summary['sources']) > 1:
+        tables["Kaynaklar"] = group_frame(summary['sources'], "Kaynak")
+    if summary['outlier_count']:
+        low, high = summary['outlier_bounds']
+        title = f"Aykırı Tutarlar ({format_lira(low)} altı / {format_lira(high)} üstü)"
+        tables[title] = summary['outliers']
+    return tables
+
+
+def write_summary_sheet(writer, summary, sheet_name='Özet', title_format=None):
+    """
+    Özet tablolarını Excel'de tek sayfaya alt alta yazar.
+    
+    Args:
+        writer (pd.ExcelWriter): xlsxwriter motorlu yazıcı
+        summary (dict): build_summary sonucu
+        sheet_name (str): Sayfa adı
+        title_format: Tablo başlıklarının xlsxwriter formatı (None ise kalın)
+    """
+    title_format = title_format or writer.book.add_format({'bold': True})
+    row = 0
+    for title, table in summary_tables(summary).items():
+        table.to_excel(writer, index=False, sheet_name=sheet_name, startrow=row + 1)
+        writer.sheets[sheet_name].write(row, 0, title, title_format)
+        row += len(table) + 3
+    writer.sheets[sheet_name].set_column(0, 0, 28)
+    writer.sheets[sheet_name].set_column(1, 5, 16)
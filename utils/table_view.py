@@ -0,0 +1,129 @@
+"""
+Sayfalı Tablo Görünümü
+Bu modül, büyük tabloların tarayıcıya yalnızca görünen sayfa kadar
+gönderilebilmesi için sunucu tarafında filtreleme, sıralama ve sayfa
+hesabı yapar. Fonksiyonlar satır konumları (np.ndarray) üzerinde çalışır;
+tablonun kendisi kopyalanmaz.
+"""
+
+from utils.lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# Arama dizininde alanlar arasına konan ayırıcı (iki alana taşan eşleşmeyi engeller)
+_FIELD_SEPARATOR = '\x1f'
+
+
+def _fold(text):
+    """Türkçe büyük/küçük harf farkını kaldırır (İ -> i, I -> ı)."""
+    return text.replace('İ', 'i').replace('I', 'ı').lower()
+
+
+def _fold_series(values):
+    """_fold'un sütun bazında vektörel karşılığı."""
+    return values.str.replace('İ', 'i', regex=False).str.replace('I', 'ı', regex=False).str.lower()
+
+
+def build_search_index(df, columns=('Adı', 'Soyadı')):
+    """
+    Metin araması için satır başına küçük harfli arama metni üretir.
+    Tablo değişmedikçe bir kez hesaplanıp tekrar kullanılmalıdır.
+    
+    Args:
+        df (pd.DataFrame): Tablo
+        columns (tuple): Aranacak sütunlar (tabloda olmayanlar atlanır)
+    
+    Returns:
+        pd.Series: Konum sırasıyla arama metinleri
+    """
+    present = [col for col in columns if col in df.columns]
+    if not present:
+        return pd.Series([''] * len(df), dtype=object)
+    
+    text = df[present[0]].astype(str).reset_index(drop=True)
+    for col in present[1:]:
+        text = text.str.cat(df[col].astype(str).reset_index(drop=True), sep=_FIELD_SEPARATOR)
+    return _fold_series(text)
+
+
+def filter_positions(df, search_term=None, min_amount=None, amount_column='Aidat Tutarı', search_index=None):
+    """
+    Filtreye uyan satırların konumlarını döndürür.
+    
+    Args:
+        df (pd.DataFrame): Tablo
+        search_term (str): Ad/soyad içinde aranacak metin (büyük/küçük harf duyarsız)
+        min_amount: En düşük tutar (tutar sütunuyla aynı birimde); None ise uygulanmaz
+        amount_column (str): Tutar sütunu
+        search_index (pd.Series): build_search_index çıktısı (None ise yeniden hesaplanır)
+    
+    Returns:
+        np.ndarray: Uyan satır konumları (artan sırada)
+    """
+    mask = np.ones(len(df), dtype=bool)
+    
+    if search_term:
+        if search_index is None:
+            search_index = build_search_index(df)
+        term = _fold(search_term)
+        mask &= search_index.str.contains(term, regex=False, na=False).to_numpy(dtype=bool)
+    
+    if min_amount is not None and amount_column in df.columns:
+        mask &= (df[amount_column] >= min_amount).to_numpy(dtype=bool, na_value=False)
+    
+    return np.flatnonzero(mask)
+
+
+def sort_positions(df, column, ascending=True):
+    """
+    Tablonun bir sütuna göre sıralanmış satır konumlarını döndürür (kararlı sıralama).
+    
+    Args:
+        df (pd.DataFrame): Tablo
+        column (str): Sıralama sütunu
+        ascending (bool): Artan sıralama
+    
+    Returns:
+        np.ndarray: Sıralı satır konumları
+    """
+    values = df[column].reset_index(drop=True)
+    if values.dtype == object or pd.api.types.is_string_dtype(values):
+        values = _fold_series(values.astype(str))
+    return values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+
+
+def restrict_positions(order, positions, row_count):
+    """
+    Sıralı konumlardan yalnızca filtreye uyanları (sırayı bozmadan) bırakır.
+    
+    Args:
+        order (np.ndarray): Tüm tablonun sıralı konumları
+        positions (np.ndarray): Filtreye uyan konumlar
+        row_count (int): Tablonun satır sayısı
+    
+    Returns:
+        np.ndarray: Sıralı ve filtrelenmiş konumlar
+    """
+    keep = np.zeros(row_count, dtype=bool)
+    keep[positions] = True
+    return order[keep[order]]
+
+
+def page_bounds(total_rows, page, page_size):
+    """
+    Sayfa numarasını geçerli aralığa çeker ve sayfanın satır sınırlarını hesaplar.
+    
+    Args:
+        total_rows (int): Toplam satır sayısı
+        page (int): Sayfa numarası (1'den başlar)
+        page_size (int): Sayfa başına satır
+    
+    Returns:
+        tuple: (int: başlangıç, int: bitiş, int: geçerli sayfa, int: sayfa sayısı)
+    """
+    page_count = max(1, -(-total_rows // page_size))
+    page = min(max(1, int(page)), page_count)
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total_rows), page, page_count
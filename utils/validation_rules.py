@@ -0,0 +1,354 @@
+"""
+Doğrulama Kuralları
+Bu modül, denetim için tanımlanan bildirimsel (JSON/YAML) kuralları temizlenmiş
+listeye uygular. Kurallar bir kez derlenip her biri tüm tabloya tek seferde
+uygulanan vektörel bir maske üretir; maskeler tek matriste toplanır ve kural
+bazında ihlal sayıları istatistiklere yazılır. Kurallar satır elemez, yalnızca
+işaretler.
+
+Örnek kural dosyası (JSON):
+    {"rules": [
+        {"name": "tutar_araligi", "type": "range", "field": "amount", "min": 50, "max": 5000},
+        {"name": "kaynak_tutar", "type": "range", "field": "amount", "by": "source",
+         "limits": {"memurlar.xlsx": [100, 750]}, "default": [50, 5000]},
+        {"name": "uye_no_tekil", "type": "unique", "field": "member_no"},
+        {"name": "ad_dolu", "type": "not_empty", "field": ["first_name", "last_name"]},
+        {"name": "kara_liste", "type": "not_in", "field": "tc_no", "values_file": "kara_liste.txt"},
+        {"name": "uye_no_bicimi", "type": "pattern", "field": "member_no", "pattern": "\\\\d{1,8}"}
+    ]}
+"""
+
+import json
+import os
+import re
+
+from utils.lazy_imports import lazy_import
+from utils.money import AMOUNT_COLUMN, is_kurus, kurus_to_lira, to_export_frame
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+# Kural alan adları -> temizlenmiş tablodaki sütunlar (sütun adı doğrudan da yazılabilir)
+FIELD_COLUMNS = {
+    'member_no': "Üye No",
+    'first_name': "Adı",
+    'last_name': "Soyadı",
+    'tc_no': "TC Kimlik No",
+    'amount': "Aidat Tutarı",
+    'source': "Kaynak",
+}
+
+RULE_TYPES = ['not_empty', 'unique', 'range', 'not_in', 'pattern']
+
+RULE_TYPE_LABELS = {
+    'not_empty': "Boş olamaz",
+    'unique': "Tekil olmalı",
+    'range': "Aralık dışında olamaz",
+    'not_in': "Engelli listede olamaz",
+    'pattern': "Biçime uymalı",
+}
+
+# Varsayılan kural dosyası (arayüz, komut satırı ve HTTP servisi için)
+DEFAULT_RULES_PATH = os.environ.get('CEVIRICI_RULES_PATH')
+
+
+def load_rules(source, file_name=None):
+    """
+    Kural dosyasını okur (.json; .yaml/.yml için PyYAML gerekir).
+    
+    Args:
+        source: Dosya yolu veya .read() destekleyen dosya nesnesi
+        file_name (str): Format tespiti için dosya adı (None ise yoldan/nesneden alınır)
+    
+    Returns:
+        list: Kural tanımları (dict listesi)
+    """
+    if isinstance(source, (str, os.PathLike)):
+        file_name = file_name or os.fspath(source)
+        with open(source, 'rb') as f:
+            content = f.read()
+    else:
+        file_name = file_name or getattr(source, 'name', '')
+        source.seek(0)
+        content = source.read()
+    
+    text = content.decode('utf-8-sig') if isinstance(content, bytes) else content
+    
+    if file_name.lower().endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML kural dosyaları için PyYAML gerekli (pip install pyyaml); JSON kullanabilirsiniz.")
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Kural dosyası okunamadı: {e}")
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Kural dosyası okunamadı: {e}")
+    
+    rules = data.get('rules') if isinstance(data, dict) else data
+    if not isinstance(rules, list):
+        raise ValueError("Kural dosyası bir liste veya {\"rules\": [...]} biçiminde olmalı.")
+    return rules
+
+
+def _resolve_column(field, rule_name):
+    column = FIELD_COLUMNS.get(field, field)
+    if not isinstance(column, str) or not column:
+        raise ValueError(f"'{rule_name}' kuralında geçersiz alan: {field!r}")
+    return column
+
+
+def _column(df, column, rule_name):
+    if column not in df.columns:
+        raise ValueError(f"'{rule_name}' kuralının sütunu tabloda yok: {column}")
+    return df[column]
+
+
+def _per_unique(series, func, na_value):
+    """
+    Değer bazlı kontrolü yalnızca tekil değerlere uygulayıp satırlara dağıtır
+    (üye listelerinde ad, kaynak gibi sütunlar çok tekrarlıdır).
+    
+    Args:
+        series (pd.Series): Sütun
+        func (callable): Tekil değerler Series'i -> bool Series
+        na_value (bool): Boş (NaN) hücreler için sonuç
+    
+    Returns:
+        np.ndarray: Satır bazlı bool dizi
+    """
+    codes, uniques = pd.factorize(series)
+    result = np.asarray(func(pd.Series(uniques).astype(str)), dtype=bool)
+    # NaN'ların kodu -1: dizinin sonuna eklenen na_value'ya denk gelir
+    return np.append(result, na_value)[codes]
+
+
+def _is_blank(series):
+    return _per_unique(series, lambda values: values.str.strip() == '', True)
+
+
+def _compile_not_empty(rule, name, columns):
+    def check(df):
+        mask = np.zeros(len(df), dtype=bool)
+        for column in columns:
+            mask |= _is_blank(_column(df, column, name))
+        return mask
+    return check
+
+
+def _compile_unique(rule, name, columns):
+    def check(df):
+        series = [_column(df, column, name) for column in columns]
+        # Değerler tamsayı kodlarına çevrilip tekrarlar kodlar üzerinden bulunur
+        codes = pd.DataFrame({i: pd.factorize(s)[0] for i, s in enumerate(series)})
+        # Boş değerler tekrar sayılmaz (boşluk kontrolü not_empty kuralının işi)
+        filled = ~np.column_stack([_is_blank(s) for s in series]).any(axis=1)
+        return codes.duplicated(keep=False).to_numpy() & filled
+    return check
+
+
+def _bounds(value, name):
+    if value is None:
+        return np.nan, np.nan
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise ValueError(f"'{name}' kuralında sınırlar [en az, en çok] biçiminde olmalı: {value!r}")
+    return tuple(np.nan if v is None else float(v) for v in value)
+
+
+def _compile_range(rule, name, columns):
+    if len(columns) != 1:
+        raise ValueError(f"'{name}' kuralı (range) tek bir alan için tanımlanır.")
+    column = columns[0]
+    
+    if 'by' in rule:
+        group_column = _resolve_column(rule['by'], name)
+        limits = rule.get('limits')
+        if not isinstance(limits, dict) or not limits:
+            raise ValueError(f"'{name}' kuralında 'by' ile birlikte 'limits' tanımlanmalı.")
+        bounds = {str(key): _bounds(value, name) for key, value in limits.items()}
+        default = _bounds(rule.get('default'), name)
+        min_by_group = {key: low for key, (low, _) in bounds.items()}
+        max_by_group = {key: high for key, (_, high) in bounds.items()}
+    else:
+        group_column = None
+        low = rule.get('min')
+        high = rule.get('max')
+        if low is None and high is None:
+            raise ValueError(f"'{name}' kuralında 'min' veya 'max' tanımlanmalı.")
+        default = (np.nan if low is None else float(low), np.nan if high is None else float(high))
+    
+    def check(df):
+        values = _column(df, column, name)
+        # Sınırlar TL cinsinden yazılır; tutar sütunu bellekte kuruş tutulur
+        if column == AMOUNT_COLUMN and is_kurus(values):
+            values = kurus_to_lira(values)
+        values = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+        if group_column is None:
+            lows = np.full(len(df), default[0])
+            highs = np.full(len(df), default[1])
+        else:
+            groups = _column(df, group_column, name).astype(str)
+            lows = groups.map(min_by_group).to_numpy(dtype=float, na_value=np.nan)
+            highs = groups.map(max_by_group).to_numpy(dtype=float, na_value=np.nan)
+            # Listede olmayan gruplar varsayılan sınırları kullanır
+            known = groups.isin(bounds.keys()).to_numpy()
+            lows = np.where(known, lows, default[0])
+            highs = np.where(known, highs, default[1])
+        
+        # NaN sınır "sınırsız" anlamına gelir; karşılaştırma False döner
+        with np.errstate(invalid='ignore'):
+            return (values < lows) | (values > highs)
+    return check
+
+
+def _compile_not_in(rule, name, columns):
+    values = [str(v).strip() for v in rule.get('values', [])]
+    if rule.get('values_file'):
+        try:
+            with open(rule['values_file'], encoding='utf-8-sig') as f:
+                values.extend(line.strip() for line in f if line.strip())
+        except OSError as e:
+            raise ValueError(f"'{name}' kuralının değer dosyası okunamadı: {e}")
+    if not values:
+        raise ValueError(f"'{name}' kuralında 'values' veya 'values_file' tanımlanmalı.")
+    blocked = pd.Index(values).unique()
+    
+    def check(df):
+        mask = np.zeros(len(df), dtype=bool)
+        for column in columns:
+            mask |= _per_unique(_column(df, column, name), lambda values: values.str.strip().isin(blocked), False)
+        return mask
+    return check
+
+
+def _compile_pattern(rule, name, columns):
+    try:
+        pattern = re.compile(rule['pattern']).pattern
+    except KeyError:
+        raise ValueError(f"'{name}' kuralında 'pattern' tanımlanmalı.")
+    except re.error as e:
+        raise ValueError(f"'{name}' kuralındaki desen geçersiz: {e}")
+    
+    def check(df):
+        mask = np.zeros(len(df), dtype=bool)
+        for column in columns:
+            # Boş değerler desene göre değerlendirilmez
+            mask |= _per_unique(
+                _column(df, column, name),
+                lambda values: ~values.str.fullmatch(pattern) & (values.str.strip() != ''),
+                False
+            )
+        return mask
+    return check
+
+
+_COMPILERS = {
+    'not_empty': _compile_not_empty,
+    'unique': _compile_unique,
+    'range': _compile_range,
+    'not_in': _compile_not_in,
+    'pattern': _compile_pattern,
+}
+
+
+def compile_rules(rules):
+    """
+    Kural tanımlarını doğrular ve vektörel kontrol fonksiyonlarına derler.
+    
+    Args:
+        rules (list): load_rules'un döndürdüğü kural tanımları
+    
+    Returns:
+        list: [{'name', 'type', 'description', 'check'}, ...] derlenmiş kurallar
+    """
+    compiled = []
+    names = set()
+    
+    for index, rule in enumerate(rules):
+        if not isinstance(rule, dict):
+            raise ValueError(f"{index + 1}. kural bir nesne olmalı: {rule!r}")
+        
+        rule_type = rule.get('type')
+        name = str(rule.get('name') or f"{rule_type}_{index + 1}")
+        if rule_type not in _COMPILERS:
+            raise ValueError(f"'{name}' kuralının türü geçersiz: {rule_type!r} (geçerli: {', '.join(RULE_TYPES)})")
+        if name in names:
+            raise ValueError(f"Aynı isimli birden fazla kural var: {name}")
+        names.add(name)
+        
+        fields = rule.get('field')
+        if fields is None:
+            raise ValueError(f"'{name}' kuralında 'field' tanımlanmalı.")
+        fields = fields if isinstance(fields, list) else [fields]
+        columns = [_resolve_column(field, name) for field in fields]
+        
+        compiled.append({
+            'name': name,
+            'type': rule_type,
+            'description': rule.get('description') or f"{', '.join(columns)}: {RULE_TYPE_LABELS[rule_type]}",
+            'check': _COMPILERS[rule_type](rule, name, columns),
+        })
+    
+    return compiled
+
+
+def evaluate_rules(df_clean, compiled_rules):
+    """
+    Derlenmiş kuralları tabloya uygular.
+    
+    Args:
+        df_clean (pd.DataFrame): Temizlenmiş veri
+        compiled_rules (list): compile_rules'un döndürdüğü kurallar
+    
+    Returns:
+        np.ndarray: (satır sayısı × kural sayısı) ihlal matrisi (True = ihlal)
+    """
+    if not compiled_rules or df_clean.empty:
+        return np.zeros((len(df_clean), len(compiled_rules)), dtype=bool)
+    return np.column_stack([rule['check'](df_clean) for rule in compiled_rules])
+
+
+def apply_rules(df_clean, stats, compiled_rules):
+    """
+    Kuralları uygular ve sonuçları istatistiklere yazar: 'rule_violations'
+    (kural adı -> ihlal sayısı), 'rule_failed_rows' (en az bir kuralı ihlal
+    eden satır sayısı) ve 'rule_report' (bkz. violation_report).
+    
+    Args:
+        df_clean (pd.DataFrame): Temizlenmiş veri
+        stats (dict): apply_column_mapping'in döndürdüğü istatistikler (yerinde güncellenir)
+        compiled_rules (list): compile_rules'un döndürdüğü kurallar
+    
+    Returns:
+        np.ndarray: İhlal matrisi (bkz. evaluate_rules)
+    """
+    violations = evaluate_rules(df_clean, compiled_rules)
+    counts = violations.sum(axis=0)
+    stats['rule_violations'] = {rule['name']: int(count) for rule, count in zip(compiled_rules, counts)}
+    stats['rule_failed_rows'] = int(violations.any(axis=1).sum())
+    stats['rule_report'] = violation_report(df_clean, compiled_rules, violations)
+    return violations
+
+
+def violation_report(df_clean, compiled_rules, violations):
+    """
+    En az bir kuralı ihlal eden satırları, ihlal edilen kural adlarıyla birlikte döndürür.
+    
+    Args:
+        df_clean (pd.DataFrame): Temizlenmiş veri
+        compiled_rules (list): Derlenmiş kurallar
+        violations (np.ndarray): İhlal matrisi
+    
+    Returns:
+        pd.DataFrame: İhlal raporu ("İhlal Edilen Kurallar" sütunu eklenmiş)
+    """
+    failed = violations.any(axis=1)
+    report = to_export_frame(df_clean[failed].reset_index(drop=True))
+    names = np.array([rule['name'] for rule in compiled_rules], dtype=object)
+    report["İhlal Edilen Kurallar"] = [", ".join(names[row]) for row in violations[failed]]
+    return report
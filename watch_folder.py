@@ -0,0 +1,137 @@
+"""
+Sendika Kesinti Listesi Düzenleyici - Klasör İzleyici
+Paylaşılan bir dizine bırakılan listeleri arayüz açmadan otomatik dönüştüren
+uzun süre çalışan servis. Yazımı biten her dosyanın düzeni parmak iziyle
+tanınır, o düzen için kaydedilmiş eşleştirme uygulanır; temiz liste, hata
+raporu ve JSON manifesto çıktı dizinine yazılır. İşlenen dosyalar giriş
+dizinindeki islenen/, hatali/ veya eslesmeyen/ klasörüne taşınır.
+
+Kullanım:
+    python watch_folder.py --learn ornek_liste.xlsx
+    python watch_folder.py --learn ornek_liste.xlsx --mapping eslestirme.json
+    python watch_folder.py gelen/ cikti/ --workers 4
+    python watch_folder.py gelen/ cikti/ --format parquet --rules kurallar.json
+    python watch_folder.py gelen/ cikti/ --once
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+from datetime import datetime
+
+from utils.cleaning_backends import BACKENDS, DEFAULT_BACKEND
+from utils.data_processor import validate_mapping
+from utils.folder_watch import POLL_SECONDS, SETTLE_SECONDS, FolderWatcher
+from utils.layout_store import MAPPINGS_DIR, layout_fingerprint, save_mapping
+from utils.pipeline import OUTPUT_FORMATS, REQUIRED_COLUMNS, normalize_mapping, open_source, read_source, suggest_mapping
+from utils.validation_rules import DEFAULT_RULES_PATH, load_rules, compile_rules
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Bir dizine bırakılan sendika kesinti listelerini otomatik dönüştürür.")
+    parser.add_argument('input_dir', nargs='?', help="İzlenecek giriş dizini")
+    parser.add_argument('output_dir', nargs='?', help="Çıktıların ve manifestoların yazılacağı dizin")
+    parser.add_argument('--learn', metavar='DOSYA',
+                        help="Örnek dosyanın düzeni için eşleştirmeyi kaydeder ve çıkar "
+                             "(--mapping verilmezse otomatik öneri kaydedilir)")
+    parser.add_argument('-m', '--mapping', help="--learn ile kaydedilecek sütun eşleştirme JSON dosyası")
+    parser.add_argument('--mappings', default=MAPPINGS_DIR,
+                        help=f"Kayıtlı eşleştirme dizini (varsayılan {MAPPINGS_DIR})")
+    parser.add_argument('--auto-mapping', action='store_true',
+                        help="Kayıtlı eşleştirmesi olmayan dosyalara otomatik öneriyi uygula "
+                             "(verilmezse bu dosyalar eslesmeyen/ klasörüne taşınır)")
+    parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='csv', help="Çıktı formatı")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="Süreç havuzundaki worker sayısı (aynı anda işlenen en fazla dosya)")
+    parser.add_argument('--settle', type=float, default=SETTLE_SECONDS,
+                        help="Dosyanın hazır sayılması için boyutunun sabit kalma süresi (saniye)")
+    parser.add_argument('--poll', type=float, default=POLL_SECONDS, help="Dizin tarama aralığı (saniye)")
+    parser.add_argument('--once', action='store_true', help="Dizindeki dosyalar bitince çık (zamanlanmış görevler için)")
+    parser.add_argument('--rules', default=DEFAULT_RULES_PATH,
+                        help="Doğrulama kuralları (JSON/YAML; varsayılan CEVIRICI_RULES_PATH)")
+    parser.add_argument('--backend', choices=list(BACKENDS), default=DEFAULT_BACKEND,
+                        help="Temizleme motoru (varsayılan CEVIRICI_BACKEND veya pandas)")
+    return parser.parse_args(argv)
+
+
+def learn(path, mapping_path, mappings_dir):
+    """Örnek dosyanın parmak izine eşleştirmeyi kaydeder."""
+    df_raw, _, column_labels = read_source(open_source(path))
+    fingerprint = layout_fingerprint(df_raw, column_labels)
+    
+    if mapping_path:
+        with open(mapping_path, encoding='utf-8') as f:
+            mapping = normalize_mapping(json.load(f))
+    else:
+        mapping = suggest_mapping(df_raw, column_labels)
+    
+    is_valid, missing_fields = validate_mapping(mapping, REQUIRED_COLUMNS)
+    if not is_valid:
+        raise ValueError(f"Eşleştirilemeyen alanlar: {', '.join(sorted(missing_fields))} (--mapping ile belirtin)")
+    
+    saved_path = save_mapping(fingerprint, mapping, mappings_dir, example=os.path.basename(path),
+                              column_labels=column_labels)
+    return {'fingerprint': fingerprint, 'path': saved_path, 'mapping': mapping, 'header_labels': column_labels}
+
+
+def log(message):
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", flush=True)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    if args.learn:
+        try:
+            result = learn(args.learn, args.mapping, args.mappings)
+        except (ValueError, OSError) as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return 0
+    
+    if not args.input_dir or not args.output_dir:
+        print("❌ Giriş ve çıktı dizini gerekli (veya --learn DOSYA)", file=sys.stderr)
+        return 2
+    if not os.path.isdir(args.input_dir):
+        print(f"❌ Giriş dizini bulunamadı: {args.input_dir}", file=sys.stderr)
+        return 2
+    
+    # Varsayılan ortam değişkeninden geldiğinde argparse seçenekleri denetlemez
+    if args.backend not in BACKENDS:
+        print(f"❌ Bilinmeyen temizleme motoru: {args.backend} (seçenekler: {', '.join(BACKENDS)})", file=sys.stderr)
+        return 2
+    
+    # Kural dosyası başlangıçta bir kez okunup doğrulanır; worker'lara tanımlar gönderilir
+    rules = None
+    if args.rules:
+        try:
+            rules = load_rules(args.rules)
+            compile_rules(rules)
+        except (ValueError, OSError) as e:
+            print(f"❌ Kural dosyası: {e}", file=sys.stderr)
+            return 2
+    
+    watcher = FolderWatcher(
+        args.input_dir, args.output_dir, workers=args.workers, output_format=args.format,
+        mappings_dir=args.mappings, auto_mapping=args.auto_mapping, rules=rules, backend=args.backend,
+        settle_seconds=args.settle, poll_seconds=args.poll, log=log
+    )
+    
+    # Ctrl+C / SIGTERM: yeni dosya alınmaz, işlenenler tamamlanıp çıkılır
+    def request_stop(signum, frame):
+        log("⏹️ Durduruluyor; işlenen dosyalar tamamlanıyor...")
+        watcher.stop()
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+    
+    log(f"👀 İzleniyor: {args.input_dir} → {args.output_dir} ({watcher.workers} worker, {args.format})")
+    counts = watcher.run(once=args.once)
+    log(f"Bitti: {counts['done']} dönüştürüldü, {counts['unmatched']} eşleştirmesiz, {counts['failed']} hatalı")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())